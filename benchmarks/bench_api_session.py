@@ -0,0 +1,69 @@
+"""
+Compares the per-request latency of DataAPIManager's pooled keep-alive session with
+a new connection per request (`requests.get`), against a local HTTP/1.1 server that
+serves a gzip-compressed JSON payload.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_api_session [request_count]
+"""
+import gzip
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List
+import requests
+from libraries.data.api.auth_strategies import ManualTokenAuth
+from libraries.data.api.data_api_manager import DataAPIManager
+from libraries.data.api.data_api_response_processors.json_response_processor import JSONResponseProcessor
+
+_PAYLOAD = gzip.compress(json.dumps([{'id': index, 'value': index * 0.5} for index in range(200)]).encode())
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keeps connections open between requests
+    disable_nagle_algorithm = True  # Headers and body are separate writes, which would wait for a delayed ACK
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(_PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(_PAYLOAD)
+
+    def log_message(self, *args) -> None:
+        pass
+
+def _latencies(fetch: Callable[[], object], request_count: int) -> List[float]:
+    latencies = []
+    for _ in range(request_count):
+        start = time.perf_counter()
+        fetch()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def main(request_count: int = 2000) -> None:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_port}'
+    try:
+        with DataAPIManager(ManualTokenAuth('token'), JSONResponseProcessor()) as manager:
+            cases = [
+                ('requests.get', lambda: requests.get(f'{base_url}/items', headers={'Authorization': 'Bearer token'},
+                                                      timeout=(5, 30)).json()),
+                ('pooled session', lambda: manager.fetch_data(base_url, 'items')),
+            ]
+            for name, fetch in cases:
+                fetch()  # Warm up
+                latencies = sorted(_latencies(fetch, request_count))
+                print(f"{name:<16} mean {statistics.mean(latencies):7.3f} ms  "
+                      f"p50 {latencies[len(latencies) // 2]:7.3f} ms  "
+                      f"p99 {latencies[int(len(latencies) * 0.99)]:7.3f} ms")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
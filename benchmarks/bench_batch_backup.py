@@ -0,0 +1,44 @@
+"""
+Compares backing up many small files one by one with the concurrent batch backup,
+and with streaming them into a single compressed tar archive.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_batch_backup [file_count] [directory]
+"""
+import os
+import shutil
+import sys
+import time
+from tempfile import TemporaryDirectory
+from typing import Optional
+from libraries.data.file.backup_manager import BackupManager
+
+def main(file_count: int = 5000, directory: Optional[str] = None) -> None:
+    with TemporaryDirectory(dir=directory) as temp_dir:
+        file_paths = []
+        for index in range(file_count):
+            folder = os.path.join(temp_dir, f'run_{index % 50}')
+            os.makedirs(folder, exist_ok=True)
+            file_paths.append(os.path.join(folder, f'data_{index}.csv'))
+            with open(file_paths[-1], mode='w') as file:
+                file.write(''.join(f'{index},{row},{row * 0.5}\n' for row in range(500)))
+        print(f"{file_count} files in {temp_dir}")
+
+        backup_manager = BackupManager()
+        cases = [('sequential', lambda: [backup_manager.create_backup(path) for path in file_paths])]
+        for workers in (4, 16):
+            cases.append((f'batch, {workers} workers', lambda workers=workers: backup_manager.create_backups(
+                file_paths, max_workers=workers)))
+        tar_path = os.path.join(temp_dir, 'backup.tar.gz')
+        cases.append(('tar.gz, level 1', lambda: backup_manager.create_backups(
+            file_paths, tar_path=tar_path, compression_level=1)))
+        for name, run in cases:
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            print(f"{name:<20} {elapsed:8.3f} s  {file_count / elapsed:10.0f} files/s")
+            for index in range(50):
+                shutil.rmtree(os.path.join(temp_dir, f'run_{index}', 'archive'), ignore_errors=True)
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000, *sys.argv[2:3])
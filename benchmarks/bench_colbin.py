@@ -0,0 +1,39 @@
+"""
+Compares parsing a CSV file into columns with warm loads of its `.colbin` cache.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_colbin [rows]
+"""
+import csv
+import os
+import sys
+import time
+from tempfile import TemporaryDirectory
+from libraries.data.file.file import File
+
+def main(rows: int = 2_000_000) -> None:
+    with TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'table.csv')
+        with open(path, mode='w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['id', 'price', 'quantity', 'sku'])
+            writer.writerows([i, i * 0.25, i % 97, f'SKU-{i % 10000}'] for i in range(rows))
+        print(f"csv size    {os.path.getsize(path) / 2 ** 20:8.1f} MiB")
+
+        start = time.perf_counter()
+        File.read(path, columnar=True)
+        print(f"parse       {time.perf_counter() - start:8.3f} s")
+
+        start = time.perf_counter()
+        File.read(path, columnar=True, cache=True)
+        print(f"cold+write  {time.perf_counter() - start:8.3f} s")
+        print(f"colbin size {os.path.getsize(path + '.colbin') / 2 ** 20:8.1f} MiB")
+
+        for _ in range(3):
+            start = time.perf_counter()
+            table = File.read(path, columnar=True, cache=True)
+            print(f"warm load   {(time.perf_counter() - start) * 1000:8.3f} ms ({len(table)} rows)")
+            del table
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
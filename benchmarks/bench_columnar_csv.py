@@ -0,0 +1,43 @@
+"""
+Compares the memory and throughput of the row-list and columnar CSV read paths.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_columnar_csv [rows]
+"""
+import csv
+import os
+import sys
+import time
+import tracemalloc
+from tempfile import TemporaryDirectory
+from libraries.data.file.handlers.csv_handler import CSVFileHandler
+
+def measure(label: str, read) -> None:
+    """Runs a read function and prints its wall time and peak traced memory.
+
+    Time and memory are measured in separate runs, since tracing slows allocations down.
+    """
+    start = time.perf_counter()
+    read()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    result = read()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} {elapsed:8.2f} s {peak / 2 ** 20:10.1f} MiB peak  ({len(result)} rows)")
+
+def main(rows: int = 1_000_000) -> None:
+    with TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'numeric.csv')
+        with open(path, mode='w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['id', 'price', 'quantity', 'ratio'])
+            writer.writerows([i, i * 0.25, i % 97, i / 7] for i in range(rows))
+        print(f"file size  {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+
+        handler = CSVFileHandler(path)
+        measure('rows', handler.read)
+        measure('columnar', handler.read_columnar)
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,43 @@
+"""
+Compares the CPU cost and size reduction of each compression codec on a typical CSV.
+
+Each codec is timed for a streaming write and a streaming read at several levels;
+process time (CPU) is reported next to wall time, so I/O-bound and CPU-bound
+configurations can be told apart.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_compression [rows]
+"""
+import os
+import sys
+import time
+from tempfile import TemporaryDirectory
+from libraries.data.file.file import File
+
+LEVELS = {'': [None], 'gz': [1, 6, 9], 'bz2': [1, 9], 'xz': [0, 6]}
+
+def timed(function) -> tuple:
+    """Runs a function and returns its wall and CPU times in seconds."""
+    wall, cpu = time.perf_counter(), time.process_time()
+    function()
+    return time.perf_counter() - wall, time.process_time() - cpu
+
+def main(rows: int = 500_000) -> None:
+    records = [['id', 'customer', 'amount', 'status']]
+    records += [[str(i), f'customer-{i % 5000}', f'{i * 1.37:.2f}', 'OK' if i % 11 else 'FAILED'] for i in range(rows)]
+    with TemporaryDirectory() as temp_dir:
+        raw_size = None
+        print(f"{'codec':<6}{'level':>6}{'ratio':>8}{'write wall':>12}{'write cpu':>11}{'read wall':>11}{'read cpu':>10}")
+        for suffix, levels in LEVELS.items():
+            for level in levels:
+                path = os.path.join(temp_dir, f'export.csv{"." + suffix if suffix else ""}')
+                write_wall, write_cpu = timed(lambda: File.save_stream(iter(records), [path], compression_level=level))
+                read_wall, read_cpu = timed(lambda: sum(1 for _ in File.iter(path)))
+                size = os.path.getsize(path)
+                raw_size = raw_size or size
+                print(f"{suffix or 'none':<6}{'-' if level is None else level:>6}{raw_size / size:>7.1f}x"
+                      f"{write_wall:>11.2f}s{write_cpu:>10.2f}s{read_wall:>10.2f}s{read_cpu:>9.2f}s")
+                os.remove(path)
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
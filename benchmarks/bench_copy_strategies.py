@@ -0,0 +1,35 @@
+"""
+Compares the copy mechanisms of FileCopier on a large file, and reports which one
+actually ran: a strategy the filesystem does not support falls back to 'buffered'.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_copy_strategies [size_mib] [directory]
+"""
+import os
+import sys
+import time
+from tempfile import TemporaryDirectory
+from typing import Optional
+from libraries.data.file.file_copier import STRATEGIES, FileCopier
+
+def main(size_mib: int = 2048, directory: Optional[str] = None) -> None:
+    with TemporaryDirectory(dir=directory) as temp_dir:
+        source = os.path.join(temp_dir, 'source.bin')
+        block = os.urandom(1024 * 1024)
+        with open(source, mode='wb') as file:
+            for _ in range(size_mib):
+                file.write(block)
+        print(f"file size  {size_mib} MiB in {temp_dir}")
+
+        cases = [(strategy, FileCopier([strategy]), False) for strategy in STRATEGIES]
+        cases += [('buffered', FileCopier([]), False), ('hardlink', FileCopier(), True)]
+        for name, copier, hardlink in cases:
+            destination = os.path.join(temp_dir, f'{name}.bin')
+            start = time.perf_counter()
+            used = copier.copy(source, destination, hardlink=hardlink)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<16} {elapsed:8.3f} s  {size_mib / elapsed:10.0f} MiB/s  (used {used})")
+            os.remove(destination)
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2048, *sys.argv[2:3])
@@ -0,0 +1,51 @@
+"""
+Measures the time and peak memory of sorting and deduplicating a CSV file under
+memory budgets from 256 MiB to 4 GiB.
+
+Each budget runs in a fresh process, so that peak memory is measured per budget.
+Budgets larger than the file simply sort it in memory; use enough rows to exceed
+the smaller budgets (about 12 million rows per GiB).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_external_sort [rows] [workers]
+"""
+import csv
+import os
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from tempfile import TemporaryDirectory
+from libraries.data.file.external_sort import ExternalSorter
+
+BUDGETS_MIB = [256, 512, 1024, 2048, 4096]
+
+def _sort(input_path: str, output_path: str, memory_limit: int, workers: int) -> tuple:
+    start = time.perf_counter()
+    ExternalSorter(key=itemgetter(0), keep='last', memory_limit=memory_limit, workers=workers).sort_file(
+        input_path, output_path)
+    elapsed = time.perf_counter() - start
+    peak_kib = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                   resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return elapsed, peak_kib / 1024
+
+def main(rows: int = 5_000_000, workers: int = 1) -> None:
+    with TemporaryDirectory() as temp_dir:
+        input_path = os.path.join(temp_dir, 'extract.csv')
+        output_path = os.path.join(temp_dir, 'sorted.csv')
+        random.seed(0)
+        with open(input_path, mode='w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['key', 'name', 'amount'])
+            writer.writerows([f'{random.randrange(rows // 2):012d}', f'item {i}', i * 0.25] for i in range(rows))
+        print(f"file size  {os.path.getsize(input_path) / 2 ** 20:.1f} MiB, workers={workers}")
+
+        for budget in BUDGETS_MIB:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                elapsed, peak = executor.submit(_sort, input_path, output_path, budget * 2 ** 20, workers).result()
+            print(f"budget {budget:>5} MiB  {elapsed:8.2f} s  peak rss {peak:8.1f} MiB")
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
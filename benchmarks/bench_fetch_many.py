@@ -0,0 +1,52 @@
+"""
+Measures how the throughput of DataAPIManager.fetch_many scales with concurrency,
+against a local HTTP/1.1 server that answers each request after a fixed latency.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_fetch_many [request_count] [latency_ms]
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from libraries.data.api.auth_strategies import ManualTokenAuth
+from libraries.data.api.data_api_manager import DataAPIManager
+from libraries.data.api.data_api_response_processors.json_response_processor import JSONResponseProcessor
+
+def main(request_count: int = 1000, latency_ms: float = 20.0) -> None:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            time.sleep(latency_ms / 1000)
+            body = json.dumps({'path': self.path}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_port}'
+    requests = [(base_url, f'items/{index}') for index in range(request_count)]
+    print(f"{request_count} requests, {latency_ms} ms server latency")
+    try:
+        for concurrency in (1, 4, 16, 64):
+            with DataAPIManager(ManualTokenAuth('token'), JSONResponseProcessor(), pool_maxsize=concurrency) as manager:
+                start = time.perf_counter()
+                errors = sum(1 for result in manager.fetch_many(requests, concurrency=concurrency) if result.error)
+                elapsed = time.perf_counter() - start
+            print(f"concurrency {concurrency:>3}  {elapsed:7.2f} s  {request_count / elapsed:8.0f} requests/s  "
+                  f"{errors} errors")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000, *map(float, sys.argv[2:3]))
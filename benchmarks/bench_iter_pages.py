@@ -0,0 +1,76 @@
+"""
+Compares a hand-rolled pagination loop around fetch_data with DataAPIManager.iter_pages,
+which fetches the next pages while the caller processes the current one. A local
+HTTP/1.1 server serves offset-paginated pages after a fixed latency, and processing
+each page takes a fixed time.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_iter_pages [page_count] [latency_ms] [processing_ms]
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from libraries.data.api.auth_strategies import ManualTokenAuth
+from libraries.data.api.data_api_manager import DataAPIManager
+from libraries.data.api.data_api_response_processors.json_response_processor import JSONResponseProcessor
+from libraries.data.api.paginators import OffsetPaginator
+
+_PAGE_SIZE = 100
+
+def main(page_count: int = 100, latency_ms: float = 20.0, processing_ms: float = 20.0) -> None:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            time.sleep(latency_ms / 1000)
+            query = parse_qs(urlsplit(self.path).query)
+            offset = int(query['offset'][0])
+            count = max(min(int(query['limit'][0]), page_count * _PAGE_SIZE - offset), 0)
+            body = json.dumps({'data': [{'id': offset + index} for index in range(count)]}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    def process(page: dict) -> None:
+        time.sleep(processing_ms / 1000)
+
+    def hand_rolled() -> None:
+        offset = 0
+        while True:
+            page = manager.fetch_data(base_url, 'items', {'offset': offset, 'limit': _PAGE_SIZE})
+            process(page)
+            if len(page['data']) < _PAGE_SIZE:
+                return
+            offset += _PAGE_SIZE
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_port}'
+    print(f"{page_count} pages, {latency_ms} ms server latency, {processing_ms} ms processing per page")
+    try:
+        with DataAPIManager(ManualTokenAuth('token'), JSONResponseProcessor()) as manager:
+            cases = [('fetch_data loop', hand_rolled)]
+            for prefetch in (1, 4):
+                cases.append((f'iter_pages, prefetch {prefetch}', lambda prefetch=prefetch: [
+                    process(page) for page in manager.iter_pages(base_url, 'items', OffsetPaginator(_PAGE_SIZE),
+                                                                prefetch=prefetch)]))
+            for name, run in cases:
+                start = time.perf_counter()
+                run()
+                elapsed = time.perf_counter() - start
+                print(f"{name:<22} {elapsed:7.2f} s  {page_count / elapsed:7.1f} pages/s")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100, *map(float, sys.argv[2:4]))
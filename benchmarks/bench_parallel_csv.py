@@ -0,0 +1,38 @@
+"""
+Measures how parallel CSV parsing scales with the number of worker processes.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_parallel_csv [rows] [max_workers]
+"""
+import csv
+import os
+import sys
+import time
+from tempfile import TemporaryDirectory
+from libraries.data.file.handlers.csv_handler import CSVFileHandler
+
+def main(rows: int = 2_000_000, max_workers: int = os.cpu_count() or 1) -> None:
+    with TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'wide.csv')
+        with open(path, mode='w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['id', 'name', 'price', 'comment'])
+            writer.writerows([i, f'item {i}', i * 0.25, 'says "hi",\nthen leaves'] for i in range(rows))
+        print(f"file size  {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+
+        handler = CSVFileHandler(path)
+        start = time.perf_counter()
+        handler.read()
+        baseline = time.perf_counter() - start
+        print(f"sequential {baseline:8.2f} s")
+
+        workers = 1
+        while workers <= max_workers:
+            start = time.perf_counter()
+            handler.read_parallel(workers)
+            elapsed = time.perf_counter() - start
+            print(f"workers={workers:<3} {elapsed:8.2f} s  speedup {baseline / elapsed:5.2f}x")
+            workers *= 2
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,63 @@
+"""
+Polls a reference endpoint with and without a ResponseCache, against a local HTTP/1.1
+server that serves a large unchanged JSON payload with an ETag. Without max-age,
+every poll is a conditional request; the cache turns each one into a `304` that
+reuses the processed result.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_response_cache [poll_count] [max_age]
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from libraries.data.api.auth_strategies import ManualTokenAuth
+from libraries.data.api.data_api_manager import DataAPIManager
+from libraries.data.api.data_api_response_processors.json_response_processor import JSONResponseProcessor
+from libraries.data.api.response_cache import ResponseCache
+
+_PAYLOAD = json.dumps([{'id': index, 'name': f'item {index}', 'value': index * 0.5} for index in range(20000)]).encode()
+_ETAG = '"reference-v1"'
+
+def main(poll_count: int = 200, max_age: int = 0) -> None:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            not_modified = self.headers.get('If-None-Match') == _ETAG
+            self.send_response(304 if not_modified else 200)
+            self.send_header('ETag', _ETAG)
+            self.send_header('Cache-Control', f'max-age={max_age}')
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', '0' if not_modified else str(len(_PAYLOAD)))
+            self.end_headers()
+            if not not_modified:
+                self.wfile.write(_PAYLOAD)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_port}'
+    print(f"{poll_count} polls of a {len(_PAYLOAD) / 1e6:.1f} MB payload, max-age={max_age}")
+    try:
+        for name, cache in (('no cache', None), ('response cache', ResponseCache())):
+            with DataAPIManager(ManualTokenAuth('token'), JSONResponseProcessor(), cache=cache) as manager:
+                start = time.perf_counter()
+                for _ in range(poll_count):
+                    manager.fetch_data(base_url, 'reference')
+                elapsed = time.perf_counter() - start
+            print(f"{name:<15} {elapsed * 1000 / poll_count:8.3f} ms/poll")
+            if cache is not None:
+                metrics = cache.metrics
+                print(f"{'':<15} hit rate {cache.hit_rate:.1%}, {metrics['revalidated']} revalidated, "
+                      f"{metrics['bytes_saved'] / 1e6:.1f} MB saved")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200, *map(int, sys.argv[2:3]))
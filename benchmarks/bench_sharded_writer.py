@@ -0,0 +1,32 @@
+"""
+Measures the throughput of ShardedWriter as the number of shards grows past the
+pool of open files.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_sharded_writer [rows] [max_open_files]
+"""
+import sys
+import time
+from tempfile import TemporaryDirectory
+from libraries.data.file.sharded_writer import ShardedWriter
+from libraries.path_builder.path_builder import PathBuilder
+
+SHARD_COUNTS = [10, 100, 1000, 10000]
+
+def main(rows: int = 1_000_000, max_open_files: int = 256) -> None:
+    for shards in SHARD_COUNTS:
+        with TemporaryDirectory() as temp_dir:
+            records = ([str(i % shards), f'item {i}', str(i * 0.25)] for i in range(rows))
+
+            def shard_path(row):
+                return PathBuilder(temp_dir, f'customer={row[0]}').add('orders.csv')
+
+            start = time.perf_counter()
+            with ShardedWriter(shard_path, max_open_files=max_open_files) as writer:
+                writer.write_all(records)
+            elapsed = time.perf_counter() - start
+            print(f"shards={shards:<6} {rows / elapsed:12,.0f} rows/s  "
+                  f"opens {writer.metrics['opens']:>9,}  evictions {writer.metrics['evictions']:>9,}")
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
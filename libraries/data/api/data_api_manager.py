@@ -1,25 +1,89 @@
+import hashlib
+import queue
+import threading
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
 import requests
-from typing import Any, Dict, List
+from requests.adapters import HTTPAdapter
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 from .auth_strategies import AuthStrategy
-from .data_api_response_processors.api_response_processor import APIResponseProcessor
-from data.source.file.file import File
+from .data_api_response_processors.data_api_response_processor import APIResponseProcessor
+from .paginators import Paginator
+from .response_cache import ResponseCache
+from ..file.file import File
+
+class FetchRequest(NamedTuple):
+    """
+    A request to fetch data, with the arguments of `DataAPIManager.fetch_data`.
+
+    Attributes:
+        base_url (str): The base URL of the API.
+        endpoint (str): The API endpoint to fetch data from.
+        params (Optional[Dict[str, Any]]): Query parameters to include in the request.
+    """
+    base_url: str
+    endpoint: str
+    params: Optional[Dict[str, Any]] = None
+
+class FetchResult(NamedTuple):
+    """
+    The outcome of one request in a batch.
+
+    Attributes:
+        request (FetchRequest): The request.
+        data (Any): The processed data, or None if the request failed.
+        error (Optional[Exception]): The error raised by the request, or None if it succeeded.
+    """
+    request: FetchRequest
+    data: Any
+    error: Optional[Exception]
 
 class DataAPIManager:
     """
     Manages interactions with external APIs, handling authentication, data retrieval,
     and response processing.
+
+    Requests go through a pool of keep-alive connections shared by all threads, so
+    repeated requests to a host reuse open TCP (and TLS) connections instead of paying a
+    new handshake each time. Each thread uses its own `requests.Session` on top of the
+    shared pool, as sessions themselves are not safe to share between threads.
+
+    With a ResponseCache, `fetch_data` serves fresh responses from the cache and
+    revalidates stale ones with conditional requests, reusing the processed result
+    when the server answers `304 Not Modified`. Responses are cached per token, so
+    managers with different credentials sharing a cache never see each other's data.
+
+    Attributes:
+        timeout (Tuple[float, float]): The connect and read timeouts of each request, in seconds.
+        pool_maxsize (int): The number of connections kept open per host.
+        cache (Optional[ResponseCache]): The cache of `fetch_data` responses, if any.
     """
 
-    def __init__(self, auth_strategy: AuthStrategy, response_processor: APIResponseProcessor) -> None:
+    def __init__(self, auth_strategy: AuthStrategy, response_processor: APIResponseProcessor,
+                 pool_maxsize: int = 10, pool_connections: int = 10,
+                 timeout: Union[float, Tuple[float, float]] = (5.0, 30.0),
+                 cache: Optional[ResponseCache] = None) -> None:
         """
         Initializes the DataAPIManager with an authentication strategy and a response processor.
 
         Args:
             auth_strategy (AuthStrategy): The authentication strategy for API access.
             response_processor (APIResponseProcessor): The processor for handling API responses.
+            pool_maxsize (int): The number of connections kept open per host. Requests beyond
+                                it wait for a free connection.
+            pool_connections (int): The number of hosts whose connection pools are kept.
+            timeout (Union[float, Tuple[float, float]]): The connect and read timeouts in seconds,
+                                                         or a single timeout for both.
+            cache (Optional[ResponseCache]): Caches the responses of `fetch_data`. Defaults to no cache.
         """
         self.auth_strategy = auth_strategy
         self.response_processor = response_processor
+        self.timeout = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        self.pool_maxsize = pool_maxsize
+        self.cache = cache
+        self._adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=True)
+        self._local = threading.local()
 
     def fetch_data(self, base_url: str, endpoint: str, params: Dict[str, Any] = None) -> Any:
         """
@@ -34,18 +98,174 @@ class DataAPIManager:
             Any: The processed data returned by the API.
 
         Raises:
-            requests.RequestException: If the request to the API fails.
+            requests.RequestException: If the request to the API fails or times out.
         """
-        if not self.auth_strategy.is_authenticated():
-            self.auth_strategy.authenticate()
-
-        headers = {'Authorization': f'Bearer {self.auth_strategy.authenticate()}'}
         full_url = f'{base_url}/{endpoint}'
-        response = requests.get(full_url, headers=headers, params=params)
-        response.raise_for_status()
-
+        if self.cache is not None:
+            token = self._token()
+            identity = hashlib.sha256(str(token).encode()).hexdigest()[:32]
+            key = f"{identity} {requests.Request('GET', full_url, params=params).prepare().url}"
+            return self.cache.get(key, lambda headers: self._get(full_url, params, headers, token),
+                                  lambda response: self.response_processor.process_response(response.json()))
+        response = self._get(full_url, params)
         return self.response_processor.process_response(response.json())
 
+    def iter_pages(self, base_url: str, endpoint: str, paginator: Paginator, params: Dict[str, Any] = None,
+                   prefetch: int = 1) -> Iterator[Any]:
+        """
+        Fetches the pages of a paginated endpoint, prefetching the next pages in the background.
+
+        A background thread fetches and processes the following pages while the caller
+        handles the current one, up to `prefetch` pages ahead, so memory stays bounded
+        however many pages there are. Closing the generator early stops the prefetching.
+
+        Args:
+            base_url (str): The base URL of the API.
+            endpoint (str): The API endpoint of the first page.
+            paginator (Paginator): How to find the next page: CursorPaginator, OffsetPaginator,
+                                   LinkHeaderPaginator or a custom Paginator.
+            params (Dict[str, Any], optional): Query parameters to include in the requests.
+            prefetch (int): The number of pages fetched ahead of the caller.
+
+        Yields:
+            Any: The processed data of each page, in order.
+
+        Raises:
+            ValueError: If prefetch is less than 1.
+            requests.RequestException: If the request of a page fails or times out.
+        """
+        return self._iter_pages(base_url, endpoint, paginator, params, prefetch, lambda page: page)
+
+    def iter_records(self, base_url: str, endpoint: str, paginator: Paginator, params: Dict[str, Any] = None,
+                     prefetch: int = 1) -> Iterator[Any]:
+        """
+        Fetches the records of a paginated endpoint, page by page, prefetching the next pages.
+
+        See `iter_pages`. The paginator finds the records in each raw page, before any
+        processing, and the response processor then processes the records of the page
+        as a list, so it must return an iterable of records.
+
+        Yields:
+            Any: Each processed record, in order.
+        """
+        for records in self._iter_pages(base_url, endpoint, paginator, params, prefetch, paginator.records):
+            yield from records
+
+    def _iter_pages(self, base_url: str, endpoint: str, paginator: Paginator, params: Optional[Dict[str, Any]],
+                    prefetch: int, extract: Callable[[Any], Any]) -> Iterator[Any]:
+        """Yields the processed `extract(page)` of each raw page, fetching and processing them in the background."""
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        pages: queue.Queue = queue.Queue(maxsize=prefetch)
+        stopped = threading.Event()
+        end = object()
+
+        def put(item: Any) -> None:
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def fetch_pages() -> None:
+            request = (f'{base_url}/{endpoint}', paginator.first_params(params))
+            try:
+                while request is not None and not stopped.is_set():
+                    url, page_params = request
+                    response = self._get(url, page_params)
+                    page = response.json()
+                    request = paginator.next_page(url, page_params, response, page)
+                    put((self.response_processor.process_response(extract(page)), None))
+                put(end)
+            except Exception as e:
+                put((None, e))
+
+        threading.Thread(target=fetch_pages, daemon=True).start()
+        try:
+            while True:
+                item = pages.get()
+                if item is end:
+                    return
+                page, error = item
+                if error is not None:
+                    raise error
+                yield page
+        finally:
+            stopped.set()
+
+    def fetch_many(self, requests: Iterable[Union[FetchRequest, Tuple]], concurrency: int = 8,
+                   per_host_limit: Optional[int] = None, ordered: bool = False) -> Iterator[FetchResult]:
+        """
+        Fetches many endpoints concurrently from a thread pool.
+
+        At most `concurrency` requests are in flight overall, and at most `per_host_limit`
+        to any one host; requests to a busy host wait their turn without holding up
+        requests to other hosts. A failed request does not stop the batch: its error is
+        reported in the result of that request.
+
+        Args:
+            requests (Iterable[Union[FetchRequest, Tuple]]): The requests, as FetchRequest or
+                                                             (base_url, endpoint[, params]) tuples.
+            concurrency (int): The number of requests in flight overall.
+            per_host_limit (Optional[int]): The number of requests in flight per host. Defaults to
+                                            `pool_maxsize`, the connections kept open per host.
+            ordered (bool): If True, results follow the order of `requests`; otherwise they are
+                            yielded as the requests complete.
+
+        Yields:
+            FetchResult: The request, processed data and error of each request.
+        """
+        per_host_limit = per_host_limit or self.pool_maxsize
+        waiting: Dict[str, Deque[Tuple[int, FetchRequest]]] = {}
+        for index, request in enumerate(requests):
+            request = FetchRequest(*request)
+            waiting.setdefault(urlsplit(request.base_url).netloc, deque()).append((index, request))
+        in_flight: Counter = Counter()
+        futures: Dict[Future, Tuple[int, FetchRequest, str]] = {}
+        completed: Dict[int, FetchResult] = {}
+        next_index = 0
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+
+        def submit_fetches() -> None:
+            # Round-robin over the hosts with spare capacity, so that no host starves the others
+            submitted = True
+            while submitted and len(futures) < concurrency:
+                submitted = False
+                for host in list(waiting):
+                    if len(futures) >= concurrency:
+                        return
+                    if in_flight[host] >= per_host_limit:
+                        continue
+                    index, request = waiting[host].popleft()
+                    if not waiting[host]:
+                        del waiting[host]
+                    in_flight[host] += 1
+                    futures[executor.submit(self.fetch_data, *request)] = (index, request, host)
+                    submitted = True
+
+        try:
+            submit_fetches()
+            while futures or completed:
+                if ordered and next_index in completed:
+                    next_index += 1
+                    yield completed.pop(next_index - 1)
+                    continue
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, request, host = futures.pop(future)
+                    in_flight[host] -= 1
+                    error = future.exception()
+                    result = FetchResult(request, None if error else future.result(), error)
+                    if ordered:
+                        completed[index] = result
+                    else:
+                        yield result
+                submit_fetches()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def store_data(self, data: Any, file_paths: List[str]) -> None:
         """
         Stores the given data in the specified file paths.
@@ -56,3 +276,40 @@ class DataAPIManager:
         """
         for path in file_paths:
             File.save(data, path)
+
+    def _get(self, url: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]] = None,
+             token: Optional[str] = None) -> requests.Response:
+        """Sends an authenticated GET request, with optional extra headers, and returns the successful response."""
+        headers = {**(headers or {}), 'Authorization': f'Bearer {token or self._token()}'}
+        response = self.session.get(url, headers=headers, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    def _token(self) -> str:
+        """Returns the token of the authentication strategy, authenticating first if needed."""
+        if not self.auth_strategy.is_authenticated():
+            self.auth_strategy.authenticate()
+        return self.auth_strategy.authenticate()
+
+    @property
+    def session(self) -> requests.Session:
+        """The session of the calling thread, created on first use on the shared connection pool."""
+        session: Optional[requests.Session] = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers['Accept-Encoding'] = 'gzip, deflate'  # Decoded transparently by requests
+            session.headers['Connection'] = 'keep-alive'
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            self._local.session = session
+        return session
+
+    def close(self) -> None:
+        """Closes the pooled connections. Later requests open new ones."""
+        self._adapter.close()
+
+    def __enter__(self) -> 'DataAPIManager':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,4 @@
+from .paginator import Paginator
+from .cursor_paginator import CursorPaginator
+from .offset_paginator import OffsetPaginator
+from .link_header_paginator import LinkHeaderPaginator
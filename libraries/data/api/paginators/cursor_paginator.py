@@ -0,0 +1,34 @@
+from typing import Any, Dict, Optional, Tuple
+import requests
+from .paginator import Paginator
+
+class CursorPaginator(Paginator):
+    """
+    Follows a cursor returned in each page and sent back as a query parameter.
+
+    Attributes:
+        cursor_field (str): The field of a page holding the cursor of the next page.
+        cursor_param (str): The query parameter the cursor is sent in.
+    """
+
+    def __init__(self, cursor_field: str = 'next_cursor', cursor_param: str = 'cursor',
+                 records_field: Optional[str] = 'data') -> None:
+        """
+        Initializes the paginator.
+
+        Args:
+            cursor_field (str): The field of a page holding the cursor of the next page; an
+                                empty or missing cursor marks the last page.
+            cursor_param (str): The query parameter the cursor is sent in.
+            records_field (Optional[str]): The field of a page holding its records.
+        """
+        super().__init__(records_field)
+        self.cursor_field = cursor_field
+        self.cursor_param = cursor_param
+
+    def next_page(self, url: str, params: Optional[Dict[str, Any]], response: requests.Response,
+                  page: Any) -> Optional[Tuple[str, Optional[Dict[str, Any]]]]:
+        cursor = page.get(self.cursor_field)
+        if not cursor:
+            return None
+        return url, {**(params or {}), self.cursor_param: cursor}
@@ -0,0 +1,16 @@
+from typing import Any, Dict, Optional, Tuple
+import requests
+from .paginator import Paginator
+
+class LinkHeaderPaginator(Paginator):
+    """
+    Follows the `rel="next"` URL of the `Link` response header (RFC 8288), as used by
+    e.g. the GitHub API.
+    """
+
+    def next_page(self, url: str, params: Optional[Dict[str, Any]], response: requests.Response,
+                  page: Any) -> Optional[Tuple[str, Optional[Dict[str, Any]]]]:
+        next_url = response.links.get('next', {}).get('url')
+        if not next_url:
+            return None
+        return next_url, None  # The next URL carries its own query string
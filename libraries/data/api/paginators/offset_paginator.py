@@ -0,0 +1,39 @@
+from typing import Any, Dict, Optional, Tuple
+import requests
+from .paginator import Paginator
+
+class OffsetPaginator(Paginator):
+    """
+    Requests pages of a fixed size at increasing offsets, until a page comes back short.
+
+    Attributes:
+        page_size (int): The number of records requested per page.
+        offset_param (str): The query parameter of the offset.
+        limit_param (str): The query parameter of the page size.
+    """
+
+    def __init__(self, page_size: int = 100, offset_param: str = 'offset', limit_param: str = 'limit',
+                 records_field: Optional[str] = 'data') -> None:
+        """
+        Initializes the paginator.
+
+        Args:
+            page_size (int): The number of records requested per page.
+            offset_param (str): The query parameter of the offset.
+            limit_param (str): The query parameter of the page size.
+            records_field (Optional[str]): The field of a page holding its records.
+        """
+        super().__init__(records_field)
+        self.page_size = page_size
+        self.offset_param = offset_param
+        self.limit_param = limit_param
+
+    def first_params(self, params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        return {self.offset_param: 0, self.limit_param: self.page_size, **(params or {})}
+
+    def next_page(self, url: str, params: Optional[Dict[str, Any]], response: requests.Response,
+                  page: Any) -> Optional[Tuple[str, Optional[Dict[str, Any]]]]:
+        count = len(self.records(page))
+        if count < params[self.limit_param]:
+            return None
+        return url, {**params, self.offset_param: params[self.offset_param] + count}
@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+import requests
+
+class Paginator(ABC):
+    """
+    Abstract base class for pagination strategies.
+
+    A paginator tells how to request the page that follows a given one, and where the
+    records are in a page.
+
+    Attributes:
+        records_field (Optional[str]): The field of a page holding its records, or None if
+                                       the page is the list of records itself.
+    """
+
+    def __init__(self, records_field: Optional[str] = None) -> None:
+        """
+        Initializes the paginator.
+
+        Args:
+            records_field (Optional[str]): The field of a page holding its records, or None if
+                                           the page is the list of records itself.
+        """
+        self.records_field = records_field
+
+    def first_params(self, params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Returns the query parameters of the first page.
+
+        Args:
+            params (Optional[Dict[str, Any]]): The query parameters given by the caller.
+
+        Returns:
+            Optional[Dict[str, Any]]: The query parameters of the first page.
+        """
+        return params
+
+    @abstractmethod
+    def next_page(self, url: str, params: Optional[Dict[str, Any]], response: requests.Response,
+                  page: Any) -> Optional[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Returns the request of the page after the given one.
+
+        Args:
+            url (str): The URL of the current page.
+            params (Optional[Dict[str, Any]]): The query parameters of the current page.
+            response (requests.Response): The response of the current page.
+            page (Any): The decoded JSON body of the current page.
+
+        Returns:
+            Optional[Tuple[str, Optional[Dict[str, Any]]]]: The URL and query parameters of the
+            next page, or None if the current page is the last.
+        """
+        pass
+
+    def records(self, page: Any) -> List[Any]:
+        """
+        Returns the records of a page.
+
+        Args:
+            page (Any): The page.
+
+        Returns:
+            List[Any]: The records of the page.
+        """
+        if self.records_field is None:
+            return page
+        return page.get(self.records_field) or []
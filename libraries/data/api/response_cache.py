@@ -0,0 +1,239 @@
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, NamedTuple, Optional
+import requests
+
+class CachedResponse(NamedTuple):
+    """
+    A processed response kept in a ResponseCache.
+
+    Attributes:
+        value (Any): The processed data of the response.
+        etag (Optional[str]): The `ETag` header of the response.
+        last_modified (Optional[str]): The `Last-Modified` header of the response.
+        expires (float): When the response stops being fresh, in seconds since the epoch.
+        size (int): The size in bytes of the decoded response body.
+    """
+    value: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires: float
+    size: int
+
+class ResponseCache:
+    """
+    An HTTP response cache holding processed results, in an in-memory LRU tier and an
+    optional on-disk tier.
+
+    A response is served without any request while its `Cache-Control: max-age` lasts.
+    Once stale, it is revalidated with a conditional request (`If-None-Match` and
+    `If-Modified-Since`); on a `304 Not Modified` answer the cached processed value is
+    reused, so neither the body is downloaded nor the response processed again.
+    Responses marked `no-store` are never cached, and `no-cache` ones are revalidated
+    on every use. Responses marked `private` are kept in memory only, never on disk, as
+    the disk tier may be shared; keys of authenticated requests should identify the
+    caller so that one caller's responses are not served to another. Cached values are
+    shared between callers and must be treated as read-only.
+
+    The disk tier stores entries as JSON, never as pickles, so a shared directory cannot
+    make the cache run code. Processed values that are not JSON are cached in memory
+    only, and entries that fail to load are treated as misses.
+
+    Attributes:
+        max_bytes (int): The byte budget of the memory tier, counted as the size of the
+                         response bodies; least recently used entries are evicted beyond it.
+        directory (Optional[str]): The directory of the disk tier, which keeps every stored
+                                   response that is not private and whose processed value
+                                   is JSON, or None for a memory-only cache.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, directory: Optional[str] = None) -> None:
+        """
+        Initializes the cache; the directory of the disk tier is created if needed.
+
+        Args:
+            max_bytes (int): The byte budget of the memory tier.
+            directory (Optional[str]): The directory of the disk tier. Defaults to no disk tier.
+        """
+        self.max_bytes = max_bytes
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._entries: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self._lock = Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._revalidated = 0
+        self._misses = 0
+        self._evictions = 0
+        self._bytes_saved = 0
+
+    def get(self, key: str, fetch: Callable[[Dict[str, str]], requests.Response],
+            process: Callable[[requests.Response], Any]) -> Any:
+        """
+        Returns the processed response for a request, from the cache when possible.
+
+        Args:
+            key (str): Identifies the request, typically its full URL with the query string,
+                       along with the identity of the caller for authenticated requests.
+            fetch (Callable[[Dict[str, str]], requests.Response]): Sends the request with the
+                given extra headers, and returns a successful or `304` response.
+            process (Callable[[requests.Response], Any]): Processes a full response.
+
+        Returns:
+            Any: The processed response.
+        """
+        entry = self._lookup(key)
+        if entry is not None and entry.expires > time.time():
+            with self._lock:
+                self._hits += 1
+                self._bytes_saved += entry.size
+            return entry.value
+
+        headers = {}
+        if entry is not None and entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        response = fetch(headers)
+        directives = self._cache_control(response)
+
+        if entry is not None and response.status_code == 304:
+            with self._lock:
+                self._revalidated += 1
+                self._bytes_saved += entry.size
+            if 'no-store' not in directives:
+                self._store(key, entry._replace(expires=self._expires(response, directives),
+                                                etag=response.headers.get('ETag', entry.etag),
+                                                last_modified=response.headers.get('Last-Modified',
+                                                                                   entry.last_modified)),
+                            write='private' not in directives)
+            return entry.value
+
+        with self._lock:
+            self._misses += 1
+        value = process(response)
+        entry = CachedResponse(value, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                               self._expires(response, directives), len(response.content))
+        if 'no-store' not in directives and (entry.expires > time.time() or entry.etag or entry.last_modified):
+            self._store(key, entry, write='private' not in directives)
+        return value
+
+    def clear(self) -> None:
+        """Drops every entry, from both tiers; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    os.remove(os.path.join(self.directory, name))
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """
+        Reports the cache usage.
+
+        Returns:
+            Dict[str, int]: The counts of fresh hits, of stale entries revalidated with a `304`,
+                            of misses and of evictions from memory; the bytes of response bodies
+                            not downloaded thanks to the cache; the number of entries in memory
+                            and the bytes they hold.
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'revalidated': self._revalidated,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'bytes_saved': self._bytes_saved,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+            }
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of lookups answered from the cache, fresh or after a `304`."""
+        with self._lock:
+            served = self._hits + self._revalidated
+            total = served + self._misses
+        return served / total if total else 0.0
+
+    def _lookup(self, key: str) -> Optional[CachedResponse]:
+        """Finds an entry in memory, then on disk, moving a disk entry to memory."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.directory is None:
+            return None
+        try:
+            with open(self._disk_path(key), mode='r', encoding='utf-8') as file:
+                fields = json.load(file)
+            entry = CachedResponse(fields['value'], fields['etag'], fields['last_modified'],
+                                   float(fields['expires']), int(fields['size']))
+        except (OSError, ValueError, TypeError, KeyError):
+            return None  # Missing, unreadable or written in another layout: a miss
+        self._store(key, entry, write=False)
+        return entry
+
+    def _store(self, key: str, entry: CachedResponse, write: bool = True) -> None:
+        """Keeps an entry in memory, evicting the least recently used ones, and on disk if `write`."""
+        with self._lock:
+            stale = self._entries.pop(key, None)
+            if stale is not None:
+                self._bytes -= stale.size
+            if entry.size <= self.max_bytes:
+                self._entries[key] = entry
+                self._bytes += entry.size
+                while self._bytes > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._bytes -= evicted.size
+                    self._evictions += 1
+        if write and self.directory is not None:
+            try:
+                data = json.dumps(entry._asdict())
+            except (TypeError, ValueError):
+                return  # Values that are not JSON are only cached in memory
+            path = self._disk_path(key)
+            temp_path = f"{path}.{os.getpid()}-{id(entry)}.tmp"
+            try:
+                with open(temp_path, mode='w', encoding='utf-8') as file:
+                    file.write(data)
+                os.replace(temp_path, path)
+            except OSError:
+                pass  # A full or read-only disk only loses the disk copy
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+    def _disk_path(self, key: str) -> str:
+        """Returns the path of the disk entry of a key."""
+        return os.path.join(self.directory, f"{hashlib.sha256(key.encode()).hexdigest()}.json")
+
+    @staticmethod
+    def _cache_control(response: requests.Response) -> Dict[str, Optional[str]]:
+        """Parses the `Cache-Control` header of a response into its directives."""
+        directives = {}
+        for directive in response.headers.get('Cache-Control', '').split(','):
+            name, _, value = directive.strip().partition('=')
+            if name:
+                directives[name.lower()] = value.strip('"') or None
+        return directives
+
+    @staticmethod
+    def _expires(response: requests.Response, directives: Dict[str, Optional[str]]) -> float:
+        """Returns when a response stops being fresh: now plus its max-age, less its `Age`."""
+        if 'no-cache' in directives:
+            return 0.0
+        try:
+            max_age = int(directives.get('max-age') or 0)
+            age = int(response.headers.get('Age', 0))
+        except ValueError:
+            return 0.0
+        return time.time() + max_age - age
@@ -0,0 +1,186 @@
+import time
+from collections import deque
+from concurrent.futures import Future
+from threading import Condition, Thread
+from typing import Any, Callable, Deque, Dict, List, Set, Tuple
+
+class AsyncWriter:
+    """
+    A write-behind queue that saves data to files from a bounded pool of background threads.
+
+    Writes to the same path are applied in submission order and never overlap. A write
+    that is still queued when a newer write to the same path arrives is coalesced with
+    it: only the latest payload is written, and both callers share the same future.
+
+    Attributes:
+        max_workers (int): The maximum number of writer threads.
+        max_pending (int): The maximum number of queued paths before `submit` blocks.
+    """
+
+    def __init__(self, save_function: Callable[[Any, str], None], max_workers: int = 4,
+                 max_pending: int = 1024) -> None:
+        """
+        Initializes the writer; threads are started on the first submitted write.
+
+        Args:
+            save_function (Callable[[Any, str], None]): Saves a payload to a single path.
+            max_workers (int): The maximum number of writer threads.
+            max_pending (int): The maximum number of queued paths before `submit` blocks.
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._save_function = save_function
+        self._condition = Condition()
+        self._pending: Dict[str, Tuple[Any, Future]] = {}
+        self._ready: Deque[str] = deque()
+        self._in_flight: Set[str] = set()
+        self._threads: List[Thread] = []
+        self._closed = False
+        self._writes = 0
+        self._failures = 0
+        self._coalesced = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    def submit(self, data: Any, path: str) -> Future:
+        """
+        Queues a payload to be saved to a path, blocking while the queue is full.
+
+        Args:
+            data (Any): The data to be saved.
+            path (str): The file path to save the data to.
+
+        Returns:
+            Future: Resolves once the data (or a newer payload for the same path) is on disk.
+
+        Raises:
+            RuntimeError: If the writer has been shut down.
+        """
+        with self._condition:
+            while path not in self._pending and len(self._pending) >= self.max_pending and not self._closed:
+                self._condition.wait()
+            if self._closed:
+                raise RuntimeError("Cannot submit writes after the writer has been shut down")
+
+            if path in self._pending and not self._pending[path][1].cancelled():
+                _, future = self._pending[path]
+                self._pending[path] = (data, future)
+                self._coalesced += 1
+                return future
+
+            future = Future()
+            queued = path in self._pending  # Only a cancelled write is replaced rather than coalesced
+            self._pending[path] = (data, future)
+            if not queued and path not in self._in_flight:
+                self._ready.append(path)
+                self._condition.notify()
+            if len(self._threads) < self.max_workers:
+                thread = Thread(target=self._work, name=f"AsyncWriter-{len(self._threads)}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            return future
+
+    def flush(self) -> None:
+        """Blocks until every queued and in-flight write has completed."""
+        with self._condition:
+            while self._pending or self._in_flight:
+                self._condition.wait()
+
+    def shutdown(self) -> None:
+        """Drains the queue, then stops the writer threads. Further submits raise RuntimeError."""
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Reports the state of the queue and the latency of completed writes.
+
+        Returns:
+            Dict[str, Any]: The queue depth, in-flight, completed, failed and coalesced
+                            write counts, and the average and maximum write latency in seconds.
+        """
+        with self._condition:
+            completed = self._writes + self._failures
+            return {
+                'queue_depth': len(self._pending),
+                'in_flight': len(self._in_flight),
+                'writes': self._writes,
+                'failures': self._failures,
+                'coalesced': self._coalesced,
+                'average_latency': self._total_latency / completed if completed else 0.0,
+                'max_latency': self._max_latency,
+            }
+
+    def _work(self) -> None:
+        """Runs in each writer thread: saves ready paths until the writer is shut down."""
+        while True:
+            with self._condition:
+                while not self._ready and not self._closed:
+                    self._condition.wait()
+                if not self._ready:
+                    return
+                path = self._ready.popleft()
+                data, future = self._pending.pop(path)
+                self._in_flight.add(path)
+                self._condition.notify_all()  # Wake submitters waiting for queue space
+
+            start = time.perf_counter()
+            failed = False
+            if future.set_running_or_notify_cancel():
+                try:
+                    self._save_function(data, path)
+                    future.set_result(None)
+                except Exception as e:
+                    failed = True
+                    future.set_exception(e)
+            latency = time.perf_counter() - start
+
+            with self._condition:
+                self._in_flight.discard(path)
+                if failed:
+                    self._failures += 1
+                else:
+                    self._writes += 1
+                self._total_latency += latency
+                self._max_latency = max(self._max_latency, latency)
+                if path in self._pending:  # A newer write to this path waited for this one
+                    self._ready.append(path)
+                self._condition.notify_all()
+
+    @staticmethod
+    def gather(futures: List[Future]) -> Future:
+        """
+        Combines futures into one that resolves when all of them have.
+
+        Args:
+            futures (List[Future]): The futures to combine.
+
+        Returns:
+            Future: Resolves to None, or to the first exception raised by the futures.
+        """
+        combined = Future()
+        combined.set_running_or_notify_cancel()
+        remaining = [len(futures)]
+        condition = Condition()
+
+        def on_done(_: Future) -> None:
+            with condition:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            errors = [f.exception() for f in futures if not f.cancelled() and f.exception() is not None]
+            if errors:
+                combined.set_exception(errors[0])
+            else:
+                combined.set_result(None)
+
+        if not futures:
+            combined.set_result(None)
+        for future in futures:
+            future.add_done_callback(on_done)
+        return combined
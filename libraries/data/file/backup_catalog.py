@@ -0,0 +1,143 @@
+import sqlite3
+from contextlib import closing
+from typing import Iterable, List, NamedTuple, Optional
+
+class CatalogEntry(NamedTuple):
+    """
+    A backup recorded in a catalog.
+
+    Attributes:
+        source (str): The absolute path of the backed up file.
+        created_ns (int): When the backup was made, in nanoseconds since the epoch.
+        backup_path (str): The absolute path of the backup.
+        strategy (str): How the backup was made, as reported by BackupManager.
+        digest (Optional[str]): The SHA-256 digest of the stored content, for deduplicated backups.
+    """
+    source: str
+    created_ns: int
+    backup_path: str
+    strategy: str
+    digest: Optional[str] = None
+
+class BackupCatalog:
+    """
+    A persistent SQLite index of the backups kept in an archive folder.
+
+    Backups are indexed by source file and creation time, so finding the latest
+    backup of a file before a given time is a single index lookup, whatever the
+    number of backups in the folder. The stored blocks each block-level backup is
+    made of are recorded as well, so that unused blocks can be found when pruning.
+
+    Attributes:
+        path (str): The path of the SQLite database file.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS backups ("
+        "source TEXT NOT NULL, created_ns INTEGER NOT NULL, backup_path TEXT NOT NULL UNIQUE, "
+        "strategy TEXT NOT NULL, digest TEXT)",
+        "CREATE INDEX IF NOT EXISTS backups_by_source ON backups (source, created_ns)",
+        "CREATE INDEX IF NOT EXISTS backups_by_digest ON backups (digest)",
+        "CREATE TABLE IF NOT EXISTS blocks (backup_path TEXT NOT NULL, digest TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS blocks_by_backup ON blocks (backup_path)",
+        "CREATE INDEX IF NOT EXISTS blocks_by_digest ON blocks (digest)",
+    )
+    _COLUMNS = "source, created_ns, backup_path, strategy, digest"
+
+    def __init__(self, path: str) -> None:
+        """
+        Opens the catalog, creating the database file if needed.
+
+        Args:
+            path (str): The path of the SQLite database file.
+        """
+        self.path = path
+        with closing(self._connect()) as connection, connection:
+            for statement in self._SCHEMA:
+                connection.execute(statement)
+
+    def add(self, entries: Iterable[CatalogEntry]) -> None:
+        """
+        Records backups, replacing any previous entry for the same backup path.
+
+        Args:
+            entries (Iterable[CatalogEntry]): The backups to record.
+        """
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(f"INSERT OR REPLACE INTO backups ({self._COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                                   entries)
+
+    def add_blocks(self, backup_path: str, digests: Iterable[str]) -> None:
+        """
+        Records the stored blocks a block-level backup is made of.
+
+        Args:
+            backup_path (str): The path of the backup.
+            digests (Iterable[str]): The digests of its blocks.
+        """
+        with closing(self._connect()) as connection, connection:
+            connection.executemany("INSERT INTO blocks (backup_path, digest) VALUES (?, ?)",
+                                   ((backup_path, digest) for digest in set(digests)))
+
+    def blocks(self, backup_path: str) -> List[str]:
+        """Returns the distinct digests of the blocks of a block-level backup."""
+        with closing(self._connect()) as connection:
+            rows = connection.execute("SELECT digest FROM blocks WHERE backup_path = ?", (backup_path,)).fetchall()
+        return [digest for digest, in rows]
+
+    def find(self, source: str, at_ns: Optional[int] = None) -> Optional[CatalogEntry]:
+        """
+        Finds the latest backup of a file made at or before a point in time.
+
+        Args:
+            source (str): The absolute path of the backed up file.
+            at_ns (Optional[int]): The point in time, in nanoseconds since the epoch. Defaults to now.
+
+        Returns:
+            Optional[CatalogEntry]: The backup, or None if there is none that old.
+        """
+        query = f"SELECT {self._COLUMNS} FROM backups WHERE source = ?"
+        parameters = [source]
+        if at_ns is not None:
+            query += " AND created_ns <= ?"
+            parameters.append(at_ns)
+        with closing(self._connect()) as connection:
+            row = connection.execute(query + " ORDER BY created_ns DESC LIMIT 1", parameters).fetchone()
+        return CatalogEntry(*row) if row else None
+
+    def entries(self, source: str) -> List[CatalogEntry]:
+        """
+        Lists the backups of a file, newest first.
+
+        Args:
+            source (str): The absolute path of the backed up file.
+
+        Returns:
+            List[CatalogEntry]: The backups of the file.
+        """
+        with closing(self._connect()) as connection:
+            rows = connection.execute(f"SELECT {self._COLUMNS} FROM backups WHERE source = ? "
+                                      "ORDER BY created_ns DESC", (source,)).fetchall()
+        return [CatalogEntry(*row) for row in rows]
+
+    def remove(self, backup_paths: Iterable[str]) -> None:
+        """
+        Forgets backups, in a single transaction.
+
+        Args:
+            backup_paths (Iterable[str]): The paths of the backups to forget.
+        """
+        backup_paths = [(path,) for path in backup_paths]
+        with closing(self._connect()) as connection, connection:
+            connection.executemany("DELETE FROM backups WHERE backup_path = ?", backup_paths)
+            connection.executemany("DELETE FROM blocks WHERE backup_path = ?", backup_paths)
+
+    def is_referenced(self, digest: str) -> bool:
+        """Checks whether any recorded backup uses the stored content with the given digest."""
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT 1 FROM backups WHERE digest = ? UNION ALL "
+                                      "SELECT 1 FROM blocks WHERE digest = ? LIMIT 1", (digest, digest)).fetchone() is not None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens a connection; each operation uses its own, so the catalog can be shared between threads."""
+        return sqlite3.connect(self.path, timeout=30)
@@ -1,6 +1,80 @@
+import io
+import json
+import os
+import re
 import shutil
+import stat
+import tarfile
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from .backup_catalog import BackupCatalog, CatalogEntry
+from .blob_store import BlobStore
+from .chunking import Chunker
+from .compression import CODECS
+from .file_copier import FileCopier
+
+_TAR_READ_AHEAD_SIZE = 1024 * 1024  # Files up to this size are read by the worker threads in tar mode
+
+class _PaddedReader:
+    """
+    Reads exactly `size` bytes from a file for a tar member, padding with zero bytes if
+    the file ends early or fails to read, as the member header is already written.
+
+    Attributes:
+        error (Optional[Exception]): Why the data was padded, or None if the file was read whole.
+    """
+
+    def __init__(self, file, size: int) -> None:
+        self._file = file
+        self._remaining = size
+        self.error: Optional[Exception] = None
+
+    def read(self, size: int) -> bytes:
+        size = min(size, self._remaining)
+        data = b''
+        if self.error is None:
+            try:
+                data = self._file.read(size)
+            except OSError as e:
+                self.error = e
+            if len(data) < size and self.error is None:
+                self.error = IOError(f"{self._file.name} shrank while being archived; "
+                                     f"its tar member is padded with zero bytes")
+        self._remaining -= size
+        return data + bytes(size - len(data))
+
+class BackupResult(NamedTuple):
+    """
+    The outcome of backing up one file.
+
+    Attributes:
+        source (str): The path of the backed up file.
+        backup_path (str): The path of the backup.
+        strategy (str): How the backup was made: the copy mechanism ('hardlink', 'reflink',
+                        'copy_file_range', 'sendfile' or 'buffered'), in deduplicating mode
+                        'stored' for new content and 'deduplicated' for content already stored,
+                        'delta' for a block-level backup, or 'tar' for a file added to a tar archive.
+    """
+    source: str
+    backup_path: str
+    strategy: str
+
+class BackupReport(NamedTuple):
+    """
+    The outcome of one file in a batch backup.
+
+    Attributes:
+        path (str): The path of the file.
+        result (Optional[BackupResult]): The backup made, or None if it failed.
+        error (Optional[Exception]): The error raised by the backup, or None if it succeeded.
+    """
+    path: str
+    result: Optional[BackupResult]
+    error: Optional[Exception]
 
 class BackupManager:
     """
@@ -8,9 +82,49 @@ class BackupManager:
 
     This class is responsible for creating backups of files in an 'archive' folder
     within the file's directory, if the file exists.
+
+    In deduplicating mode, file contents are kept once in a content-addressed store
+    under 'archive/objects', and each backup is a hardlink to the stored content, so
+    backing up an unchanged file costs one hashing pass and no copy.
+
+    In block-level mode, files are split into blocks by a Chunker and only the blocks
+    not yet in the store are written; each backup is a small manifest listing its
+    blocks, from which any version is rebuilt on restore. Large files that change a
+    little between backups then cost little more than the changed blocks.
+
+    Otherwise each backup is a copy made with the fastest mechanism the filesystem
+    supports (see FileCopier), or a hardlink to the file in hardlink mode.
+
+    Every backup is recorded in a SQLite catalog, 'archive/catalog.sqlite', which
+    serves point-in-time restores and retention pruning without listing the folder.
+
+    Attributes:
+        deduplicate (bool): Whether backups share identical content through the store.
+        hardlink (bool): Whether backups are hardlinks to the original files.
+        chunker (Optional[Chunker]): Splits files into blocks in block-level mode.
     """
 
-    def create_backup(self, file_path: str, raise_error_if_not_found: bool = False) -> None:
+    def __init__(self, deduplicate: bool = False, hardlink: bool = False, copier: Optional[FileCopier] = None,
+                 chunker: Optional[Chunker] = None) -> None:
+        """
+        Initializes the BackupManager.
+
+        Args:
+            deduplicate (bool): If True, backups share identical content through a content-addressed store.
+            hardlink (bool): If True, backups are hardlinks to the original files where the
+                             filesystem allows it. Only suitable for files that are replaced
+                             rather than modified in place, as a hardlink shares their data.
+            copier (Optional[FileCopier]): Copies files. Defaults to trying every copy mechanism.
+            chunker (Optional[Chunker]): If given, backups are block-level: only the blocks of a
+                                         file that are not stored yet are written. Takes precedence
+                                         over `deduplicate` and `hardlink`.
+        """
+        self.deduplicate = deduplicate
+        self.hardlink = hardlink
+        self.chunker = chunker
+        self._copier = copier or FileCopier()
+
+    def create_backup(self, file_path: str, raise_error_if_not_found: bool = False) -> Optional[BackupResult]:
         """
         Creates a backup of the specified file in an 'archive' folder. Optionally,
         raises an error if the file does not exist.
@@ -19,6 +133,9 @@ class BackupManager:
             file_path (str): The path of the file to backup.
             raise_error_if_not_found (bool): If True, raises FileNotFoundError when the file does not exist.
 
+        Returns:
+            Optional[BackupResult]: The backup made, or None if the file does not exist.
+
         Raises:
             FileNotFoundError: If raise_error_if_not_found is True and no file is found at file_path.
             IOError: If there is an error in creating the backup.
@@ -29,27 +146,423 @@ class BackupManager:
             if raise_error_if_not_found:
                 raise FileNotFoundError(f"No file found at {file_path}")
             else:
-                return  # Exit the function if the file doesn't exist and raising an error is not required
+                return None  # Exit the function if the file doesn't exist and raising an error is not required
+
+        result, entry, blocks = self._make_backup(original_path)
+        catalog = self._catalog(original_path)
+        if blocks is not None:
+            catalog.add_blocks(entry.backup_path, blocks)
+        catalog.add([entry])
+        return result
+
+    def create_backups(self, file_paths: Iterable[str], max_workers: int = 8, tar_path: Optional[str] = None,
+                       compression: Optional[str] = 'gz', compression_level: Optional[int] = None
+                       ) -> List[BackupReport]:
+        """
+        Backs up many files concurrently from a thread pool.
+
+        A failed backup, including of a file that does not exist, does not stop the batch:
+        its error is reported in the report of that file. The backups are recorded in the
+        catalogs once all are made, in one transaction per archive folder.
+
+        With `tar_path`, the files are instead streamed into a single, optionally compressed,
+        tar archive, named after their absolute paths. The archive is written by the calling
+        thread while the worker threads read the small files ahead; it replaces `tar_path`
+        once complete. Files added to an archive are not recorded in the catalog. A large
+        file that shrinks or fails to read while it is being added keeps its member, padded
+        with zero bytes to the size it had when opened, and is reported as failed; the rest
+        of the batch is archived as usual. Growth after opening is not archived.
 
-        backup_path = self._get_backup_path(original_path)
-        backup_path.parent.mkdir(parents=True, exist_ok=True)
+        Args:
+            file_paths (Iterable[str]): The paths of the files to back up.
+            max_workers (int): The number of concurrent backups, or of files read ahead in tar mode.
+            tar_path (Optional[str]): If given, the path of the tar archive to write.
+            compression (Optional[str]): The compression of the archive: 'gz', 'bz2', 'xz' or None.
+            compression_level (Optional[int]): The compression level. Defaults to the codec's default.
+
+        Returns:
+            List[BackupReport]: The outcome for each file, in the order of `file_paths`.
+
+        Raises:
+            ValueError: If the compression is unknown.
+            IOError: If the tar archive cannot be written.
+        """
+        file_paths = list(file_paths)
+        if tar_path is not None:
+            return self._create_tar_backup(file_paths, max_workers, tar_path, compression, compression_level)
+
+        def backup(path: str) -> Tuple[BackupResult, CatalogEntry, Optional[List[str]]]:
+            if not os.path.isfile(path):
+                raise FileNotFoundError(f"No file found at {path}")
+            return self._make_backup(Path(path))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(backup, path) for path in file_paths]
+            reports = []
+            made: Dict[Path, List[Tuple[CatalogEntry, Optional[List[str]]]]] = {}
+            for path, future in zip(file_paths, futures):
+                error = future.exception()
+                if error is None:
+                    result, entry, blocks = future.result()
+                    made.setdefault(Path(path).parent, []).append((entry, blocks))
+                reports.append(BackupReport(path, None if error else result, error))
+
+        for folder, backups in made.items():
+            catalog = BackupCatalog(str(folder / "archive" / "catalog.sqlite"))
+            for entry, blocks in backups:
+                if blocks is not None:
+                    catalog.add_blocks(entry.backup_path, blocks)
+            catalog.add(entry for entry, _ in backups)
+        return reports
+
+    def _make_backup(self, original_path: Path) -> Tuple[BackupResult, CatalogEntry, Optional[List[str]]]:
+        """
+        Backs up an existing file, without recording the backup in the catalog.
+
+        Returns:
+            Tuple[BackupResult, CatalogEntry, Optional[List[str]]]: The backup made, its catalog
+            entry, and the digests of its blocks for a block-level backup.
+
+        Raises:
+            IOError: If there is an error in creating the backup.
+        """
+        file_path = str(original_path)
+        backup_folder = original_path.parent / "archive"
+        backup_folder.mkdir(parents=True, exist_ok=True)
 
+        digest = None
+        blocks = None
+        backup_path = None
         try:
-            shutil.copy2(file_path, backup_path)
+            if self.chunker is not None:
+                blocks = self._write_blocks(original_path, BlobStore(str(backup_folder)))
+                backup_path = self._reserve_backup_path(original_path, '.blocks')
+                with open(backup_path, mode='w') as manifest:
+                    json.dump(blocks, manifest)
+                strategy = 'delta'
+            elif self.deduplicate:
+                store = BlobStore(str(backup_folder))
+                digest, stored = store.put(file_path)
+                backup_path = self._link_backup(original_path, Path(store.path(digest)))
+                strategy = 'stored' if stored else 'deduplicated'
+            else:
+                backup_path = self._reserve_backup_path(original_path)
+                strategy = self._copier.copy(file_path, str(backup_path), hardlink=self.hardlink)
+                if strategy != 'hardlink':
+                    shutil.copystat(file_path, backup_path)
         except IOError as e:
+            if backup_path is not None:
+                backup_path.unlink(missing_ok=True)  # An empty or partial file would pass for a backup
             raise IOError(f"Failed to create backup for {file_path}: {e}")
+        entry = CatalogEntry(str(original_path.resolve()), time.time_ns(), str(backup_path.resolve()),
+                             strategy, digest)
+        return (BackupResult(str(original_path), str(backup_path), strategy), entry,
+                None if blocks is None else blocks['blocks'])
+
+    def history(self, file_path: str) -> List[CatalogEntry]:
+        """
+        Lists the cataloged backups of a file, newest first.
+
+        Args:
+            file_path (str): The path of the backed up file.
+
+        Returns:
+            List[CatalogEntry]: The backups of the file.
+        """
+        original_path = Path(file_path)
+        return self._catalog(original_path).entries(str(original_path.resolve()))
+
+    def restore(self, file_path: str, at: Optional[datetime] = None, destination: Optional[str] = None) -> str:
+        """
+        Restores the latest backup of a file made at or before a point in time.
+
+        The restored file replaces the destination atomically. Block-level backups are
+        rebuilt from their stored blocks.
+
+        Args:
+            file_path (str): The path of the backed up file.
+            at (Optional[datetime]): The point in time; naive datetimes are in local time. Defaults to now.
+            destination (Optional[str]): Where to restore the file. Defaults to `file_path`.
 
-    def _get_backup_path(self, original_path: Path) -> Path:
+        Returns:
+            str: The path of the backup that was restored.
+
+        Raises:
+            FileNotFoundError: If the file has no backup that old.
+            IOError: If the file cannot be restored.
+        """
+        original_path = Path(file_path)
+        at_ns = None if at is None else int(at.timestamp() * 1_000_000) * 1000
+        entry = self._catalog(original_path).find(str(original_path.resolve()), at_ns)
+        if entry is None:
+            raise FileNotFoundError(f"No backup of {file_path} found{'' if at is None else f' before {at}'}")
+
+        destination = destination or file_path
+        temp_path = f"{destination}.restore-{os.getpid()}"
+        try:
+            if entry.strategy == 'delta':
+                self._rebuild(entry.backup_path, BlobStore(str(original_path.parent / "archive")), temp_path)
+            else:
+                self._copier.copy(entry.backup_path, temp_path)
+                shutil.copystat(entry.backup_path, temp_path)
+            os.chmod(temp_path, stat.S_IMODE(os.stat(temp_path).st_mode) | stat.S_IWUSR)  # Stored blobs are read-only
+            os.replace(temp_path, destination)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return entry.backup_path
+
+    def prune(self, file_path: str, keep_last: int = 0, keep_daily: int = 0, keep_weekly: int = 0) -> List[str]:
+        """
+        Deletes the backups of a file that no retention rule keeps, in bulk.
+
+        A backup is kept if any rule keeps it. The catalog is the only source consulted,
+        so the archive folder is never listed. Stored content and blocks that no remaining
+        backup uses are deleted as well.
+
+        Args:
+            file_path (str): The path of the backed up file.
+            keep_last (int): The number of most recent backups to keep.
+            keep_daily (int): The number of past days, today included, to keep the latest backup of.
+            keep_weekly (int): The number of past weeks, this one included, to keep the latest backup of.
+
+        Returns:
+            List[str]: The paths of the deleted backups.
+
+        Raises:
+            ValueError: If no rule is given, which would delete every backup.
+        """
+        if not (keep_last or keep_daily or keep_weekly):
+            raise ValueError("At least one retention rule is required")
+        original_path = Path(file_path)
+        catalog = self._catalog(original_path)
+        entries = catalog.entries(str(original_path.resolve()))
+        times = [datetime.fromtimestamp(entry.created_ns / 1e9) for entry in entries]
+
+        kept = set(range(min(keep_last, len(entries))))
+        now = datetime.now()
+        rules = [(keep_daily, lambda t: t.date(), now - timedelta(days=keep_daily - 1)),
+                 (keep_weekly, lambda t: tuple(t.isocalendar())[:2], now - timedelta(weeks=keep_weekly - 1))]
+        for count, period, oldest in rules:
+            if not count:
+                continue
+            seen = set()
+            for index, created in enumerate(times):  # Newest first, so the first of each period is kept
+                current = period(created)
+                if current < period(oldest):
+                    break
+                if current not in seen:
+                    seen.add(current)
+                    kept.add(index)
+
+        removed = [entry for index, entry in enumerate(entries) if index not in kept]
+        digests = {entry.digest for entry in removed if entry.digest}
+        for entry in removed:
+            if entry.strategy == 'delta':
+                digests.update(catalog.blocks(entry.backup_path))
+            try:
+                os.remove(entry.backup_path)
+            except FileNotFoundError:
+                pass
+        catalog.remove(entry.backup_path for entry in removed)
+
+        store = BlobStore(str(original_path.parent / "archive"))
+        for digest in digests:
+            if not catalog.is_referenced(digest):
+                try:
+                    os.remove(store.path(digest))
+                except FileNotFoundError:
+                    pass
+        return [entry.backup_path for entry in removed]
+
+    def index_existing_backups(self, file_path: str) -> int:
+        """
+        Adds the backups of a file made before the catalog existed, read from their names.
+
+        This lists the archive folder once; afterwards the catalog is kept up to date by
+        `create_backup`.
+
+        Args:
+            file_path (str): The path of the backed up file.
+
+        Returns:
+            int: The number of backups added to the catalog.
+        """
+        original_path = Path(file_path)
+        backup_folder = original_path.resolve().parent / "archive"
+        pattern = re.compile(rf"{re.escape(original_path.stem)}_(\d{{14}})(?:_\d+)?{re.escape(original_path.suffix)}")
+        catalog = self._catalog(original_path)
+        known = {entry.backup_path for entry in catalog.entries(str(original_path.resolve()))}
+        found = []
+        for entry in os.scandir(backup_folder) if backup_folder.is_dir() else []:
+            match = pattern.fullmatch(entry.name)
+            if match and entry.is_file() and entry.path not in known:
+                created = datetime.strptime(match.group(1), "%Y%m%d%H%M%S")
+                found.append(CatalogEntry(str(original_path.resolve()), int(created.timestamp()) * 1_000_000_000,
+                                          entry.path, 'indexed'))
+        catalog.add(found)
+        return len(found)
+
+    @staticmethod
+    def _create_tar_backup(file_paths: List[str], max_workers: int, tar_path: str, compression: Optional[str],
+                           compression_level: Optional[int]) -> List[BackupReport]:
+        """
+        Streams files into a tar archive, reading small files ahead from a thread pool.
+
+        Returns:
+            List[BackupReport]: The outcome for each file, in the order of `file_paths`.
+        """
+        if compression is not None and compression not in CODECS:
+            raise ValueError(f"Unknown compression: {compression}")
+
+        def read_ahead(path: str) -> Tuple[tarfile.TarInfo, Optional[bytes]]:
+            file_stat = os.stat(path)
+            if not stat.S_ISREG(file_stat.st_mode):
+                raise IOError(f"Not a regular file: {path}")
+            info = tarfile.TarInfo(os.path.abspath(path).replace(os.sep, '/').lstrip('/'))
+            info.mode = stat.S_IMODE(file_stat.st_mode)
+            info.mtime = file_stat.st_mtime
+            data = None
+            if file_stat.st_size <= _TAR_READ_AHEAD_SIZE:
+                with open(path, mode='rb') as file:
+                    data = file.read()
+            info.size = file_stat.st_size if data is None else len(data)
+            return info, data
+
+        temp_path = f"{tar_path}.partial-{os.getpid()}"
+        queue = deque(file_paths)
+        pending: Deque[Tuple[str, Future]] = deque()
+        reports = []
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+                    (open(temp_path, mode='wb') if compression is None
+                     else CODECS[compression].open(temp_path, 'wb', compression_level)) as output, \
+                    tarfile.open(fileobj=output, mode='w|') as archive:
+                while queue or pending:
+                    while queue and len(pending) < 2 * max_workers:
+                        path = queue.popleft()
+                        pending.append((path, executor.submit(read_ahead, path)))
+                    path, future = pending.popleft()
+                    error = future.exception()
+                    if error is None:
+                        info, data = future.result()
+                        if data is not None:
+                            archive.addfile(info, io.BytesIO(data))
+                        else:
+                            try:
+                                file = open(path, mode='rb')
+                            except OSError as e:
+                                error = e
+                            else:
+                                with file:
+                                    info.size = os.fstat(file.fileno()).st_size
+                                    reader = _PaddedReader(file, info.size)
+                                    archive.addfile(info, reader)
+                                    error = reader.error
+                    reports.append(BackupReport(path, None if error else BackupResult(path, tar_path, 'tar'), error))
+            os.replace(temp_path, tar_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return reports
+
+    @staticmethod
+    def _catalog(original_path: Path) -> BackupCatalog:
+        """Opens the catalog of the archive folder of a file, creating the folder if needed."""
+        backup_folder = original_path.parent / "archive"
+        backup_folder.mkdir(parents=True, exist_ok=True)
+        return BackupCatalog(str(backup_folder / "catalog.sqlite"))
+
+    def _write_blocks(self, original_path: Path, store: BlobStore) -> dict:
+        """
+        Stores the blocks of a file that the store does not hold yet.
+
+        Returns:
+            dict: The manifest of the file: its size, mode and modification time, and the
+                  digests of its blocks in order.
+        """
+        digests = []
+        size = 0
+        with open(original_path, mode='rb') as file:
+            file_stat = os.fstat(file.fileno())
+            for block in self.chunker.chunks(file):
+                digest, _ = store.put_bytes(block)
+                digests.append(digest)
+                size += len(block)
+        return {'size': size, 'mode': stat.S_IMODE(file_stat.st_mode),
+                'mtime_ns': file_stat.st_mtime_ns, 'blocks': digests}
+
+    @staticmethod
+    def _rebuild(manifest_path: str, store: BlobStore, destination: str) -> None:
+        """Writes the file described by a block-level backup manifest from its stored blocks."""
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+        with open(destination, mode='wb') as file:
+            for digest in manifest['blocks']:
+                file.write(store.get_bytes(digest))
+            if file.tell() != manifest['size']:
+                raise IOError(f"Rebuilt {file.tell()} bytes from {manifest_path}, expected {manifest['size']}")
+        os.chmod(destination, manifest['mode'])
+        os.utime(destination, ns=(manifest['mtime_ns'], manifest['mtime_ns']))
+
+    def _get_backup_path(self, original_path: Path, attempt: int = 0) -> Path:
         """
         Generates the backup path for a file within an 'archive' folder.
 
         Args:
             original_path (Path): The original path of the file.
+            attempt (int): The number of names already taken for this second; from the
+                           second attempt on, it is appended to the timestamp.
 
         Returns:
             Path: The path where the backup will be stored.
         """
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        if attempt:
+            timestamp = f"{timestamp}_{attempt}"
         backup_folder = original_path.parent / "archive"
         backup_filename = f"{original_path.stem}_{timestamp}{original_path.suffix}"
         return backup_folder / backup_filename
+
+    def _reserve_backup_path(self, original_path: Path, extension: str = '') -> Path:
+        """
+        Creates an empty backup file under a name no other backup uses.
+
+        Several backups of the same file within one second would otherwise share a
+        timestamp and overwrite each other; the name is claimed with an exclusive create.
+        Callers remove the file if the backup then fails.
+
+        Args:
+            original_path (Path): The original path of the file.
+            extension (str): Appended to the backup name, e.g. '.blocks' for block-level manifests.
+
+        Returns:
+            Path: The path of the reserved backup file.
+        """
+        attempt = 0
+        while True:
+            backup_path = self._get_backup_path(original_path, attempt)
+            backup_path = backup_path.with_name(backup_path.name + extension)
+            try:
+                with open(backup_path, mode='x'):
+                    return backup_path
+            except FileExistsError:
+                attempt += 1
+
+    def _link_backup(self, original_path: Path, blob_path: Path) -> Path:
+        """
+        Records a backup as a hardlink to its stored content, under a unique name.
+
+        Falls back to copying the content where hardlinks are not supported. The reserved
+        name is released if the link or copy fails.
+
+        Returns:
+            Path: The path of the backup.
+        """
+        backup_path = self._reserve_backup_path(original_path)
+        try:
+            self._copier.copy(str(blob_path), str(backup_path), hardlink=True)
+        except IOError:
+            backup_path.unlink(missing_ok=True)
+            raise
+        return backup_path
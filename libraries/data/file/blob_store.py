@@ -0,0 +1,151 @@
+import hashlib
+import os
+import stat
+from typing import Tuple
+
+_HASH_BUFFER_SIZE = 1024 * 1024  # Read buffer used when hashing and storing files
+
+class BlobStore:
+    """
+    A content-addressed store that keeps each distinct file content once.
+
+    Blobs are named after the SHA-256 digest of their contents and stored under
+    `objects/<first two hex digits>/<remaining digits>` below the root directory.
+    Stored blobs are made read-only, since backups may hardlink to them.
+
+    Attributes:
+        root (str): The root directory of the store.
+    """
+
+    def __init__(self, root: str) -> None:
+        """
+        Initializes the store; directories are created on the first write.
+
+        Args:
+            root (str): The root directory of the store.
+        """
+        self.root = root
+
+    def path(self, digest: str) -> str:
+        """Returns the path of the blob with the given digest."""
+        return os.path.join(self.root, 'objects', digest[:2], digest[2:])
+
+    def __contains__(self, digest: str) -> bool:
+        return os.path.exists(self.path(digest))
+
+    def put(self, file_path: str) -> Tuple[str, bool]:
+        """
+        Stores the contents of a file, unless the store already holds them.
+
+        The file is hashed in a single streaming pass; only content that is not in the
+        store yet is copied, hashing it again on the way so that the stored blob always
+        matches its name even if the file changed in between.
+
+        Args:
+            file_path (str): The path of the file to store.
+
+        Returns:
+            Tuple[str, bool]: The digest of the stored content, and whether it was newly stored.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            IOError: If the file cannot be read or the blob cannot be written.
+        """
+        digest = self.hash_file(file_path)
+        if digest in self:
+            return digest, False
+
+        temp_path = os.path.join(self.root, 'objects', f"incoming-{os.getpid()}-{id(self)}-{digest}")
+        os.makedirs(os.path.dirname(temp_path), exist_ok=True)
+        try:
+            digest = self._copy_hashing(file_path, temp_path)
+            os.chmod(temp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.makedirs(os.path.dirname(self.path(digest)), exist_ok=True)
+            os.replace(temp_path, self.path(digest))
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return digest, True
+
+    def put_bytes(self, data: bytes) -> Tuple[str, bool]:
+        """
+        Stores a block of bytes, unless the store already holds it.
+
+        Args:
+            data (bytes): The bytes to store.
+
+        Returns:
+            Tuple[str, bool]: The digest of the bytes, and whether they were newly stored.
+
+        Raises:
+            IOError: If the blob cannot be written.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        if digest in self:
+            return digest, False
+
+        temp_path = os.path.join(self.root, 'objects', f"incoming-{os.getpid()}-{id(self)}-{digest}")
+        os.makedirs(os.path.dirname(self.path(digest)), exist_ok=True)
+        try:
+            with open(temp_path, mode='wb') as file:
+                file.write(data)
+            os.chmod(temp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(temp_path, self.path(digest))
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return digest, True
+
+    def get_bytes(self, digest: str) -> bytes:
+        """
+        Reads a stored blob.
+
+        Args:
+            digest (str): The digest of the blob.
+
+        Returns:
+            bytes: The contents of the blob.
+
+        Raises:
+            FileNotFoundError: If the store does not hold the blob.
+        """
+        with open(self.path(digest), mode='rb') as file:
+            return file.read()
+
+    @staticmethod
+    def hash_file(file_path: str) -> str:
+        """
+        Computes the SHA-256 digest of a file in a single streaming pass.
+
+        Args:
+            file_path (str): The path of the file to hash.
+
+        Returns:
+            str: The hexadecimal digest.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        digest = hashlib.sha256()
+        buffer = bytearray(_HASH_BUFFER_SIZE)
+        view = memoryview(buffer)
+        with open(file_path, mode='rb', buffering=0) as file:
+            while True:
+                count = file.readinto(buffer)
+                if not count:
+                    return digest.hexdigest()
+                digest.update(view[:count])
+
+    @staticmethod
+    def _copy_hashing(source: str, destination: str) -> str:
+        """Copies a file and returns the SHA-256 digest of the bytes that were copied."""
+        digest = hashlib.sha256()
+        buffer = bytearray(_HASH_BUFFER_SIZE)
+        view = memoryview(buffer)
+        with open(source, mode='rb', buffering=0) as source_file, open(destination, mode='wb') as destination_file:
+            while True:
+                count = source_file.readinto(buffer)
+                if not count:
+                    return digest.hexdigest()
+                digest.update(view[:count])
+                destination_file.write(view[:count])
@@ -0,0 +1,128 @@
+import random
+import warnings
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from itertools import accumulate
+from typing import BinaryIO, Iterator, List
+from .column_table import np
+
+_WINDOW = 48  # Bytes hashed to decide whether a position is a chunk boundary
+_SEGMENT_SIZE = 4 * 1024 * 1024  # Bytes read at a time by the content-defined chunker
+_GEAR = random.Random(0x5EED).choices(range(1 << 32), k=256)  # Fixed random value of each byte
+
+class Chunker(ABC):
+    """
+    Abstract base class for splitting a file into blocks for block-level backups.
+    """
+
+    @abstractmethod
+    def chunks(self, file: BinaryIO) -> Iterator[bytes]:
+        """
+        Splits a binary file into consecutive blocks.
+
+        Args:
+            file (BinaryIO): The file, opened for binary reading.
+
+        Yields:
+            bytes: The next block; the blocks concatenate to the file contents.
+        """
+        pass
+
+class FixedSizeChunker(Chunker):
+    """
+    Splits files into blocks of a fixed size.
+
+    Fast, and well suited to files modified in place. Inserting or removing bytes
+    shifts every following block, though, so those blocks are all stored again.
+
+    Attributes:
+        block_size (int): The size in bytes of each block but the last.
+    """
+
+    def __init__(self, block_size: int = 4 * 1024 * 1024) -> None:
+        """
+        Initializes the chunker.
+
+        Args:
+            block_size (int): The size in bytes of each block but the last.
+        """
+        self.block_size = block_size
+
+    def chunks(self, file: BinaryIO) -> Iterator[bytes]:
+        while True:
+            block = file.read(self.block_size)
+            if not block:
+                return
+            yield block
+
+class ContentDefinedChunker(Chunker):
+    """
+    Splits files into blocks whose boundaries depend on the content around them.
+
+    A boundary is placed after every position where a rolling hash of the preceding
+    48 bytes has its low bits all zero, within a minimum and maximum block size. As
+    boundaries move with the content, inserting or removing bytes only changes the
+    blocks around the edit. The hash is a windowed sum of random per-byte values,
+    computed with NumPy when it is installed.
+
+    NumPy is an optional dependency, but without it the hash runs in pure Python at
+    only a few MB/s, which makes delta backups of large files very slow; a warning is
+    issued then. Install NumPy, or use FixedSizeChunker, which needs no hashing, when
+    it is not available.
+
+    Attributes:
+        min_size (int): The minimum size in bytes of a block but the last.
+        max_size (int): The maximum size in bytes of a block.
+    """
+
+    def __init__(self, average_size: int = 1024 * 1024) -> None:
+        """
+        Initializes the chunker.
+
+        Args:
+            average_size (int): The approximate average block size in bytes; blocks are
+                                between a quarter and four times this size.
+        """
+        self.min_size = max(average_size // 4, _WINDOW)
+        self.max_size = average_size * 4
+        self._mask = (1 << max((average_size - self.min_size).bit_length() - 1, 0)) - 1
+        if np is None:
+            warnings.warn("NumPy is not installed: ContentDefinedChunker hashes at only a few MB/s; "
+                          "install NumPy or use FixedSizeChunker for large files", RuntimeWarning, stacklevel=2)
+
+    def chunks(self, file: BinaryIO) -> Iterator[bytes]:
+        buffer = b''
+        boundaries: List[int] = []
+        while True:
+            data = file.read(_SEGMENT_SIZE)
+            eof = not data
+            # Only the new data is hashed, with the end of the previous data as the first window
+            offset = max(len(buffer) + 1 - _WINDOW, 0)
+            buffer += data
+            boundaries += [offset + end for end in self._boundaries(buffer[offset:])]
+            start = 0
+            while start < len(buffer) and (eof or len(buffer) - start >= self.max_size):
+                index = bisect_left(boundaries, start + self.min_size)
+                if index < len(boundaries) and boundaries[index] <= start + self.max_size:
+                    end = boundaries[index]
+                else:
+                    end = min(start + self.max_size, len(buffer))
+                yield buffer[start:end]
+                start = end
+            buffer = buffer[start:]
+            boundaries = [end - start for end in boundaries[bisect_left(boundaries, start + 1):]]
+            if eof:
+                return
+
+    def _boundaries(self, buffer: bytes) -> List[int]:
+        """Returns the sorted offsets in the buffer after which the rolling hash allows a boundary."""
+        if len(buffer) < _WINDOW:
+            return []
+        if np is not None:
+            sums = np.cumsum(_GEAR_ARRAY[np.frombuffer(buffer, dtype=np.uint8)], dtype=np.uint32)
+            hashes = sums[_WINDOW - 1:] - np.concatenate(([0], sums[:-_WINDOW])).astype(np.uint32)
+            return (np.flatnonzero((hashes & self._mask) == 0) + _WINDOW).tolist()
+        sums = list(accumulate(map(_GEAR.__getitem__, buffer), initial=0))
+        return [end for end in range(_WINDOW, len(sums)) if not (sums[end] - sums[end - _WINDOW]) & self._mask]
+
+_GEAR_ARRAY = np.array(_GEAR, dtype=np.uint32) if np is not None else None
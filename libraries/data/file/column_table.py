@@ -0,0 +1,177 @@
+from array import array
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; columns stay as array.array buffers without it
+    np = None
+
+_TYPE_CODES = {int: 'q', float: 'd'}  # array.array type codes of the numeric column types
+_WIDENING = {int: float, float: str}  # Next type to try when a value does not convert
+_INT_RANGE = range(-2 ** 63, 2 ** 63)  # The integers an int column (a 64-bit buffer) holds
+
+def _to_float(value: str) -> float:
+    """Converts a CSV field to a float, treating empty fields as NaN."""
+    return float(value) if value else float('nan')
+
+_CONVERTERS: Dict[type, Callable[[str], Any]] = {int: int, float: _to_float, str: str}
+
+class ColumnTable:
+    """
+    A table of typed columns backed by compact contiguous buffers.
+
+    Numeric columns are stored in `array.array` buffers (or NumPy arrays when NumPy is
+    importable) and text columns in lists, which takes a fraction of the memory of a
+    list of string rows.
+
+    Attributes:
+        names (List[str]): The column names, in file order.
+        types (Dict[str, type]): The type of each column (int, float or str).
+        columns (Dict[str, Sequence[Any]]): The column buffers, keyed by name.
+        source (Any): The object the column buffers borrow their memory from, if any.
+    """
+
+    def __init__(self, names: List[str], types: Dict[str, type], columns: Dict[str, Sequence[Any]],
+                 source: Any = None) -> None:
+        """
+        Initializes the table with already built columns.
+
+        Args:
+            names (List[str]): The column names, in file order.
+            types (Dict[str, type]): The type of each column.
+            columns (Dict[str, Sequence[Any]]): The column buffers, keyed by name.
+            source (Any): The object the column buffers borrow their memory from, such as
+                          a memory-mapped file; it is kept alive as long as the table.
+        """
+        self.names = names
+        self.types = types
+        self.columns = columns
+        self.source = source
+
+    @classmethod
+    def from_rows(cls, names: List[str], rows: Iterable[Sequence[str]],
+                  schema: Optional[Dict[str, type]] = None, chunk_rows: int = 10000) -> 'ColumnTable':
+        """
+        Builds a table from rows of strings, converting each column to its type.
+
+        Rows are converted a chunk at a time, column by column, so each value goes
+        through a single precompiled converter call. Columns missing from the schema
+        have their type inferred from the first chunk and are widened (int to float to
+        str) if a later chunk does not convert; integers beyond 64 bits widen straight to
+        str, which keeps them exact. Columns given in the schema are never widened.
+        Until the last row, inferred numeric columns also keep their text, so that widening
+        rebuilds them from the original values ('007' stays '007'); a schema avoids that cost.
+
+        Args:
+            names (List[str]): The column names.
+            rows (Iterable[Sequence[str]]): The data rows.
+            schema (Optional[Dict[str, type]]): The type (int, float or str) of some or all columns.
+            chunk_rows (int): The number of rows converted at a time, also used to infer types.
+
+        Returns:
+            ColumnTable: The table holding the converted columns.
+
+        Raises:
+            ValueError: If a value does not convert to the type given in the schema (including
+                        integers beyond 64 bits), or a row does not have one value per column.
+        """
+        schema = schema or {}
+        types: Dict[str, type] = {name: schema.get(name, int) for name in names}
+        buffers = [cls._new_buffer(types[name]) for name in names]
+        texts: Dict[int, List[str]] = {index: [] for index, name in enumerate(names) if name not in schema}
+        rows = iter(rows)
+        row_number = 0
+
+        for chunk in iter(lambda: list(islice(rows, chunk_rows)), []):
+            for offset, row in enumerate(chunk):
+                if len(row) != len(names):
+                    raise ValueError(f"Row {row_number + offset + 1} has {len(row)} values, expected {len(names)}")
+            row_number += len(chunk)
+            for index, values in enumerate(zip(*chunk)):
+                name = names[index]
+                try:
+                    buffers[index].extend(list(map(_CONVERTERS[types[name]], values)))
+                except (ValueError, OverflowError):  # Overflow: an integer beyond 64 bits
+                    if name in schema:
+                        raise ValueError(f"Column '{name}' contains values that are not a valid {schema[name].__name__}")
+                    types[name] = cls._infer_type(values, types[name])
+                    converter = _CONVERTERS[types[name]]
+                    buffers[index] = cls._new_buffer(types[name], map(converter, texts[index]))
+                    buffers[index].extend(map(converter, values))
+                if index in texts:
+                    if types[name] is str:
+                        del texts[index]  # The column holds its text itself from now on
+                    else:
+                        texts[index].extend(values)
+
+        return cls(list(names), types, {name: cls._finalize(buffer, types[name])
+                                        for name, buffer in zip(names, buffers)})
+
+    @staticmethod
+    def _infer_type(values: Iterable[str], column_type: type = int) -> type:
+        """
+        Infers the narrowest type, starting from `column_type`, that all the given values convert to.
+
+        Args:
+            values (Iterable[str]): The values of a column.
+            column_type (type): The narrowest type to consider.
+
+        Returns:
+            type: int, float or str.
+        """
+        for value in values:
+            while column_type is not str:
+                try:
+                    converted = _CONVERTERS[column_type](value)
+                except ValueError:
+                    column_type = _WIDENING[column_type]
+                    continue
+                if column_type is int and converted not in _INT_RANGE:
+                    column_type = str  # A float would round it, and such values are usually identifiers
+                break
+        return column_type
+
+    @staticmethod
+    def _new_buffer(column_type: type, values: Iterable[Any] = ()) -> Any:
+        """Creates an empty (or pre-filled) growable buffer for a column type."""
+        if column_type in _TYPE_CODES:
+            return array(_TYPE_CODES[column_type], values)
+        return list(values)
+
+    @staticmethod
+    def _finalize(buffer: Any, column_type: type) -> Sequence[Any]:
+        """Exposes a numeric buffer as a NumPy array without copying, when NumPy is available."""
+        if np is not None and isinstance(buffer, array):
+            return np.frombuffer(buffer, dtype=np.int64 if column_type is int else np.float64)
+        return buffer
+
+    def __len__(self) -> int:
+        """Returns the number of rows in the table."""
+        return len(self.columns[self.names[0]]) if self.names else 0
+
+    def __getitem__(self, name: str) -> Sequence[Any]:
+        """Returns the column with the given name."""
+        return self.columns[name]
+
+    def __iter__(self) -> Iterator[tuple]:
+        """Yields the rows of the table as tuples."""
+        return zip(*(self.columns[name] for name in self.names))
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximates the memory held by the column buffers.
+
+        Returns:
+            int: The size in bytes of the numeric buffers plus the text column values.
+        """
+        total = 0
+        for column in self.columns.values():
+            if isinstance(column, list):
+                total += sum(len(value) for value in column)
+            elif isinstance(column, array):
+                total += column.itemsize * len(column)
+            else:  # NumPy arrays, memoryviews and mapped text columns
+                total += column.nbytes
+        return total
@@ -0,0 +1,53 @@
+import bz2
+import gzip
+import lzma
+from typing import IO, Dict, Optional
+
+class CompressionCodec:
+    """
+    A streaming compression codec that file handlers can read and write through.
+
+    Attributes:
+        name (str): The name of the codec.
+        default_level (int): The compression level used when none is given.
+    """
+
+    def __init__(self, name: str, module, level_argument: str, default_level: int) -> None:
+        """
+        Initializes the codec.
+
+        Args:
+            name (str): The name of the codec.
+            module: The standard library module implementing the codec (gzip, bz2 or lzma).
+            level_argument (str): The name of the compression level argument of `module.open`.
+            default_level (int): The compression level used when none is given.
+        """
+        self.name = name
+        self.default_level = default_level
+        self._module = module
+        self._level_argument = level_argument
+
+    def open(self, filename: str, mode: str, level: Optional[int] = None, **kwargs) -> IO:
+        """
+        Opens a compressed file for streaming reads or writes.
+
+        Args:
+            filename (str): The path of the compressed file.
+            mode (str): The file mode, as for the built-in `open`; text mode is the default.
+            level (Optional[int]): The compression level for writes. Defaults to `default_level`.
+            **kwargs: Text mode options such as encoding and newline.
+
+        Returns:
+            IO: A file object that compresses on write and decompresses on read.
+        """
+        if 'b' not in mode:
+            mode += 't'
+        if any(flag in mode for flag in 'wax'):
+            kwargs[self._level_argument] = self.default_level if level is None else level
+        return self._module.open(filename, mode, **kwargs)
+
+CODECS: Dict[str, CompressionCodec] = {
+    'gz': CompressionCodec('gzip', gzip, 'compresslevel', 6),
+    'bz2': CompressionCodec('bz2', bz2, 'compresslevel', 9),
+    'xz': CompressionCodec('lzma', lzma, 'preset', 6),
+}
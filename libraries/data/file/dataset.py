@@ -0,0 +1,181 @@
+import os
+from fnmatch import fnmatch
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from .file_handler_factory import FileHandlerFactory
+from .handlers.abstract_file_handler import DEFAULT_CHUNK_SIZE
+from ...path_builder.path_builder import PathBuilder
+
+Partition = Dict[str, Any]
+
+_SIDECAR_SUFFIXES = ('.idx', '.offset', '.tmp')  # Row indexes, follower checkpoints and partial writes
+
+def _parse_value(value: str) -> Any:
+    """Parses a partition value, as an int when it is one and as a string otherwise."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+def _sort_key(entry: os.DirEntry) -> Tuple:
+    """Orders partition directories by their parsed value, so that 'day=9' comes before 'day=10'."""
+    value = _parse_value(entry.name.partition('=')[2])
+    return (entry.name.partition('=')[0], isinstance(value, str), value)
+
+class Dataset:
+    """
+    A collection of files partitioned into `key=value` directories under a root directory.
+
+    For example `base/year=2026/month=10/day=18/part-0.csv` belongs to the partition
+    {'year': 2026, 'month': 10, 'day': 18}. Partitions are discovered by walking the
+    directory tree, and filters are applied to each directory as soon as its key is
+    known, so the subtrees of non-matching partitions are never listed and their files
+    never opened.
+
+    Directories that are not named `key=value`, files whose name starts with '.' or
+    '_', and the sidecar files written next to data files (`.idx` row indexes, `.offset`
+    checkpoints, `.tmp` partial writes, and `.colbin` caches of a file in the same
+    directory) are ignored.
+
+    Attributes:
+        root (str): The root directory of the dataset.
+        pattern (str): The glob pattern the names of data files must match.
+    """
+
+    def __init__(self, root: str, pattern: str = '*') -> None:
+        """
+        Initializes the dataset.
+
+        Args:
+            root (str): The root directory of the dataset.
+            pattern (str): The glob pattern the names of data files must match, e.g. '*.csv'.
+                           Files of unsupported types are skipped either way.
+        """
+        self.root = root
+        self.pattern = pattern
+
+    def partition_path(self, **keys: Any) -> PathBuilder:
+        """
+        Builds the directory path of a partition, in the order the keys are given.
+
+        Args:
+            **keys (Any): The partition keys and values, e.g. year=2026, month=10.
+
+        Returns:
+            PathBuilder: The path of the partition directory, not yet created.
+        """
+        return PathBuilder(self.root, *(f"{key}={value}" for key, value in keys.items()))
+
+    def files(self, filters: Optional[Dict[str, Any]] = None,
+              predicate: Optional[Callable[[Partition], bool]] = None) -> Iterator[Tuple[str, Partition]]:
+        """
+        Yields the data files of the partitions that match the filters and the predicate.
+
+        Args:
+            filters (Optional[Dict[str, Any]]): Conditions on partition keys, checked as soon as
+                each key is reached: a callable that takes the value, a collection of accepted
+                values (e.g. a set or a range), or a single accepted value. Partitions that
+                lack a filtered key do not match.
+            predicate (Optional[Callable[[Partition], bool]]): A condition on all the keys of a
+                partition, checked before any of its files are opened.
+
+        Yields:
+            Tuple[str, Partition]: The path of the next file and the keys of its partition,
+                                   in directory order.
+
+        Raises:
+            FileNotFoundError: If the root directory does not exist.
+        """
+        filters = filters or {}
+        factory = FileHandlerFactory()
+        stack: List[Tuple[str, Partition]] = [(self.root, {})]
+        while stack:
+            directory, partition = stack.pop()
+            with os.scandir(directory) as scan:
+                entries = list(scan)
+
+            subdirectories = []
+            for entry in sorted((entry for entry in entries if entry.is_dir() and '=' in entry.name), key=_sort_key):
+                key, _, value = entry.name.partition('=')
+                value = _parse_value(value)
+                if key not in filters or self._accepts(filters[key], value):
+                    subdirectories.append((entry.path, {**partition, key: value}))
+            stack.extend(reversed(subdirectories))
+
+            names = {entry.name for entry in entries}
+            files = sorted(entry.path for entry in entries
+                           if entry.is_file() and not entry.name.startswith(('.', '_'))
+                           and not self._is_sidecar(entry.name, names)
+                           and fnmatch(entry.name, self.pattern) and self._is_supported(factory, entry.name))
+            if not files or not filters.keys() <= partition.keys():
+                continue
+            if predicate is None or predicate(partition):
+                for file_path in files:
+                    yield file_path, partition
+
+    def partitions(self, filters: Optional[Dict[str, Any]] = None,
+                   predicate: Optional[Callable[[Partition], bool]] = None) -> List[Partition]:
+        """
+        Lists the distinct partitions that hold matching data files.
+
+        Args:
+            filters (Optional[Dict[str, Any]]): Conditions on partition keys, as for `files`.
+            predicate (Optional[Callable[[Partition], bool]]): A condition on all the keys of a partition.
+
+        Returns:
+            List[Partition]: The keys of each partition, in directory order.
+        """
+        partitions: List[Partition] = []
+        for _, partition in self.files(filters, predicate):
+            if not partitions or partitions[-1] != partition:
+                partitions.append(partition)
+        return partitions
+
+    def iter_rows(self, filters: Optional[Dict[str, Any]] = None,
+                  predicate: Optional[Callable[[Partition], bool]] = None,
+                  with_partition: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+        """
+        Streams the records of all matching files as a single iterator, one file at a time.
+
+        Args:
+            filters (Optional[Dict[str, Any]]): Conditions on partition keys, as for `files`.
+            predicate (Optional[Callable[[Partition], bool]]): A condition on all the keys of a partition.
+            with_partition (bool): If True, yields (partition, record) pairs instead of records.
+            chunk_size (int): The size in bytes of the read buffer.
+
+        Yields:
+            Any: The next record, or (partition, record) pair.
+
+        Raises:
+            FileNotFoundError: If the root directory does not exist.
+            IOError: If a file read fails.
+        """
+        factory = FileHandlerFactory()
+        for file_path, partition in self.files(filters, predicate):
+            handler = factory.get_handler(factory.get_file_type(file_path), file_path)
+            if with_partition:
+                for record in handler.iter_rows(chunk_size):
+                    yield partition, record
+            else:
+                yield from handler.iter_rows(chunk_size)
+
+    @staticmethod
+    def _accepts(condition: Any, value: Any) -> bool:
+        """Checks a partition value against a filter condition."""
+        if callable(condition):
+            return bool(condition(value))
+        if isinstance(condition, (set, frozenset, list, tuple, range)):
+            return value in condition
+        return value == condition
+
+    @staticmethod
+    def _is_sidecar(filename: str, names: Set[str]) -> bool:
+        """Checks whether a file is written next to data files rather than holding data itself."""
+        if filename.endswith('.colbin'):
+            return filename[:-len('.colbin')] in names  # The columnar cache of a file in the directory
+        return filename.endswith(_SIDECAR_SUFFIXES)
+
+    @staticmethod
+    def _is_supported(factory: FileHandlerFactory, filename: str) -> bool:
+        """Checks whether the factory has a handler for a file, compressed or not."""
+        file_type = factory.get_file_type(filename)
+        return file_type in factory.handlers or file_type.rpartition('.')[0] in factory.handlers
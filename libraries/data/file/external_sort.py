@@ -0,0 +1,218 @@
+import heapq
+import os
+import pickle
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import chain, groupby, islice
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+from .file_handler_factory import FileHandlerFactory
+from .handlers import CSVFileHandler
+from .handlers.abstract_file_handler import DEFAULT_CHUNK_SIZE
+
+DEFAULT_MEMORY_LIMIT = 256 * 1024 * 1024  # Bytes of records held in memory while generating runs
+_BATCH_SIZE = 1024  # Records pickled together in a run file
+_MAX_MERGE_WIDTH = 128  # Runs merged at once; more runs are merged in several passes
+_RUN_BUFFER_SIZE = 64 * 1024  # Read and write buffer of each run file, kept small as many are open at once
+
+def _record_size(record: Any) -> int:
+    """Estimates the memory held by a record and its fields."""
+    size = sys.getsizeof(record)
+    if isinstance(record, (list, tuple)):
+        size += sum(map(sys.getsizeof, record))
+    elif isinstance(record, dict):
+        size += sum(map(sys.getsizeof, record.values()))
+    return size
+
+def _deduplicate(records: Iterable[Any], key: Optional[Callable[[Any], Any]], keep: Optional[str]) -> Iterator[Any]:
+    """Keeps the first or last of each group of consecutive records with equal keys."""
+    if keep is None:
+        return iter(records)
+    if keep == 'first':
+        return (next(group) for _, group in groupby(records, key))
+    return (deque(group, maxlen=1)[0] for _, group in groupby(records, key))
+
+def _write_run(records: Iterable[Any], path: str) -> str:
+    """Writes records to a run file as a stream of pickled batches."""
+    records = iter(records)
+    with open(path, mode='wb', buffering=_RUN_BUFFER_SIZE) as file:
+        while True:
+            batch = list(islice(records, _BATCH_SIZE))
+            if not batch:
+                return path
+            pickle.dump(batch, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+def _read_run(path: str) -> Iterator[Any]:
+    """Yields the records of a run file."""
+    with open(path, mode='rb', buffering=_RUN_BUFFER_SIZE) as file:
+        while True:
+            try:
+                batch = pickle.load(file)
+            except EOFError:
+                return
+            yield from batch
+
+def _sort_run(records: List[Any], key: Optional[Callable[[Any], Any]], keep: Optional[str], path: str) -> str:
+    """Sorts a chunk of records and writes it to a run file; runs in worker processes."""
+    records.sort(key=key)
+    return _write_run(_deduplicate(records, key, keep), path)
+
+class ExternalSorter:
+    """
+    Sorts and optionally deduplicates more records than fit in memory.
+
+    Records are consumed in chunks that fit the memory budget; each chunk is sorted
+    and spilled to a temporary run file, and the runs are then merged with a k-way
+    heap merge. Sorting is stable, so among records with equal keys the input order is
+    kept, which is what the `keep` policy relies on. Input that fits in a single chunk
+    is sorted in memory without touching the disk.
+
+    Attributes:
+        key (Optional[Callable[[Any], Any]]): Extracts the sort key of a record; the record
+            itself is compared if None. Must be picklable when `workers` is more than 1,
+            e.g. `operator.itemgetter(0)`.
+        keep (Optional[str]): 'first' or 'last' to keep only one record per key, or None to keep all.
+        memory_limit (int): The approximate number of bytes of records held in memory.
+        workers (int): The number of processes that sort and spill runs.
+        temp_dir (Optional[str]): The directory of the run files. Defaults to the system temporary directory.
+    """
+
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None, keep: Optional[str] = None,
+                 memory_limit: int = DEFAULT_MEMORY_LIMIT, workers: int = 1, temp_dir: Optional[str] = None) -> None:
+        """
+        Initializes the sorter.
+
+        Args:
+            key (Optional[Callable[[Any], Any]]): Extracts the sort key of a record.
+            keep (Optional[str]): 'first' or 'last' to keep only one record per key, or None to keep all.
+            memory_limit (int): The approximate number of bytes of records held in memory.
+            workers (int): The number of processes that sort and spill runs.
+            temp_dir (Optional[str]): The directory of the run files.
+
+        Raises:
+            ValueError: If `keep` is not 'first', 'last' or None.
+        """
+        if keep not in (None, 'first', 'last'):
+            raise ValueError(f"keep must be 'first', 'last' or None, got {keep!r}")
+        self.key = key
+        self.keep = keep
+        self.memory_limit = memory_limit
+        self.workers = workers
+        self.temp_dir = temp_dir
+
+    def sort(self, records: Iterable[Any]) -> Iterator[Any]:
+        """
+        Yields records in key order, spilling sorted runs to disk when they exceed the memory budget.
+
+        The run files are removed once the iterator is exhausted or closed.
+
+        Args:
+            records (Iterable[Any]): The records to sort.
+
+        Yields:
+            Any: The next record in key order.
+        """
+        records = iter(records)
+        # With several workers, a chunk is being filled while each worker sorts another one
+        budget = self.memory_limit // (self.workers + 1) if self.workers > 1 else self.memory_limit
+        chunk, exhausted = self._take(records, budget)
+        if exhausted:
+            chunk.sort(key=self.key)
+            yield from _deduplicate(chunk, self.key, self.keep)
+            return
+
+        with TemporaryDirectory(prefix='external-sort-', dir=self.temp_dir) as run_dir:
+            chunks = self._chunks(chunk, records, budget)
+            del chunk  # Only the chunks generator may reference a chunk, so each can be freed once spilled
+            paths = self._spill_runs(chunks, run_dir)
+            merge_pass = 0
+            while len(paths) > _MAX_MERGE_WIDTH:
+                merge_pass += 1
+                paths = [_write_run(self._merge(paths[i:i + _MAX_MERGE_WIDTH]),
+                                    os.path.join(run_dir, f"merge-{merge_pass}-{i}"))
+                         for i in range(0, len(paths), _MAX_MERGE_WIDTH)]
+            yield from self._merge(paths)
+
+    def sort_file(self, input_path: str, output_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Sorts the records of a file into another file, possibly of a different type.
+
+        The header row of a CSV input is written first to the output, whatever its key.
+
+        Args:
+            input_path (str): The path of the file to sort.
+            output_path (str): The path of the sorted file.
+            chunk_size (int): The size in bytes of the read and write buffers.
+
+        Raises:
+            FileNotFoundError: If the input file does not exist.
+            IOError: If the file read or write fails.
+            ValueError: If the input and output paths are the same file.
+        """
+        if os.path.abspath(input_path) == os.path.abspath(output_path):
+            raise ValueError(f"Cannot sort {input_path} in place; write to another path")
+        factory = FileHandlerFactory()
+        reader = factory.get_handler(factory.get_file_type(input_path), input_path)
+        writer = factory.get_handler(factory.get_file_type(output_path), output_path)
+        rows = self.sort(reader.iter_rows(chunk_size))
+        if isinstance(reader, CSVFileHandler):
+            rows = chain([reader.read_header()], rows)
+        writer.save_iter(rows, chunk_size)
+
+    def _chunks(self, first: List[Any], records: Iterator[Any], budget: int) -> Iterator[List[Any]]:
+        """Yields the first chunk, then chunks of the remaining records that fit the budget."""
+        chunk, first = first, None
+        while chunk:
+            yield chunk
+            chunk = None  # Release the yielded chunk before filling the next one
+            chunk, _ = self._take(records, budget)
+
+    def _spill_runs(self, chunks: Iterator[List[Any]], run_dir: str) -> List[str]:
+        """
+        Sorts each chunk into a run file, in input order.
+
+        Returns:
+            List[str]: The paths of the run files.
+        """
+        def run_path(number: int) -> str:
+            return os.path.join(run_dir, f"run-{number}")
+
+        if self.workers <= 1:
+            paths = []
+            for chunk in chunks:
+                paths.append(_sort_run(chunk, self.key, self.keep, run_path(len(paths))))
+                del chunk
+            return paths
+
+        futures: List[Future] = []
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for chunk in chunks:
+                pending = [future for future in futures if not future.done()]
+                if len(pending) >= self.workers:
+                    wait(pending, return_when=FIRST_COMPLETED)
+                futures.append(executor.submit(_sort_run, chunk, self.key, self.keep, run_path(len(futures))))
+                del chunk
+            return [future.result() for future in futures]
+
+    def _merge(self, paths: List[str]) -> Iterator[Any]:
+        """Merges sorted run files into one sorted, deduplicated stream."""
+        merged = heapq.merge(*(_read_run(path) for path in paths), key=self.key)
+        return _deduplicate(merged, self.key, self.keep)
+
+    @staticmethod
+    def _take(records: Iterator[Any], budget: int) -> Tuple[List[Any], bool]:
+        """
+        Takes records until their estimated size reaches the budget.
+
+        Returns:
+            Tuple[List[Any], bool]: The records taken, and whether the input is exhausted.
+        """
+        chunk = []
+        size = 0
+        for record in records:
+            chunk.append(record)
+            size += _record_size(record)
+            if size >= budget:
+                return chunk, False
+        return chunk, True
@@ -1,8 +1,40 @@
 # data/source/file/file.py
 
-from pathlib import Path
-from typing import Any, List
+import atexit
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import chain, islice
+from queue import Queue
+from threading import Lock, Thread
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from .async_writer import AsyncWriter
+from .column_table import ColumnTable
 from .file_handler_factory import FileHandlerFactory
+from .handlers import AbstractFileHandler, ColbinFileHandler
+from .handlers.abstract_file_handler import DEFAULT_CHUNK_SIZE
+from .file_copier import FileCopier
+from .file_follower import FileFollower
+from .mapped_file import MappedFile
+from .read_cache import ReadCache
+
+_FAN_OUT_BATCH_SIZE = 1024  # Records handed to each writer thread at a time
+_FAN_OUT_QUEUE_SIZE = 8  # Batches buffered per writer thread before the producer blocks
+_END = object()  # Sentinel marking the end of a fan-out queue
+_MAX_COPY_WORKERS = 8  # Concurrent copies when fanning a saved file out to more paths
+
+class ReadResult(NamedTuple):
+    """
+    The outcome of reading one file in a batch.
+
+    Attributes:
+        path (str): The path of the file.
+        data (Any): The data read from the file, or None if the read failed.
+        error (Optional[Exception]): The error raised by the read, or None if it succeeded.
+    """
+    path: str
+    data: Any
+    error: Optional[Exception]
 
 class File:
     """
@@ -10,43 +42,448 @@ class File:
 
     Methods:
         read: Reads data from a specified file path.
+        read_many: Reads data from many file paths concurrently.
+        map: Maps a specified file path into memory.
+        enable_read_cache: Caches the results of read in memory.
+        iter: Yields records from a specified file path one at a time.
+        follow: Reads the records appended to a specified file path since the last call.
         save: Saves data to a list of specified file paths.
+        save_stream: Saves records from an iterable to a list of specified file paths.
+        append: Appends records to the end of a specified file path.
+        save_async: Queues data to be saved to a list of specified file paths in the background.
+        flush: Waits for all queued background saves to complete.
     """
 
+    _async_writer: Optional[AsyncWriter] = None
+    _async_writer_lock = Lock()
+    _read_cache: Optional[ReadCache] = None
+
     @staticmethod
-    def read(file_path: str) -> Any:
+    def read(file_path: str, columnar: bool = False, schema: Optional[Dict[str, type]] = None,
+             memory_map: bool = False, workers: Optional[int] = None, ordered: bool = True,
+             cache: bool = False) -> Any:
         """
         Reads data from the specified file.
 
         Args:
             file_path (str): The path of the file to read from.
+            columnar (bool): If True, returns a ColumnTable of typed columns instead of rows.
+            schema (Optional[Dict[str, type]]): The type of some or all columns for columnar reads.
+            memory_map (bool): If True, parses the file directly from a read-only memory mapping.
+            workers (Optional[int]): If set, parses byte ranges of the file in this many processes.
+            ordered (bool): If False, parallel reads return records in the order their ranges finish.
+            cache (bool): With columnar, also keeps a '.colbin' copy of the table next to the
+                          file and loads that copy, without parsing, while the file is unchanged.
 
         Returns:
             Any: The data read from the file.
 
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            IOError: If the file read fails.
+            NotImplementedError: If the file type does not support the requested read mode.
+            ValueError: If more than one of columnar, memory_map and workers is set, or if
+                        cache is set without columnar.
+        """
+        if sum((columnar, memory_map, workers is not None)) > 1:
+            raise ValueError("Columnar, memory-mapped and parallel reads cannot be combined")
+        if cache and not columnar:
+            raise ValueError("Only columnar reads can be cached")
+
+        def load() -> Any:
+            factory = FileHandlerFactory()
+            handler = factory.get_handler(factory.get_file_type(file_path), file_path)
+            if columnar:
+                if cache:
+                    return File._read_columnar_cached(file_path, handler, schema)
+                return handler.read_columnar(schema)
+            if memory_map:
+                with MappedFile(file_path) as mapped:
+                    return handler.parse_mapped(mapped)
+            if workers is not None:
+                return handler.read_parallel(workers, ordered)
+            return handler.read()
+
+        if File._read_cache is None:
+            return load()
+        schema_key = tuple(sorted((name, column_type.__name__) for name, column_type in schema.items())) if schema else None
+        return File._read_cache.get(file_path, (columnar, schema_key, workers is not None and not ordered), load)
+
+    @staticmethod
+    def enable_read_cache(max_bytes: int = 256 * 1024 * 1024) -> ReadCache:
+        """
+        Puts an in-process LRU cache in front of `read`, replacing any previous one.
+
+        Cached results are revalidated with a single `stat` call per read and reloaded
+        once the file size or modification time changes. Results are shared between
+        callers while cached, so they must not be mutated.
+
+        Args:
+            max_bytes (int): The approximate memory budget of the cache.
+
+        Returns:
+            ReadCache: The cache, whose `metrics` report hits, misses and evictions.
+        """
+        File._read_cache = ReadCache(max_bytes)
+        return File._read_cache
+
+    @staticmethod
+    def disable_read_cache() -> None:
+        """Removes the cache in front of `read` and releases its entries."""
+        File._read_cache = None
+
+    @staticmethod
+    def read_many(file_paths: Iterable[str], max_workers: int = 8, ordered: bool = True,
+                  max_in_flight_bytes: Optional[int] = None, **read_options: Any) -> Iterator[ReadResult]:
+        """
+        Reads many files concurrently from a thread pool.
+
+        A failed read does not stop the batch: its error is reported in the result of
+        that file. Memory is bounded by `max_in_flight_bytes`, counted as the on-disk
+        size of the files being read or waiting to be consumed; a single file larger
+        than the limit is still read, on its own.
+
+        Args:
+            file_paths (Iterable[str]): The paths of the files to read.
+            max_workers (int): The number of reader threads.
+            ordered (bool): If True, results follow the order of `file_paths`; otherwise
+                            they are yielded as the reads complete.
+            max_in_flight_bytes (Optional[int]): The limit on bytes read but not yet consumed.
+            **read_options (Any): Options passed to `read` for every file.
+
+        Yields:
+            ReadResult: The path, data and error of each file.
+        """
+        queue = deque(enumerate(file_paths))
+        futures: Dict[Future, Tuple[int, str, int]] = {}
+        completed: Dict[int, Tuple[ReadResult, int]] = {}
+        next_index = 0
+        in_flight = 0
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        def submit_reads() -> None:
+            nonlocal in_flight
+            while queue:
+                index, path_str = queue[0]
+                try:
+                    size = os.path.getsize(path_str)
+                except OSError:
+                    size = 0  # The read reports the error
+                if max_in_flight_bytes is not None and in_flight and in_flight + size > max_in_flight_bytes:
+                    return
+                queue.popleft()
+                in_flight += size
+                futures[executor.submit(File.read, path_str, **read_options)] = (index, path_str, size)
+
+        try:
+            submit_reads()
+            while futures or completed:
+                if ordered and next_index in completed:
+                    result, size = completed.pop(next_index)
+                    next_index += 1
+                    in_flight -= size
+                    submit_reads()
+                    yield result
+                    continue
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, path_str, size = futures.pop(future)
+                    error = future.exception()
+                    result = ReadResult(path_str, None if error else future.result(), error)
+                    if ordered:
+                        completed[index] = (result, size)
+                    else:
+                        in_flight -= size
+                        submit_reads()
+                        yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _read_columnar_cached(file_path: str, handler: AbstractFileHandler,
+                              schema: Optional[Dict[str, type]]) -> ColumnTable:
+        """
+        Loads a columnar table from its '.colbin' cache, converting the file if the cache is stale.
+
+        The cache records the size and modification time of the file it was converted
+        from, and the schema it was converted with; a change to either reconverts the
+        file. Failing to write the cache is not an error.
+
+        Args:
+            file_path (str): The path of the file to read from.
+            handler (AbstractFileHandler): The handler of the file.
+            schema (Optional[Dict[str, type]]): The column types used when converting the file.
+
+        Returns:
+            ColumnTable: The columns of the file.
+        """
+        cache_handler = ColbinFileHandler(f"{file_path}.colbin")
+        stat = os.stat(file_path)
+        source = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                  'schema': ColbinFileHandler.schema_names(schema)}
+        if cache_handler.read_source() == source:
+            return cache_handler.read()
+
+        table = handler.read_columnar(schema)
+        try:
+            cache_handler.save_table(table, stat, schema)
+        except OSError:
+            pass
+        return table
+
+    @staticmethod
+    def map(file_path: str) -> MappedFile:
+        """
+        Maps the specified file into memory for zero-copy access to its bytes.
+
+        The returned MappedFile should be closed, or used as a context manager.
+
+        Args:
+            file_path (str): The path of the file to map.
+
+        Returns:
+            MappedFile: A read-only view of the file contents.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        return MappedFile(file_path)
+
+    @staticmethod
+    def iter(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+        """
+        Yields records from the specified file one at a time, in constant memory.
+
+        Args:
+            file_path (str): The path of the file to read from.
+            chunk_size (int): The size in bytes of the read buffer.
+
+        Returns:
+            Iterator[Any]: An iterator over the records of the file.
+
         Raises:
             FileNotFoundError: If the file does not exist.
             IOError: If the file read fails.
         """
-        path = Path(file_path)
         factory = FileHandlerFactory()
-        handler = factory.get_handler(path.suffix.lstrip('.'), file_path)
-        return handler.read()
+        handler = factory.get_handler(factory.get_file_type(file_path), file_path)
+        return handler.iter_rows(chunk_size)
+
+    @staticmethod
+    def follow(file_path: str, checkpoint_path: Optional[str] = None) -> FileFollower:
+        """
+        Follows a growing CSV or NDJSON file from the offset saved in a checkpoint.
+
+        Args:
+            file_path (str): The path of the file to follow.
+            checkpoint_path (Optional[str]): The path of the checkpoint file. Defaults to
+                                             the file path followed by `.offset`.
+
+        Returns:
+            FileFollower: A follower whose `poll` returns the records appended since the last call.
+        """
+        return FileFollower(file_path, checkpoint_path)
 
     @staticmethod
-    def save(data: Any, output_paths: List[str]) -> None:
+    def save(data: Any, output_paths: List[str], compression_level: Optional[int] = None) -> None:
         """
         Saves data to the specified file paths.
 
+        The data is serialized once per file type, to the first path of that type,
+        and the result is copied to the remaining paths of the same type.
+
         Args:
             data (Any): The data to be saved.
             output_paths (List[str]): The file paths to save the data to.
+            compression_level (Optional[int]): The level for compressed paths such as '.csv.gz'.
 
         Raises:
             IOError: If the file write fails.
         """
+        paths_by_type = File._group_by_type(output_paths)
+        factory = FileHandlerFactory(compression_level)
+        for file_type, paths in paths_by_type.items():
+            handler = factory.get_handler(file_type, paths[0])
+            handler.save(data)
+        File._copy_to_remaining_paths(paths_by_type)
+
+    @staticmethod
+    def save_stream(rows: Iterable[Any], output_paths: List[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    compression_level: Optional[int] = None) -> None:
+        """
+        Saves records from an iterable to the specified file paths, in constant memory.
+
+        The iterable is consumed only once. Like `save`, each file type is serialized a
+        single time; different file types are written concurrently from the same stream.
+
+        Args:
+            rows (Iterable[Any]): The records to be saved.
+            output_paths (List[str]): The file paths to save the records to.
+            chunk_size (int): The size in bytes of the write buffers.
+            compression_level (Optional[int]): The level for compressed paths such as '.csv.gz'.
+
+        Raises:
+            IOError: If the file write fails.
+        """
+        paths_by_type = File._group_by_type(output_paths)
+        if not paths_by_type:
+            return
+
+        factory = FileHandlerFactory(compression_level)
+        handlers = [factory.get_handler(file_type, paths[0]) for file_type, paths in paths_by_type.items()]
+        if len(handlers) == 1:
+            handlers[0].save_iter(rows, chunk_size)
+        else:
+            File._fan_out(rows, handlers, chunk_size)
+
+        File._copy_to_remaining_paths(paths_by_type)
+
+    @staticmethod
+    def append(records: Iterable[Any], file_path: str, **options: Any) -> None:
+        """
+        Appends records to the end of the specified file, creating it if needed.
+
+        Args:
+            records (Iterable[Any]): The records to be appended.
+            file_path (str): The path of the file to append to.
+            **options (Any): Handler specific options, such as `header` for CSV files.
+
+        Raises:
+            IOError: If the file write fails.
+            NotImplementedError: If the file type does not support appending.
+        """
         factory = FileHandlerFactory()
+        handler = factory.get_handler(factory.get_file_type(file_path), file_path)
+        handler.append(records, **options)
+
+    @staticmethod
+    def save_async(data: Any, output_paths: List[str]) -> Future:
+        """
+        Queues data to be saved to the specified file paths by background writer threads.
+
+        Consecutive saves to the same path that are still queued are coalesced, so only
+        the latest payload is written. Queued saves are drained at interpreter exit.
+
+        Args:
+            data (Any): The data to be saved. It must not be mutated until the save completes.
+            output_paths (List[str]): The file paths to save the data to.
+
+        Returns:
+            Future: Resolves once the data is saved to every path, or to the first write error.
+        """
+        writer = File.async_writer()
+        return AsyncWriter.gather([writer.submit(data, path_str) for path_str in output_paths])
+
+    @staticmethod
+    def flush() -> None:
+        """Blocks until all saves queued with `save_async` have completed."""
+        if File._async_writer is not None:
+            File._async_writer.flush()
+
+    @staticmethod
+    def async_writer() -> AsyncWriter:
+        """
+        Returns the shared background writer used by `save_async`, creating it on first use.
+
+        Returns:
+            AsyncWriter: The shared writer, whose `metrics` report queue depth and write latency.
+        """
+        with File._async_writer_lock:
+            if File._async_writer is None:
+                File._async_writer = AsyncWriter(lambda data, path_str: File.save(data, [path_str]))
+                atexit.register(File._async_writer.shutdown)
+            return File._async_writer
+
+    @staticmethod
+    def _group_by_type(output_paths: List[str]) -> Dict[str, List[str]]:
+        """
+        Groups file paths by file type, preserving their order and dropping repeated paths.
+
+        Args:
+            output_paths (List[str]): The file paths to group.
+
+        Returns:
+            Dict[str, List[str]]: The paths of each file type, keyed by file type.
+        """
+        paths_by_type: Dict[str, List[str]] = {}
+        seen = set()
         for path_str in output_paths:
-            path = Path(path_str)
-            handler = factory.get_handler(path.suffix.lstrip('.'), path_str)
-            handler.save(data)
+            resolved = os.path.abspath(path_str)
+            if resolved not in seen:  # Copying a file onto itself would truncate it
+                seen.add(resolved)
+                paths_by_type.setdefault(FileHandlerFactory.get_file_type(path_str), []).append(path_str)
+        return paths_by_type
+
+    @staticmethod
+    def _copy_to_remaining_paths(paths_by_type: Dict[str, List[str]]) -> None:
+        """
+        Copies the first file of each type to the other paths of that type, concurrently.
+
+        Args:
+            paths_by_type (Dict[str, List[str]]): The paths of each file type; the first
+                                                  path of each type is already written.
+
+        Raises:
+            IOError: If any of the copies fails.
+        """
+        copies = [(paths[0], path_str) for paths in paths_by_type.values() for path_str in paths[1:]]
+        if not copies:
+            return
+        copier = FileCopier()
+        with ThreadPoolExecutor(max_workers=min(len(copies), _MAX_COPY_WORKERS)) as executor:
+            for future in [executor.submit(copier.copy, source, destination) for source, destination in copies]:
+                future.result()
+
+    @staticmethod
+    def _fan_out(rows: Iterable[Any], handlers: List[AbstractFileHandler], chunk_size: int) -> None:
+        """
+        Feeds the records of a single iterable to several handlers concurrently.
+
+        Each handler consumes its own bounded queue from a writer thread, so at most
+        `_FAN_OUT_QUEUE_SIZE` batches per handler are held in memory at any time.
+
+        Args:
+            rows (Iterable[Any]): The records to be saved.
+            handlers (List[AbstractFileHandler]): The handlers to save the records with.
+            chunk_size (int): The size in bytes of the write buffers.
+
+        Raises:
+            IOError: If any of the file writes fails.
+        """
+        queues = [Queue(maxsize=_FAN_OUT_QUEUE_SIZE) for _ in handlers]
+        errors: List[Exception] = []
+
+        def consume(handler: AbstractFileHandler, queue: Queue) -> None:
+            ended = False
+
+            def batches() -> Iterator[List[Any]]:
+                nonlocal ended
+                yield from iter(queue.get, _END)
+                ended = True
+
+            try:
+                handler.save_iter(chain.from_iterable(batches()), chunk_size)
+            except Exception as e:
+                errors.append(e)
+                while not ended and queue.get() is not _END:  # Keep draining so the producer never blocks
+                    pass
+
+        threads = [Thread(target=consume, args=(handler, queue), daemon=True)
+                   for handler, queue in zip(handlers, queues)]
+        for thread in threads:
+            thread.start()
+
+        iterator = iter(rows)
+        try:
+            for batch in iter(lambda: list(islice(iterator, _FAN_OUT_BATCH_SIZE)), []):
+                for queue in queues:
+                    queue.put(batch)
+        finally:
+            for queue in queues:
+                queue.put(_END)
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
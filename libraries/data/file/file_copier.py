@@ -0,0 +1,141 @@
+import errno
+import os
+import shutil
+from typing import Optional, Sequence
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+STRATEGIES = ('reflink', 'copy_file_range', 'sendfile')  # In-kernel mechanisms, fastest first
+_FICLONE = 0x40049409  # ioctl request that clones a file's extents (Linux, e.g. Btrfs and XFS)
+_BUFFER_SIZE = 8 * 1024 * 1024  # Buffer size of the user-space fallback copy
+_UNSUPPORTED_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF,
+                       errno.ENOTTY}
+_LINK_UNSUPPORTED_ERRNOS = {errno.EPERM, errno.EXDEV, errno.EMLINK, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+class FileCopier:
+    """
+    Copies files using the fastest mechanism the platform and filesystem support.
+
+    A reflink clone is tried first, which shares the data blocks of the source until
+    either file is modified; then the in-kernel copies (`os.copy_file_range`, then
+    `os.sendfile`), so the data never passes through user space; a large-buffer copy is
+    the fallback.
+
+    Attributes:
+        strategies (Sequence[str]): The in-kernel mechanisms to try, in order.
+    """
+
+    def __init__(self, strategies: Optional[Sequence[str]] = None) -> None:
+        """
+        Initializes the copier.
+
+        Args:
+            strategies (Optional[Sequence[str]]): The in-kernel mechanisms to try, in order,
+                among 'reflink', 'copy_file_range' and 'sendfile'. Defaults to all of them.
+
+        Raises:
+            ValueError: If a strategy is unknown.
+        """
+        self.strategies = tuple(STRATEGIES if strategies is None else strategies)
+        unknown = set(self.strategies) - set(STRATEGIES)
+        if unknown:
+            raise ValueError(f"Unknown copy strategies: {sorted(unknown)}")
+
+    def copy(self, source: str, destination: str, hardlink: bool = False) -> str:
+        """
+        Copies the contents of a file, replacing the destination if it exists.
+
+        Args:
+            source (str): The path of the file to copy.
+            destination (str): The path to copy the file to.
+            hardlink (bool): If True, the destination is made a hardlink to the source where
+                             the filesystem allows it. Only suitable for files that are never
+                             modified in place, as both paths then share the same data.
+
+        Returns:
+            str: The name of the mechanism that performed the copy: 'hardlink', 'reflink',
+                 'copy_file_range', 'sendfile' or 'buffered'.
+
+        Raises:
+            FileNotFoundError: If the source file does not exist.
+            IOError: If the copy fails.
+        """
+        if hardlink and self._hardlink(source, destination):
+            return 'hardlink'
+        with open(source, mode='rb') as source_file, open(destination, mode='wb') as destination_file:
+            size = os.fstat(source_file.fileno()).st_size
+            for strategy in self.strategies:
+                if getattr(self, f"_{strategy}")(source_file.fileno(), destination_file.fileno(), size):
+                    return strategy
+            shutil.copyfileobj(source_file, destination_file, _BUFFER_SIZE)
+            return 'buffered'
+
+    @staticmethod
+    def _hardlink(source: str, destination: str) -> bool:
+        """Replaces the destination with a hardlink to the source; returns False if unsupported."""
+        temp_path = f"{destination}.link-{os.getpid()}"
+        try:
+            os.link(source, temp_path)
+        except OSError as e:
+            if e.errno in _LINK_UNSUPPORTED_ERRNOS:
+                return False
+            raise
+        os.replace(temp_path, destination)
+        return True
+
+    @staticmethod
+    def _reflink(source_fd: int, destination_fd: int, size: int) -> bool:
+        """Clones the source with the FICLONE ioctl; returns False if the filesystem cannot."""
+        if fcntl is None or not hasattr(fcntl, 'ioctl'):
+            return False
+        try:
+            fcntl.ioctl(destination_fd, _FICLONE, source_fd)
+        except OSError as e:
+            if e.errno in _UNSUPPORTED_ERRNOS:
+                return False
+            raise
+        return True
+
+    def _copy_file_range(self, source_fd: int, destination_fd: int, size: int) -> bool:
+        """Copies with os.copy_file_range; returns False if it is unavailable for these files."""
+        if not hasattr(os, 'copy_file_range'):
+            return False
+        return self._copy_in_kernel(lambda offset: os.copy_file_range(
+            source_fd, destination_fd, size - offset, offset, offset), size)
+
+    def _sendfile(self, source_fd: int, destination_fd: int, size: int) -> bool:
+        """Copies with os.sendfile; returns False if it is unavailable for these files."""
+        if not hasattr(os, 'sendfile'):
+            return False
+        return self._copy_in_kernel(lambda offset: os.sendfile(destination_fd, source_fd, offset, size - offset), size)
+
+    @staticmethod
+    def _copy_in_kernel(copy_from, size: int) -> bool:
+        """
+        Runs an in-kernel copy call until `size` bytes are copied.
+
+        Args:
+            copy_from (Callable[[int], int]): Copies from the given offset and returns the bytes copied.
+            size (int): The number of bytes to copy.
+
+        Returns:
+            bool: False if the mechanism is not supported before anything was copied.
+
+        Raises:
+            IOError: If the copy fails part way through.
+        """
+        copied = 0
+        while copied < size:
+            try:
+                count = copy_from(copied)
+            except OSError as e:
+                if copied == 0 and e.errno in _UNSUPPORTED_ERRNOS:
+                    return False
+                raise
+            if count == 0:  # The source shrank while being copied
+                break
+            copied += count
+        return True
@@ -0,0 +1,80 @@
+import json
+import os
+from typing import Any, List, Optional
+from .file_handler_factory import FileHandlerFactory
+from .mapped_file import MappedFile
+
+class FileFollower:
+    """
+    Reads the records appended to a growing CSV or NDJSON file since the previous call.
+
+    The byte offset after the last consumed record is persisted in a checkpoint file,
+    so a follower created after a restart resumes where the previous one stopped and
+    each call only parses the bytes added in between. Only complete records are
+    consumed: a line still being written is left for the next call. If the file
+    shrinks or is replaced by a new one, it is read again from the start.
+
+    Attributes:
+        file_path (str): The path of the followed file.
+        checkpoint_path (str): The path of the checkpoint file.
+        offset (int): The offset after the last consumed record.
+    """
+
+    def __init__(self, file_path: str, checkpoint_path: Optional[str] = None) -> None:
+        """
+        Initializes the follower, resuming from the checkpoint if there is one.
+
+        Args:
+            file_path (str): The path of the CSV or NDJSON file to follow.
+            checkpoint_path (Optional[str]): The path of the checkpoint file. Defaults to
+                                             the file path followed by `.offset`.
+
+        Raises:
+            ValueError: If the file type is not supported.
+        """
+        self.file_path = file_path
+        self.checkpoint_path = checkpoint_path or f"{file_path}.offset"
+        self._handler = FileHandlerFactory().get_handler(FileHandlerFactory.get_file_type(file_path), file_path)
+        self.offset, self._inode = self._load_checkpoint()
+
+    def poll(self) -> List[Any]:
+        """
+        Reads the complete records appended since the previous call and advances the checkpoint.
+
+        The header row of a CSV file is skipped.
+
+        Returns:
+            List[Any]: The new records, or an empty list if there are none.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is compressed, or a record cannot be parsed.
+        """
+        stat = os.stat(self.file_path)
+        if stat.st_ino != self._inode or stat.st_size < self.offset:
+            self.offset, self._inode = 0, stat.st_ino
+
+        with MappedFile(self.file_path) as mapped:
+            end = self._handler.record_end(mapped, self.offset)
+            records = self._handler.parse_mapped(mapped, self.offset, end) if end > self.offset else []
+
+        if end != self.offset:
+            self.offset = end
+            self._save_checkpoint()
+        return records
+
+    def _load_checkpoint(self) -> tuple:
+        """Loads the offset and inode from the checkpoint file, or starts from the beginning."""
+        try:
+            with open(self.checkpoint_path, mode='r', encoding='utf-8') as file:
+                checkpoint = json.load(file)
+            return checkpoint['offset'], checkpoint['inode']
+        except (OSError, ValueError, KeyError):
+            return 0, None
+
+    def _save_checkpoint(self) -> None:
+        """Writes the offset and inode to the checkpoint file, atomically replacing the previous one."""
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, mode='w', encoding='utf-8') as file:
+            json.dump({'offset': self.offset, 'inode': self._inode}, file)
+        os.replace(temp_path, self.checkpoint_path)
@@ -1,29 +1,62 @@
-from typing import Dict, Type
-from .handlers import AbstractFileHandler, JSONFileHandler, CSVFileHandler
+from pathlib import Path
+from typing import Dict, Optional, Type
+from .compression import CODECS
+from .handlers import AbstractFileHandler, JSONFileHandler, CSVFileHandler, NDJSONFileHandler, ColbinFileHandler
 
 class FileHandlerFactory:
     """
     A factory for creating file handlers based on the file type.
 
+    File types may carry a compression suffix (e.g. 'csv.gz', 'json.xz'), in which case
+    the handler for the inner type reads and writes through the matching codec.
+
     Attributes:
         handlers (Dict[str, Type[AbstractFileHandler]]): A dictionary mapping file extensions 
                                                          to file handler classes.
+        compression_level (Optional[int]): The compression level of compressed writes,
+                                           or None for each codec's default.
     """
 
-    def __init__(self) -> None:
-        """Initializes the FileHandlerFactory with a mapping of file types to handlers."""
+    def __init__(self, compression_level: Optional[int] = None) -> None:
+        """
+        Initializes the FileHandlerFactory with a mapping of file types to handlers.
+
+        Args:
+            compression_level (Optional[int]): The compression level of compressed writes.
+        """
+        self.compression_level = compression_level
         self.handlers: Dict[str, Type[AbstractFileHandler]] = {
             'json': JSONFileHandler,
             'csv': CSVFileHandler,
+            'jsonl': NDJSONFileHandler,
+            'ndjson': NDJSONFileHandler,
+            'colbin': ColbinFileHandler,
             # Add more file types and their corresponding handlers here
         }
 
+    @staticmethod
+    def get_file_type(filename: str) -> str:
+        """
+        Gets the file type of a path from its suffixes.
+
+        Args:
+            filename (str): The name of the file.
+
+        Returns:
+            str: The last suffix without its dot (e.g. 'csv'), or the last two when the
+                 last one is a compression suffix (e.g. 'csv.gz').
+        """
+        suffixes = Path(filename).suffixes
+        if len(suffixes) >= 2 and suffixes[-1].lstrip('.') in CODECS:
+            return ''.join(suffixes[-2:]).lstrip('.')
+        return Path(filename).suffix.lstrip('.')
+
     def get_handler(self, file_type: str, filename: str) -> AbstractFileHandler:
         """
         Gets a file handler based on the file type.
 
         Args:
-            file_type (str): The type of the file (e.g., 'json', 'csv').
+            file_type (str): The type of the file (e.g., 'json', 'csv', 'csv.gz').
             filename (str): The name of the file.
 
         Returns:
@@ -32,6 +65,11 @@ class FileHandlerFactory:
         Raises:
             ValueError: If the file type is not supported.
         """
+        base_type, _, codec_suffix = file_type.rpartition('.')
+        if base_type and codec_suffix in CODECS:
+            handler_class = self.handlers.get(base_type)
+            if handler_class:
+                return handler_class(filename, CODECS[codec_suffix], self.compression_level)
         handler_class = self.handlers.get(file_type)
         if handler_class:
             return handler_class(filename)
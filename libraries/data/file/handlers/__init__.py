@@ -0,0 +1,5 @@
+from .abstract_file_handler import AbstractFileHandler
+from .csv_handler import CSVFileHandler
+from .json_handler import JSONFileHandler
+from .ndjson_handler import NDJSONFileHandler
+from .colbin_handler import ColbinFileHandler
@@ -1,5 +1,47 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Optional
+from ..compression import CompressionCodec
+from ..mapped_file import MappedFile
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # I/O buffer size in bytes used by the streaming methods
+
+class RecordWriter:
+    """
+    An open file that records are written to one at a time.
+
+    Attributes:
+        file (IO): The underlying buffered file object.
+    """
+
+    def __init__(self, file: IO, write: Callable[[Any], None]) -> None:
+        """
+        Initializes the writer.
+
+        Args:
+            file (IO): The open file.
+            write (Callable[[Any], None]): Serializes one record to the file.
+        """
+        self.file = file
+        self.write = write
+
+    def write_all(self, records: Iterable[Any]) -> None:
+        """Writes every record of an iterable."""
+        for record in records:
+            self.write(record)
+
+    def flush(self) -> None:
+        """Flushes the write buffer to the operating system."""
+        self.file.flush()
+
+    def close(self) -> None:
+        """Flushes and closes the file."""
+        self.file.close()
+
+    def __enter__(self) -> 'RecordWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
 class AbstractFileHandler(ABC):
     """
@@ -10,16 +52,53 @@ class AbstractFileHandler(ABC):
 
     Attributes:
         filename (str): The name of the file to be handled.
+        codec (Optional[CompressionCodec]): The codec the file is compressed with, if any.
+        compression_level (Optional[int]): The compression level used when writing.
     """
 
-    def __init__(self, filename: str) -> None:
+    def __init__(self, filename: str, codec: Optional[CompressionCodec] = None,
+                 compression_level: Optional[int] = None) -> None:
         """
         Initializes the file handler with a filename.
 
         Args:
             filename (str): The name of the file to be handled.
+            codec (Optional[CompressionCodec]): The codec the file is compressed with, if any.
+            compression_level (Optional[int]): The compression level used when writing.
         """
         self.filename = filename
+        self.codec = codec
+        self.compression_level = compression_level
+
+    def _open(self, mode: str, **kwargs) -> IO:
+        """
+        Opens the file, streaming through the compression codec if there is one.
+
+        Args:
+            mode (str): The file mode, as for the built-in `open`.
+            **kwargs: Further arguments of the built-in `open`; `buffering` only applies
+                      to uncompressed files.
+
+        Returns:
+            IO: The open file object.
+        """
+        if self.codec is None:
+            return open(self.filename, mode, **kwargs)
+        kwargs.pop('buffering', None)
+        return self.codec.open(self.filename, mode, self.compression_level, **kwargs)
+
+    def _require_uncompressed(self, operation: str) -> None:
+        """
+        Rejects operations that need random access to the raw bytes of the file.
+
+        Args:
+            operation (str): A description of the operation, for the error message.
+
+        Raises:
+            ValueError: If the file is compressed.
+        """
+        if self.codec is not None:
+            raise ValueError(f"{operation} is not supported on {self.codec.name}-compressed file {self.filename}")
 
     @abstractmethod
     def read(self) -> Any:
@@ -47,3 +126,131 @@ class AbstractFileHandler(ABC):
             IOError: If the file write fails.
         """
         pass
+
+    def iter_rows(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+        """
+        Yields the records of a file one at a time.
+
+        The default implementation falls back to `read()`; handlers that can parse
+        incrementally override it so that memory use does not depend on the file size.
+
+        Args:
+            chunk_size (int): The size in bytes of the read buffer.
+
+        Yields:
+            Any: The next record read from the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            IOError: If the file read fails.
+        """
+        yield from self.read()
+
+    def save_iter(self, rows: Iterable[Any], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Saves the records of an iterable to a file.
+
+        The default implementation collects the records and calls `save()`; handlers
+        that can serialize incrementally override it to write in buffered chunks.
+
+        Args:
+            rows (Iterable[Any]): The records to be saved.
+            chunk_size (int): The size in bytes of the write buffer.
+
+        Raises:
+            IOError: If the file write fails.
+        """
+        self.save(list(rows))
+
+    def append(self, records: Iterable[Any]) -> None:
+        """
+        Appends records to the end of a file without rewriting its existing contents.
+
+        Args:
+            records (Iterable[Any]): The records to be appended.
+
+        Raises:
+            NotImplementedError: If the handler does not support appending.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support appending")
+
+    def open_writer(self, append: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE) -> RecordWriter:
+        """
+        Opens the file for writing records one at a time, keeping it open between records.
+
+        Args:
+            append (bool): If True, records are added after the existing contents; otherwise
+                           the file is replaced.
+            chunk_size (int): The size in bytes of the write buffer.
+
+        Returns:
+            RecordWriter: The open writer, to be closed by the caller.
+
+        Raises:
+            NotImplementedError: If the handler cannot write records one at a time.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support writing records one at a time")
+
+    def read_columnar(self, schema: Optional[Dict[str, type]] = None) -> Any:
+        """
+        Reads data from a file into a table of typed columns.
+
+        Args:
+            schema (Optional[Dict[str, type]]): The type of some or all columns; the rest are inferred.
+
+        Returns:
+            ColumnTable: The columns read from the file.
+
+        Raises:
+            NotImplementedError: If the handler does not support columnar reads.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support columnar reads")
+
+    def parse_mapped(self, mapped: MappedFile, start: int = 0, stop: Optional[int] = None) -> Any:
+        """
+        Parses data directly from a byte range of a memory-mapped file.
+
+        Args:
+            mapped (MappedFile): The memory-mapped file to parse.
+            start (int): The offset of the first byte to parse.
+            stop (Optional[int]): The offset after the last byte to parse. Defaults to the end of the file.
+
+        Returns:
+            Any: The data parsed from the byte range.
+
+        Raises:
+            NotImplementedError: If the handler does not support parsing memory-mapped files.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support memory-mapped reads")
+
+    def record_end(self, mapped: MappedFile, start: int = 0) -> int:
+        """
+        Finds where the last complete record after an offset of a memory-mapped file ends.
+
+        Args:
+            mapped (MappedFile): The memory-mapped file.
+            start (int): The offset of a record boundary to search from.
+
+        Returns:
+            int: The offset after the last complete record, or `start` if there is none.
+
+        Raises:
+            NotImplementedError: If the handler does not store one record per line.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support following appended records")
+
+    def read_parallel(self, workers: int, ordered: bool = True) -> Any:
+        """
+        Reads data from a file, parsing parts of it in parallel processes.
+
+        Args:
+            workers (int): The number of worker processes.
+            ordered (bool): If False, records may be returned in the order their parts finish.
+
+        Returns:
+            Any: The data read from the file.
+
+        Raises:
+            NotImplementedError: If the handler does not support parallel reads.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support parallel reads")
@@ -0,0 +1,290 @@
+import json
+import os
+import struct
+import sys
+from array import array
+from collections import abc
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+from .abstract_file_handler import AbstractFileHandler, DEFAULT_CHUNK_SIZE
+from ..column_table import ColumnTable, np
+from ..mapped_file import MappedFile
+
+_MAGIC = b'COLBIN01'
+_PREAMBLE = struct.Struct('<8sQ')  # magic, header length
+_ALIGNMENT = 8
+_TYPE_NAMES = {int: 'int', float: 'float', str: 'str'}
+_TYPES = {name: column_type for column_type, name in _TYPE_NAMES.items()}
+_FORMATS = {int: ('q', '<i8'), float: ('d', '<f8')}  # array.array type code and NumPy dtype
+
+def _padding(size: int) -> int:
+    """Returns the number of bytes that align `size` to the next multiple of `_ALIGNMENT`."""
+    return -size % _ALIGNMENT
+
+class MappedStringColumn(abc.Sequence):
+    """
+    A text column read lazily from a memory-mapped `.colbin` file.
+
+    Values are stored as one UTF-8 blob plus the offset of each value within it, and
+    are only decoded when accessed.
+    """
+
+    def __init__(self, offsets: Sequence[int], data: memoryview) -> None:
+        """
+        Initializes the column over already mapped buffers.
+
+        Args:
+            offsets (Sequence[int]): The start offset of each value, followed by the end of the last one.
+            data (memoryview): The concatenated UTF-8 encoded values.
+        """
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("column index out of range")
+        return str(self._data[self._offsets[index]:self._offsets[index + 1]], 'utf-8')
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the size in bytes of the encoded values."""
+        return len(self._data)
+
+class ColbinFileHandler(AbstractFileHandler):
+    """
+    Handles the `.colbin` binary columnar cache format.
+
+    A `.colbin` file stores the typed columns of a ColumnTable as contiguous
+    little-endian buffers after a small JSON header, so loading it only maps the file
+    into memory: numeric columns are exposed in place and text columns are decoded
+    lazily, without any parsing.
+
+    Layout: magic, header length, JSON header, then each column's buffers, all
+    aligned to 8 bytes. The header records the column names, types and buffer
+    offsets, and optionally the size and modification time of the file the table was
+    converted from, which lets it serve as a cache of that file.
+    """
+
+    def read(self) -> ColumnTable:
+        """
+        Loads the table by memory-mapping the file.
+
+        The returned columns borrow the mapping, which stays open while they are referenced.
+
+        Returns:
+            ColumnTable: The stored table.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not a `.colbin` file, or is compressed.
+        """
+        self._require_uncompressed("Memory-mapped loading")
+        mapped = MappedFile(self.filename)
+        header, data_start = self._parse_header(mapped.buffer)
+        rows = header['rows']
+        names, types, columns = [], {}, {}
+        for column in header['columns']:
+            column_type = _TYPES[column['type']]
+            start = data_start + column['offset']
+            if column_type is str:
+                offsets = self._numeric_column(mapped.buffer, int, start, rows + 1)
+                data = mapped.slice(start + column['data_offset'], start + column['data_offset'] + column['data_length'])
+                values = MappedStringColumn(offsets, data)
+            else:
+                values = self._numeric_column(mapped.buffer, column_type, start, rows)
+            names.append(column['name'])
+            types[column['name']] = column_type
+            columns[column['name']] = values
+        return ColumnTable(names, types, columns, source=mapped)
+
+    def read_columnar(self, schema: Optional[Dict[str, type]] = None) -> ColumnTable:
+        """
+        Loads the table by memory-mapping the file; the stored column types are used as is.
+
+        Args:
+            schema (Optional[Dict[str, type]]): Ignored; kept for interface compatibility.
+
+        Returns:
+            ColumnTable: The stored table.
+        """
+        return self.read()
+
+    def read_source(self) -> Optional[Dict[str, Any]]:
+        """
+        Reads which file the table was converted from, without loading the columns.
+
+        Returns:
+            Optional[Dict[str, Any]]: The 'size' and 'mtime_ns' of the source file and the
+                                      'schema' it was converted with, or None if the file is
+                                      missing, unreadable or has no source.
+        """
+        try:
+            with open(self.filename, mode='rb') as file:
+                magic, length = _PREAMBLE.unpack(file.read(_PREAMBLE.size))
+                if magic != _MAGIC:
+                    return None
+                return json.loads(file.read(length)).get('source')
+        except (OSError, struct.error, ValueError):
+            return None
+
+    def save(self, data: Union[ColumnTable, List[List[Any]]]) -> None:
+        """
+        Saves a table to the file.
+
+        Rows are typed from the text of their values, as with `save_iter`, so a column
+        holding floats is never narrowed to int.
+
+        Args:
+            data (Union[ColumnTable, List[List[Any]]]): A table, or rows whose first row is the header.
+
+        Raises:
+            IOError: If the file write fails.
+        """
+        if isinstance(data, ColumnTable):
+            self.save_table(data)
+        else:
+            self.save_iter(data)
+
+    def iter_rows(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[tuple]:
+        """
+        Yields the rows of the stored table as tuples.
+
+        Args:
+            chunk_size (int): Unused; the file is memory-mapped.
+
+        Yields:
+            tuple: The next row.
+        """
+        yield from self.read()
+
+    def save_iter(self, rows: Iterable[List[Any]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Saves rows from any iterable, whose first row is the header, as a table.
+
+        The rows are converted to compact typed columns as they are consumed.
+
+        Args:
+            rows (Iterable[List[Any]]): The header row followed by the data rows.
+            chunk_size (int): Unused; columns are written whole.
+
+        Raises:
+            IOError: If the file write fails.
+        """
+        rows = iter(rows)
+        self.save_table(ColumnTable.from_rows(next(rows, []), ([str(value) for value in row] for row in rows)))
+
+    def save_table(self, table: ColumnTable, source: Optional[os.stat_result] = None,
+                   schema: Optional[Dict[str, type]] = None) -> None:
+        """
+        Saves a table to the file, optionally recording the file it was converted from.
+
+        The file is written under a temporary name and then renamed into place, so
+        tables already loaded from the previous version keep a valid mapping.
+
+        Args:
+            table (ColumnTable): The table to save.
+            source (Optional[os.stat_result]): The stat of the source file, for cache validation.
+            schema (Optional[Dict[str, type]]): The column types the source file was converted
+                                                with, recorded along with its stat.
+
+        Raises:
+            IOError: If the file write fails.
+        """
+        blocks: List[bytes] = []
+        columns = []
+        offset = 0
+        for name in table.names:
+            column_type = table.types[name]
+            values = table[name]
+            entry = {'name': name, 'type': _TYPE_NAMES[column_type], 'offset': offset}
+            if column_type is str:
+                encoded = [value.encode('utf-8') for value in values]
+                offsets = array('q', [0])
+                for value in encoded:
+                    offsets.append(offsets[-1] + len(value))
+                offsets_bytes = self._little_endian(offsets)
+                entry['data_offset'] = len(offsets_bytes) + _padding(len(offsets_bytes))
+                entry['data_length'] = offsets[-1]
+                column_blocks = [offsets_bytes, bytes(_padding(len(offsets_bytes)))] + encoded
+            else:
+                column_blocks = [self._little_endian(values, column_type)]
+            size = sum(len(block) for block in column_blocks)
+            column_blocks.append(bytes(_padding(size)))
+            blocks.extend(column_blocks)
+            offset += size + _padding(size)
+            columns.append(entry)
+
+        header = {'rows': len(table), 'columns': columns}
+        if source is not None:
+            header['source'] = {'size': source.st_size, 'mtime_ns': source.st_mtime_ns,
+                                'schema': self.schema_names(schema)}
+        header_bytes = json.dumps(header).encode('utf-8')
+        header_bytes += b' ' * _padding(_PREAMBLE.size + len(header_bytes))
+
+        temp_handler = ColbinFileHandler(f"{self.filename}.tmp", self.codec, self.compression_level)
+        with temp_handler._open('wb') as file:
+            file.write(_PREAMBLE.pack(_MAGIC, len(header_bytes)))
+            file.write(header_bytes)
+            for block in blocks:
+                file.write(block)
+        os.replace(temp_handler.filename, self.filename)
+
+    @staticmethod
+    def schema_names(schema: Optional[Dict[str, type]]) -> Optional[Dict[str, str]]:
+        """Returns a schema with its types replaced by their names, as recorded in the header."""
+        return {name: _TYPE_NAMES[column_type] for name, column_type in schema.items()} if schema else None
+
+    @staticmethod
+    def _parse_header(buffer: memoryview) -> tuple:
+        """
+        Parses the preamble and JSON header of a mapped `.colbin` file.
+
+        Returns:
+            tuple: The header dictionary and the offset where the column data starts.
+
+        Raises:
+            ValueError: If the buffer does not hold a `.colbin` file.
+        """
+        if len(buffer) < _PREAMBLE.size:
+            raise ValueError("Not a colbin file: too short")
+        magic, length = _PREAMBLE.unpack(buffer[:_PREAMBLE.size])
+        if magic != _MAGIC:
+            raise ValueError("Not a colbin file: bad magic number")
+        data_start = _PREAMBLE.size + length
+        return json.loads(str(buffer[_PREAMBLE.size:data_start], 'utf-8')), data_start
+
+    @staticmethod
+    def _numeric_column(buffer: memoryview, column_type: type, start: int, count: int) -> Sequence:
+        """
+        Exposes a little-endian numeric buffer of the mapping as a column, without copying.
+
+        On big-endian hosts without NumPy, the values are byte-swapped into a copy.
+        """
+        type_code, dtype = _FORMATS[column_type]
+        if np is not None:
+            return np.frombuffer(buffer, dtype=dtype, count=count, offset=start)
+        view = buffer[start:start + count * 8]
+        if sys.byteorder == 'little':
+            return view.cast(type_code)
+        values = array(type_code)
+        values.frombytes(view)
+        values.byteswap()
+        return values
+
+    @staticmethod
+    def _little_endian(values: Sequence, column_type: type = int) -> bytes:
+        """Serializes a numeric column as contiguous little-endian values."""
+        type_code, dtype = _FORMATS[column_type]
+        if np is not None and isinstance(values, np.ndarray):
+            return values.astype(dtype, copy=False).tobytes()
+        values = values if isinstance(values, array) else array(type_code, values)
+        if sys.byteorder == 'big':
+            values = array(type_code, values)
+            values.byteswap()
+        return values.tobytes()
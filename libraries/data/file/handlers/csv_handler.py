@@ -0,0 +1,362 @@
+import csv
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .abstract_file_handler import AbstractFileHandler, DEFAULT_CHUNK_SIZE, RecordWriter
+from ..column_table import ColumnTable
+from ..mapped_file import MappedFile
+from ..row_index import RowIndex
+
+_RANGES_PER_WORKER = 4  # Byte ranges scheduled per worker process, to balance uneven ranges
+_SCAN_BLOCK_SIZE = 4 * 1024 * 1024  # Block size used when counting quotes up to a range boundary
+
+def _parse_range(filename: str, start: int, stop: int) -> List[List[str]]:
+    """
+    Parses the rows within a byte range of a CSV file in a worker process.
+
+    Args:
+        filename (str): The path of the CSV file.
+        start (int): The offset of the first row of the range.
+        stop (int): The offset after the last row of the range.
+
+    Returns:
+        List[List[str]]: The rows within the range.
+    """
+    with MappedFile(filename) as mapped:
+        return CSVFileHandler(filename).parse_mapped(mapped, start, stop)
+
+class CSVFileHandler(AbstractFileHandler):
+    """
+    Handles reading from and writing to CSV files.
+
+    The first row of a CSV file is treated as its header: the read methods skip it,
+    while the save methods write every row they are given, header included.
+    """
+
+    def read(self) -> List[List[str]]:
+        """
+        Reads all data rows from the CSV file.
+
+        Returns:
+            List[List[str]]: The rows of the file, without the header row.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            IOError: If the file read fails.
+        """
+        return list(self.iter_rows())
+
+    def read_header(self) -> List[str]:
+        """
+        Reads the header row of the CSV file.
+
+        Returns:
+            List[str]: The header row, or an empty list if the file is empty.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        with self._open('r', newline='') as file:
+            return next(csv.reader(file), [])
+
+    def read_columnar(self, schema: Optional[Dict[str, type]] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> ColumnTable:
+        """
+        Reads the CSV file into a table of typed columns named after the header row.
+
+        Args:
+            schema (Optional[Dict[str, type]]): The type (int, float or str) of some or all
+                                                columns; the rest are inferred from the data.
+            chunk_size (int): The size in bytes of the read buffer.
+
+        Returns:
+            ColumnTable: The columns of the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            IOError: If the file read fails.
+            ValueError: If a value does not convert to the type given in the schema.
+        """
+        with self._open('r', newline='', buffering=chunk_size) as file:
+            reader = csv.reader(file)
+            return ColumnTable.from_rows(next(reader, []), reader, schema)
+
+    def parse_mapped(self, mapped: MappedFile, start: int = 0, stop: Optional[int] = None) -> List[List[str]]:
+        """
+        Parses the data rows within a byte range of a memory-mapped CSV file.
+
+        Blocks of lines are decoded straight from the mapping, without going through a
+        buffered file object. The range must start at a row boundary; the header row is skipped only
+        when the range starts at the beginning of the file.
+
+        Args:
+            mapped (MappedFile): The memory-mapped CSV file.
+            start (int): The offset of the first row to parse.
+            stop (Optional[int]): The offset after the last row to parse. Defaults to the end of the file.
+
+        Returns:
+            List[List[str]]: The rows within the byte range.
+        """
+        self._require_uncompressed("Memory-mapped parsing")
+        lines = chain.from_iterable(io.StringIO(str(block, 'utf-8'), newline='')
+                                    for block in mapped.iter_blocks(start, stop))
+        reader = csv.reader(lines)
+        if start == 0:
+            next(reader, None)  # Skip the header row
+        return list(reader)
+
+    def row_count(self) -> int:
+        """
+        Counts the data rows of the CSV file using its row index.
+
+        Returns:
+            int: The number of rows, without the header row.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        self._require_uncompressed("Counting rows through the row index")
+        return RowIndex.for_file(self.filename).row_count
+
+    def read_rows(self, start: int, stop: int) -> List[List[str]]:
+        """
+        Reads a slice of the data rows of the CSV file, seeking straight to it.
+
+        The row index is built and stored next to the file on first use, and rebuilt
+        whenever the file size or modification time changes.
+
+        Args:
+            start (int): The zero-based number of the first data row to read.
+            stop (int): The number of the data row to stop before.
+
+        Returns:
+            List[List[str]]: The rows in [start, stop), fewer if the file ends before `stop`.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If start is negative, or the file is compressed.
+        """
+        if start < 0:
+            raise ValueError(f"Row numbers must not be negative, got {start}")
+        self._require_uncompressed("Reading rows through the row index")
+        index = RowIndex.for_file(self.filename)
+        if start >= min(stop, index.row_count):
+            return []
+        offset, skip = index.locate(start)
+        with open(self.filename, mode='rb') as file:
+            file.seek(offset)
+            reader = csv.reader(io.TextIOWrapper(file, newline=''))
+            return list(islice(reader, skip, skip + stop - start))
+
+    def record_end(self, mapped: MappedFile, start: int = 0) -> int:
+        """
+        Finds where the last complete row after an offset of a memory-mapped CSV file ends.
+
+        A row is complete once it ends with a newline outside quoted fields, so a row
+        still being written, or a quoted field spanning several lines, is left out.
+
+        Args:
+            mapped (MappedFile): The memory-mapped CSV file.
+            start (int): The offset of a row boundary to search from.
+
+        Returns:
+            int: The offset after the last complete row, or `start` if there is none.
+        """
+        self._require_uncompressed("Following appended rows")
+        end = start
+        quotes = 0
+        position = start
+        for line in mapped.iter_lines(start):
+            quotes += bytes(line).count(b'"')
+            position += len(line)
+            if quotes % 2 == 0 and line[-1:] == b'\n':
+                end = position
+        return end
+
+    def read_parallel(self, workers: int, ordered: bool = True) -> List[List[str]]:
+        """
+        Reads all data rows of the CSV file, parsing byte ranges in parallel processes.
+
+        Args:
+            workers (int): The number of worker processes.
+            ordered (bool): If False, rows of the ranges that finish first come first.
+
+        Returns:
+            List[List[str]]: The rows of the file, without the header row.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        return list(chain.from_iterable(self.iter_parallel(workers, ordered)))
+
+    def iter_parallel(self, workers: int, ordered: bool = True) -> Iterator[List[List[str]]]:
+        """
+        Parses the CSV file in parallel processes, one byte range at a time.
+
+        The file is split into ranges that end on row boundaries (newlines outside
+        quoted fields), each range is parsed from a memory mapping in a worker
+        process, and the rows of each range are yielded as a batch.
+
+        Args:
+            workers (int): The number of worker processes.
+            ordered (bool): If True, batches are yielded in file order; otherwise as soon
+                            as each range is parsed.
+
+        Yields:
+            List[List[str]]: The rows of the next parsed range.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        self._require_uncompressed("Parallel parsing")
+        ranges = self._split_ranges(workers * _RANGES_PER_WORKER)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_parse_range, self.filename, start, stop) for start, stop in ranges]
+            for future in (futures if ordered else as_completed(futures)):
+                yield future.result()
+
+    def _split_ranges(self, parts: int) -> List[Tuple[int, int]]:
+        """
+        Splits the CSV file into about `parts` byte ranges that end on row boundaries.
+
+        Quotes are counted from the start of the file, so that a newline inside a
+        quoted field is never mistaken for the end of a row.
+
+        Args:
+            parts (int): The number of ranges to aim for.
+
+        Returns:
+            List[Tuple[int, int]]: The (start, stop) offsets of the non-empty ranges, in file order.
+        """
+        size = os.path.getsize(self.filename)
+        boundaries = [0]
+        quotes = 0
+        position = 0
+        with open(self.filename, mode='rb') as file:
+            for part in range(1, parts):
+                target = size * part // parts
+                if target <= position:
+                    continue
+                while position < target:
+                    block = file.read(min(_SCAN_BLOCK_SIZE, target - position))
+                    quotes += block.count(b'"')
+                    position += len(block)
+                while True:  # Move on to the next newline outside quotes
+                    line = file.readline()
+                    quotes += line.count(b'"')
+                    position += len(line)
+                    if not line or (quotes % 2 == 0 and line.endswith(b'\n')):
+                        break
+                boundaries.append(position)
+        boundaries.append(size)
+        return [(start, stop) for start, stop in zip(boundaries, boundaries[1:]) if start < stop]
+
+    def save(self, data: List[List[str]]) -> None:
+        """
+        Saves rows to the CSV file, replacing its contents.
+
+        Args:
+            data (List[List[str]]): The rows to be saved.
+
+        Raises:
+            IOError: If the file write fails.
+        """
+        self.save_iter(data)
+
+    def append(self, records: Iterable[List[str]], header: Optional[List[str]] = None) -> None:
+        """
+        Appends rows to the end of the CSV file without rewriting its existing rows.
+
+        A missing or empty file is created, starting with `header` if one is given. For
+        an existing file, `header` is checked against its header row instead.
+
+        Args:
+            records (Iterable[List[str]]): The rows to be appended.
+            header (Optional[List[str]]): The header row the file should have.
+
+        Raises:
+            IOError: If the file write fails.
+            ValueError: If the header row of the file does not match `header`.
+        """
+        with self.open_writer(header=header) as writer:
+            writer.write_all(records)
+
+    def open_writer(self, append: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    header: Optional[List[str]] = None) -> RecordWriter:
+        """
+        Opens the CSV file for writing rows one at a time, keeping it open between rows.
+
+        A new, empty or replaced file starts with `header` if one is given; when
+        appending to an existing file, `header` is checked against its header row instead.
+
+        Args:
+            append (bool): If True, rows are added after the existing rows; otherwise
+                           the file is replaced.
+            chunk_size (int): The size in bytes of the write buffer.
+            header (Optional[List[str]]): The header row the file should have.
+
+        Returns:
+            RecordWriter: The open writer, to be closed by the caller.
+
+        Raises:
+            IOError: If the file cannot be opened.
+            ValueError: If the header row of the file does not match `header`.
+        """
+        existing = append and os.path.exists(self.filename) and os.path.getsize(self.filename) > 0
+        if existing and header is not None:
+            existing_header = self.read_header()
+            if existing_header != list(header):
+                raise ValueError(f"The header row of {self.filename} is {existing_header}, expected {list(header)}")
+        terminated = not existing or self.codec is not None or self._ends_with_newline()
+
+        file = self._open('a' if append else 'w', newline='', buffering=chunk_size)
+        writer = csv.writer(file)
+        if not terminated:
+            file.write(writer.dialect.lineterminator)
+        if not existing and header is not None:
+            writer.writerow(header)
+        return RecordWriter(file, writer.writerow)
+
+    def _ends_with_newline(self) -> bool:
+        """Checks whether the last row of the uncompressed CSV file is terminated."""
+        with open(self.filename, mode='rb') as file:
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) == b'\n'
+
+    def iter_rows(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[str]]:
+        """
+        Yields the data rows of the CSV file one at a time.
+
+        Args:
+            chunk_size (int): The size in bytes of the read buffer.
+
+        Yields:
+            List[str]: The next row of the file, starting after the header row.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            IOError: If the file read fails.
+        """
+        with self._open('r', newline='', buffering=chunk_size) as file:
+            reader = csv.reader(file)
+            next(reader, None)  # Skip the header row
+            yield from reader
+
+    def save_iter(self, rows: Iterable[List[str]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Saves rows from any iterable to the CSV file, consuming it lazily.
+
+        Rows are accumulated in a write buffer of `chunk_size` bytes and flushed to disk
+        whenever it fills up, so memory use stays constant regardless of the row count.
+
+        Args:
+            rows (Iterable[List[str]]): The rows to be saved.
+            chunk_size (int): The size in bytes of the write buffer.
+
+        Raises:
+            IOError: If the file write fails.
+        """
+        with self._open('w', newline='', buffering=chunk_size) as file:
+            csv.writer(file).writerows(rows)
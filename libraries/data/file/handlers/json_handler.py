@@ -0,0 +1,215 @@
+import json
+import os
+from typing import Any, Iterable, Iterator, Optional
+from .abstract_file_handler import AbstractFileHandler, DEFAULT_CHUNK_SIZE
+from ..mapped_file import MappedFile
+
+_WHITESPACE = ' \t\n\r'
+_NUMBER_START = '-0123456789'
+_NUMBER_END = _WHITESPACE + ',]'  # The characters that can follow an array element
+
+class JSONFileHandler(AbstractFileHandler):
+    """
+    Handles reading from and writing to JSON files.
+
+    A file holds a single JSON document. When that document is an array, its elements
+    can also be read, written and appended one record at a time.
+    """
+
+    def read(self) -> Any:
+        """
+        Reads the JSON document of the file.
+
+        Returns:
+            Any: The decoded document.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            IOError: If the file read fails.
+            ValueError: If the file is not valid JSON.
+        """
+        with self._open('r', encoding='utf-8') as file:
+            return json.load(file)
+
+    def save(self, data: Any) -> None:
+        """
+        Saves data to the file as a JSON document, replacing its contents.
+
+        Args:
+            data (Any): The data to be saved.
+
+        Raises:
+            IOError: If the file write fails.
+        """
+        with self._open('w', encoding='utf-8') as file:
+            json.dump(data, file)
+
+    def iter_rows(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+        """
+        Yields the elements of a top-level JSON array one at a time.
+
+        The file is decoded incrementally, `chunk_size` characters at a time, so only
+        the current element has to fit in memory. A document that is not an array is
+        yielded as a single record.
+
+        Args:
+            chunk_size (int): The number of characters read at a time.
+
+        Yields:
+            Any: The next element of the array.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not valid JSON.
+        """
+        decoder = json.JSONDecoder()
+        with self._open('r', encoding='utf-8') as file:
+            buffer = ''
+            position = 0
+            eof = False
+
+            def fill() -> bool:
+                nonlocal buffer, position, eof
+                chunk = file.read(chunk_size)
+                buffer = buffer[position:] + chunk
+                position = 0
+                eof = not chunk
+                return bool(chunk)
+
+            def skip(characters: str) -> None:
+                nonlocal position
+                while True:
+                    while position < len(buffer) and buffer[position] in characters:
+                        position += 1
+                    if position < len(buffer) or not fill():
+                        return
+
+            skip(_WHITESPACE)
+            if buffer[position:position + 1] != '[':
+                buffer += file.read()
+                yield json.loads(buffer[position:])
+                return
+            position += 1
+            expect_value = True
+
+            while True:
+                skip(_WHITESPACE)
+                if position >= len(buffer):
+                    raise ValueError(f"Unterminated JSON array in {self.filename}")
+                if buffer[position] == ']':
+                    return
+                if not expect_value:
+                    if buffer[position] != ',':
+                        raise ValueError(f"Expected ',' or ']' in the JSON array of {self.filename}")
+                    position += 1
+                    expect_value = True
+                    continue
+                while True:
+                    try:
+                        value, end = decoder.raw_decode(buffer, position)
+                        # A number cut by the end of the chunk decodes as a shorter number ('1.5e3'
+                        # read as '1.' or '1e' gives 1), so it is only complete before a delimiter
+                        if eof or (end < len(buffer) and (buffer[position] not in _NUMBER_START
+                                                          or buffer[end] in _NUMBER_END)):
+                            break
+                    except json.JSONDecodeError:
+                        if eof:
+                            raise
+                    fill()
+                position = end
+                expect_value = False
+                yield value
+
+    def save_iter(self, rows: Iterable[Any], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Saves records from any iterable to the file as a JSON array, consuming it lazily.
+
+        Args:
+            rows (Iterable[Any]): The records to be saved.
+            chunk_size (int): The size in bytes of the write buffer.
+
+        Raises:
+            IOError: If the file write fails.
+        """
+        with self._open('w', encoding='utf-8', buffering=chunk_size) as file:
+            file.write('[')
+            self._write_elements(file, rows, first=True)
+            file.write(']')
+
+    def append(self, records: Iterable[Any]) -> None:
+        """
+        Appends records to the JSON array of the file without rewriting it.
+
+        Only the closing bracket at the end of the file is rewritten. A missing or
+        empty file is created as a new array.
+
+        Args:
+            records (Iterable[Any]): The records to be appended.
+
+        Raises:
+            IOError: If the file write fails.
+            ValueError: If the file does not hold a JSON array, or is compressed.
+        """
+        if not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0:
+            self.save_iter(records)
+            return
+        self._require_uncompressed("Appending to a JSON array")
+
+        with open(self.filename, mode='r+b', buffering=0) as file:
+            closing = self._find_last_non_whitespace(file, file.seek(0, os.SEEK_END))
+            file.seek(closing)
+            if file.read(1) != b']':
+                raise ValueError(f"{self.filename} does not hold a JSON array")
+            previous = self._find_last_non_whitespace(file, closing)
+            file.seek(previous)
+            empty = file.read(1) == b'['
+            file.truncate(closing)
+
+        with self._open('a', encoding='utf-8') as file:
+            self._write_elements(file, records, first=empty)
+            file.write(']')
+
+    def parse_mapped(self, mapped: MappedFile, start: int = 0, stop: Optional[int] = None) -> Any:
+        """
+        Decodes a JSON document directly from a byte range of a memory-mapped file.
+
+        Args:
+            mapped (MappedFile): The memory-mapped JSON file.
+            start (int): The offset of the document.
+            stop (Optional[int]): The offset after the document. Defaults to the end of the file.
+
+        Returns:
+            Any: The decoded document.
+
+        Raises:
+            ValueError: If the byte range is not valid JSON.
+        """
+        self._require_uncompressed("Memory-mapped parsing")
+        return json.loads(str(mapped.slice(start, stop), 'utf-8'))
+
+    @staticmethod
+    def _write_elements(file, records: Iterable[Any], first: bool) -> None:
+        """Writes records as comma-separated array elements, with a leading comma unless first."""
+        for record in records:
+            if not first:
+                file.write(',')
+            json.dump(record, file)
+            first = False
+
+    @staticmethod
+    def _find_last_non_whitespace(file, end: int) -> int:
+        """
+        Finds the offset of the last non-whitespace byte before an offset of a binary file.
+
+        Raises:
+            ValueError: If there is only whitespace before the offset.
+        """
+        position = end
+        while position > 0:
+            step = min(position, 4096)
+            position -= step
+            file.seek(position)
+            block = file.read(step).rstrip(_WHITESPACE.encode())
+            if block:
+                return position + len(block) - 1
+        raise ValueError(f"{file.name} does not hold a JSON array")
@@ -0,0 +1,164 @@
+import json
+import os
+from typing import Any, Iterable, Iterator, List, Optional
+from .abstract_file_handler import AbstractFileHandler, DEFAULT_CHUNK_SIZE, RecordWriter
+from ..mapped_file import MappedFile
+
+class NDJSONFileHandler(AbstractFileHandler):
+    """
+    Handles reading from and writing to NDJSON (JSON Lines) files.
+
+    Each line of the file holds one JSON record, so records can be read, written and
+    appended one at a time without ever holding the whole file in memory. Blank lines
+    are ignored.
+    """
+
+    def read(self) -> List[Any]:
+        """
+        Reads all records from the file.
+
+        Returns:
+            List[Any]: The decoded records.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            IOError: If the file read fails.
+            ValueError: If a line is not valid JSON.
+        """
+        return list(self.iter_rows())
+
+    def save(self, data: Iterable[Any]) -> None:
+        """
+        Saves records to the file, one per line, replacing its contents.
+
+        Args:
+            data (Iterable[Any]): The records to be saved.
+
+        Raises:
+            IOError: If the file write fails.
+        """
+        self.save_iter(data)
+
+    def iter_rows(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+        """
+        Yields the records of the file one line at a time.
+
+        Args:
+            chunk_size (int): The size in bytes of the read buffer.
+
+        Yields:
+            Any: The next decoded record.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If a line is not valid JSON.
+        """
+        with self._open('r', encoding='utf-8', buffering=chunk_size) as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    def save_iter(self, rows: Iterable[Any], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Saves records from any iterable to the file, one per line, consuming it lazily.
+
+        Args:
+            rows (Iterable[Any]): The records to be saved.
+            chunk_size (int): The size in bytes of the write buffer.
+
+        Raises:
+            IOError: If the file write fails.
+        """
+        self._write(rows, 'w', chunk_size)
+
+    def append(self, records: Iterable[Any]) -> None:
+        """
+        Appends records to the end of the file, creating it if needed.
+
+        Compressed files are appended to as a new compressed stream, which the
+        gzip, bz2 and xz codecs all read back transparently. A missing newline at
+        the end of an uncompressed file is added first.
+
+        Args:
+            records (Iterable[Any]): The records to be appended.
+
+        Raises:
+            IOError: If the file write fails.
+        """
+        self._write(records, 'a', DEFAULT_CHUNK_SIZE)
+
+    def open_writer(self, append: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE) -> RecordWriter:
+        """
+        Opens the file for writing records one at a time, keeping it open between records.
+
+        Args:
+            append (bool): If True, records are added after the existing ones; otherwise
+                           the file is replaced.
+            chunk_size (int): The size in bytes of the write buffer.
+
+        Returns:
+            RecordWriter: The open writer, to be closed by the caller.
+
+        Raises:
+            IOError: If the file cannot be opened.
+        """
+        terminated = not append or self.codec is not None or self._ends_with_newline()
+        file = self._open('a' if append else 'w', encoding='utf-8', buffering=chunk_size)
+        if not terminated:
+            file.write('\n')
+
+        def write(record: Any) -> None:
+            file.write(json.dumps(record))
+            file.write('\n')
+
+        return RecordWriter(file, write)
+
+    def parse_mapped(self, mapped: MappedFile, start: int = 0, stop: Optional[int] = None) -> List[Any]:
+        """
+        Decodes the records within a byte range of a memory-mapped NDJSON file.
+
+        Args:
+            mapped (MappedFile): The memory-mapped NDJSON file.
+            start (int): The offset of the first line to decode; must be a line boundary.
+            stop (Optional[int]): The offset to stop at. Defaults to the end of the file.
+
+        Returns:
+            List[Any]: The decoded records.
+
+        Raises:
+            ValueError: If a line is not valid JSON.
+        """
+        self._require_uncompressed("Memory-mapped parsing")
+        lines = (str(line, 'utf-8') for line in mapped.iter_lines(start, stop))
+        return [json.loads(line) for line in lines if line.strip()]
+
+    def record_end(self, mapped: MappedFile, start: int = 0) -> int:
+        """
+        Finds where the last complete line after an offset of a memory-mapped NDJSON file ends.
+
+        Args:
+            mapped (MappedFile): The memory-mapped NDJSON file.
+            start (int): The offset of a line boundary to search from.
+
+        Returns:
+            int: The offset after the last newline, or `start` if there is none.
+        """
+        self._require_uncompressed("Following appended records")
+        newline = mapped.rfind(b'\n', start)
+        return start if newline == -1 else newline + 1
+
+    def _write(self, records: Iterable[Any], mode: str, chunk_size: int) -> None:
+        """Writes records one per line, in the given file mode."""
+        with self.open_writer(append=mode == 'a', chunk_size=chunk_size) as writer:
+            writer.write_all(records)
+
+    def _ends_with_newline(self) -> bool:
+        """Checks whether the uncompressed file is missing, empty or ends with a newline."""
+        try:
+            with open(self.filename, mode='rb') as file:
+                file.seek(-1, os.SEEK_END)
+                return file.read(1) == b'\n'
+        except FileNotFoundError:
+            return True
+        except OSError:  # Empty file, which cannot seek before its start
+            return True
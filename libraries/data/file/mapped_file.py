@@ -0,0 +1,153 @@
+import mmap
+import os
+from typing import Iterator, Optional
+
+class MappedFile:
+    """
+    A read-only, memory-mapped view of a file.
+
+    The file contents are exposed as a `memoryview` over the mapping, so byte ranges
+    can be sliced and parsed without being copied through Python text I/O first;
+    pages are loaded lazily by the operating system as they are touched.
+
+    Slices returned by this class borrow the mapping: release them (or let them go
+    out of scope) before calling `close()`, which otherwise raises BufferError.
+
+    Attributes:
+        file_path (str): The path of the mapped file.
+        buffer (memoryview): A view over the whole file contents.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Opens and maps the file.
+
+        Args:
+            file_path (str): The path of the file to map.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            IOError: If the file cannot be opened or mapped.
+        """
+        self.file_path = file_path
+        self._file = open(file_path, mode='rb')
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            # Empty files cannot be mapped, so they are exposed as an empty buffer instead
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        except Exception:
+            self._file.close()
+            raise
+        self.buffer = memoryview(self._mmap) if self._mmap is not None else memoryview(b'')
+
+    def __len__(self) -> int:
+        """Returns the size of the file in bytes."""
+        return len(self.buffer)
+
+    def slice(self, start: int, stop: Optional[int] = None) -> memoryview:
+        """
+        Returns a zero-copy view of a byte range of the file.
+
+        Args:
+            start (int): The offset of the first byte.
+            stop (Optional[int]): The offset after the last byte. Defaults to the end of the file.
+
+        Returns:
+            memoryview: A view of the requested bytes.
+        """
+        return self.buffer[start:stop]
+
+    def find(self, sub: bytes, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Finds the lowest offset of a byte sequence within a range of the file.
+
+        Args:
+            sub (bytes): The byte sequence to find.
+            start (int): The offset to start searching from.
+            stop (Optional[int]): The offset to stop searching at. Defaults to the end of the file.
+
+        Returns:
+            int: The offset of the first match, or -1 if there is none.
+        """
+        if self._mmap is None:
+            return -1
+        return self._mmap.find(sub, start, len(self) if stop is None else stop)
+
+    def rfind(self, sub: bytes, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Finds the highest offset of a byte sequence within a range of the file.
+
+        Args:
+            sub (bytes): The byte sequence to find.
+            start (int): The offset to start searching from.
+            stop (Optional[int]): The offset to stop searching at. Defaults to the end of the file.
+
+        Returns:
+            int: The offset of the last match, or -1 if there is none.
+        """
+        if self._mmap is None:
+            return -1
+        return self._mmap.rfind(sub, start, len(self) if stop is None else stop)
+
+    def iter_lines(self, start: int = 0, stop: Optional[int] = None) -> Iterator[memoryview]:
+        """
+        Yields zero-copy views of the lines within a byte range of the file.
+
+        Each line keeps its trailing newline; the last line of the range may lack one.
+
+        Args:
+            start (int): The offset of the first line.
+            stop (Optional[int]): The offset to stop at. Defaults to the end of the file.
+
+        Yields:
+            memoryview: A view of the next line.
+        """
+        stop = len(self) if stop is None else stop
+        position = start
+        while position < stop:
+            end = self.find(b'\n', position, stop)
+            end = stop if end == -1 else end + 1
+            yield self.buffer[position:end]
+            position = end
+
+    def iter_blocks(self, start: int = 0, stop: Optional[int] = None,
+                    block_size: int = 1024 * 1024) -> Iterator[memoryview]:
+        """
+        Yields zero-copy views of blocks of whole lines within a byte range of the file.
+
+        Each block spans at least `block_size` bytes and is extended to the end of the
+        line it stops in, which lets parsers decode many lines per call.
+
+        Args:
+            start (int): The offset of the first line.
+            stop (Optional[int]): The offset to stop at. Defaults to the end of the file.
+            block_size (int): The minimum size in bytes of a block.
+
+        Yields:
+            memoryview: A view of the next block.
+        """
+        stop = len(self) if stop is None else stop
+        position = start
+        while position < stop:
+            end = self.find(b'\n', min(position + block_size, stop), stop)
+            end = stop if end == -1 else end + 1
+            yield self.buffer[position:end]
+            position = end
+
+    def close(self) -> None:
+        """
+        Releases the mapping and closes the file.
+
+        Raises:
+            BufferError: If slices of the mapping are still referenced.
+        """
+        self.buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MappedFile':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
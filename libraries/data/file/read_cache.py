@@ -0,0 +1,105 @@
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+class ReadCache:
+    """
+    An in-process LRU cache of parsed file contents, bounded by a byte budget.
+
+    Entries are keyed by the absolute file path and the read options, and are
+    revalidated on every lookup with a single `stat` call: an entry is only served
+    while the file size and modification time match the ones it was loaded with.
+    Cached values are shared between callers and must be treated as read-only.
+
+    Attributes:
+        max_bytes (int): The byte budget; least recently used entries are evicted beyond it.
+    """
+
+    def __init__(self, max_bytes: int, size_estimator: Optional[Callable[[Any, os.stat_result], int]] = None) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_bytes (int): The byte budget of the cache.
+            size_estimator (Optional[Callable[[Any, os.stat_result], int]]): Estimates the memory
+                held by a loaded value. Defaults to the value's `nbytes` if it has one, and to
+                the size of the file on disk otherwise.
+        """
+        self.max_bytes = max_bytes
+        self._size_estimator = size_estimator or self._estimate_size
+        self._entries: 'OrderedDict[Tuple[str, Hashable], Tuple[int, int, Any, int]]' = OrderedDict()
+        self._lock = Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, file_path: str, options: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        Returns the cached contents of a file, loading them on a miss.
+
+        Args:
+            file_path (str): The path of the file.
+            options (Hashable): The read options that shape the loaded value.
+            load (Callable[[], Any]): Reads and parses the file.
+
+        Returns:
+            Any: The parsed contents of the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[:2] == (stat.st_size, stat.st_mtime_ns):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[2]
+            self._misses += 1
+
+        value = load()
+        size = self._size_estimator(value, stat)
+        with self._lock:
+            stale = self._entries.pop(key, None)
+            if stale is not None:
+                self._bytes -= stale[3]
+            if size <= self.max_bytes:
+                self._entries[key] = (stat.st_size, stat.st_mtime_ns, value, size)
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    _, (_, _, _, evicted_size) = self._entries.popitem(last=False)
+                    self._bytes -= evicted_size
+                    self._evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Drops every entry; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """
+        Reports the cache usage.
+
+        Returns:
+            Dict[str, int]: The hit, miss and eviction counts, the number of entries and
+                            the estimated bytes they hold.
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+            }
+
+    @staticmethod
+    def _estimate_size(value: Any, stat: os.stat_result) -> int:
+        """Estimates the memory held by a value from its `nbytes`, or from the file size."""
+        return getattr(value, 'nbytes', None) or stat.st_size
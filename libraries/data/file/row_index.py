@@ -0,0 +1,162 @@
+import os
+import struct
+from array import array
+from typing import Optional, Tuple
+
+DEFAULT_STRIDE = 1000  # Number of rows between two recorded offsets
+
+class RowIndex:
+    """
+    Byte offsets of every `stride`-th data row of a CSV file, persisted in a sidecar file.
+
+    The index lets readers seek close to any row instead of parsing the file from the
+    start. It records the size and modification time of the file it was built from
+    and is rebuilt automatically once the file changes.
+
+    Attributes:
+        stride (int): The number of rows between two recorded offsets.
+        row_count (int): The number of data rows in the file, excluding the header row.
+        offsets (array): The byte offset of data rows 0, stride, 2 * stride, ...
+        size (int): The size in bytes of the indexed file.
+        mtime_ns (int): The modification time of the indexed file, in nanoseconds.
+    """
+
+    _MAGIC = b'CSVIDX01'
+    _HEADER = struct.Struct('<8sQqQQ')  # magic, size, mtime_ns, stride, row_count
+
+    def __init__(self, stride: int, row_count: int, offsets: array, size: int, mtime_ns: int) -> None:
+        """
+        Initializes the index with already computed offsets.
+
+        Args:
+            stride (int): The number of rows between two recorded offsets.
+            row_count (int): The number of data rows in the file.
+            offsets (array): The recorded byte offsets.
+            size (int): The size in bytes of the indexed file.
+            mtime_ns (int): The modification time of the indexed file, in nanoseconds.
+        """
+        self.stride = stride
+        self.row_count = row_count
+        self.offsets = offsets
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+    @staticmethod
+    def sidecar_path(file_path: str) -> str:
+        """Returns the path of the sidecar index file of a CSV file."""
+        return f"{file_path}.idx"
+
+    @classmethod
+    def for_file(cls, file_path: str, stride: int = DEFAULT_STRIDE) -> 'RowIndex':
+        """
+        Loads the sidecar index of a file, or builds and persists it if it is missing or stale.
+
+        Failing to write the sidecar file (for example in a read-only directory) is not
+        an error; the freshly built index is returned either way.
+
+        Args:
+            file_path (str): The path of the CSV file.
+            stride (int): The stride to use if the index has to be built.
+
+        Returns:
+            RowIndex: An index that matches the current contents of the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        stat = os.stat(file_path)
+        index = cls.load(cls.sidecar_path(file_path))
+        if index is not None and (index.size, index.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+            return index
+
+        index = cls.build(file_path, stride)
+        try:
+            index.save(cls.sidecar_path(file_path))
+        except OSError:
+            pass
+        return index
+
+    @classmethod
+    def build(cls, file_path: str, stride: int = DEFAULT_STRIDE) -> 'RowIndex':
+        """
+        Scans a CSV file and records the offset of every `stride`-th data row.
+
+        Row boundaries are newlines outside quoted fields, so rows spanning several
+        lines are indexed correctly.
+
+        Args:
+            file_path (str): The path of the CSV file.
+            stride (int): The number of rows between two recorded offsets.
+
+        Returns:
+            RowIndex: The index of the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        offsets = array('q')
+        row_count = -1  # The header row is not counted
+        position = 0
+        in_quotes = False
+        with open(file_path, mode='rb') as file:
+            stat = os.fstat(file.fileno())
+            for line in file:
+                if not in_quotes:
+                    if row_count >= 0 and row_count % stride == 0:
+                        offsets.append(position)
+                    row_count += 1
+                if line.count(b'"') % 2:
+                    in_quotes = not in_quotes
+                position += len(line)
+        return cls(stride, max(row_count, 0), offsets, stat.st_size, stat.st_mtime_ns)
+
+    @classmethod
+    def load(cls, index_path: str) -> Optional['RowIndex']:
+        """
+        Loads an index from a sidecar file.
+
+        Args:
+            index_path (str): The path of the sidecar file.
+
+        Returns:
+            Optional[RowIndex]: The loaded index, or None if the file is missing or unreadable.
+        """
+        try:
+            with open(index_path, mode='rb') as file:
+                magic, size, mtime_ns, stride, row_count = cls._HEADER.unpack(file.read(cls._HEADER.size))
+                offsets = array('q')
+                offsets.frombytes(file.read())
+        except (OSError, struct.error, ValueError):
+            return None
+        if magic != cls._MAGIC:
+            return None
+        return cls(stride, row_count, offsets, size, mtime_ns)
+
+    def save(self, index_path: str) -> None:
+        """
+        Writes the index to a sidecar file, atomically replacing any previous one.
+
+        Args:
+            index_path (str): The path of the sidecar file.
+
+        Raises:
+            IOError: If the file write fails.
+        """
+        temp_path = f"{index_path}.tmp"
+        with open(temp_path, mode='wb') as file:
+            file.write(self._HEADER.pack(self._MAGIC, self.size, self.mtime_ns, self.stride, self.row_count))
+            file.write(self.offsets.tobytes())
+        os.replace(temp_path, index_path)
+
+    def locate(self, row: int) -> Tuple[int, int]:
+        """
+        Finds where to start reading to reach a data row.
+
+        Args:
+            row (int): The zero-based number of the data row.
+
+        Returns:
+            Tuple[int, int]: The byte offset of the nearest indexed row at or before `row`,
+                             and the number of rows to skip from there.
+        """
+        return self.offsets[row // self.stride], row % self.stride
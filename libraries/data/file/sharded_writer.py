@@ -0,0 +1,160 @@
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+from .file_handler_factory import FileHandlerFactory
+from .handlers.abstract_file_handler import RecordWriter
+from ...path_builder.path_builder import PathBuilder
+
+_SHARD_BUFFER_SIZE = 64 * 1024  # Write buffer of each open shard, kept small as many are open at once
+_MAX_BUFFERED_RECORDS = 100_000  # Records held across all shards before they are written in batches
+
+class ShardedWriter:
+    """
+    Routes a stream of records to many shard files, keeping a bounded pool of them open.
+
+    Each record is written to the file returned by `shard_path` for it, for example a
+    path built with PathBuilder from the record's customer ID. Records are first
+    grouped per shard in memory, up to `max_buffered_records` in total, and then
+    written shard by shard, so that a shard is opened once per batch rather than once
+    per record. Open shards are kept in an LRU pool: once `max_open_files` are open,
+    the least recently used one is flushed and closed, and transparently reopened in
+    append mode when it receives records again. The number of open file descriptors is
+    therefore bounded whatever the number of shards, and the cost of reopening is
+    spread over a batch of records.
+
+    Attributes:
+        max_open_files (int): The maximum number of shards open at once.
+        max_buffered_records (int): The number of records grouped in memory before they are written.
+        overwrite (bool): If True, shards that already exist are replaced the first time
+                          they are written to; otherwise records are appended to them.
+    """
+
+    def __init__(self, shard_path: Callable[[Any], Union[str, PathBuilder]], max_open_files: int = 128,
+                 max_buffered_records: int = _MAX_BUFFERED_RECORDS, overwrite: bool = False, chunk_size: int = _SHARD_BUFFER_SIZE,
+                 compression_level: Optional[int] = None, **writer_options: Any) -> None:
+        """
+        Initializes the writer; shards are opened as records arrive.
+
+        Args:
+            shard_path (Callable[[Any], Union[str, PathBuilder]]): Returns the path of the
+                shard a record belongs to. Missing directories are created.
+            max_open_files (int): The maximum number of shards open at once.
+            max_buffered_records (int): The number of records grouped in memory before they are written.
+            overwrite (bool): If True, existing shards are replaced rather than appended to.
+            chunk_size (int): The size in bytes of the write buffer of each open shard.
+            compression_level (Optional[int]): The level for compressed shards such as '.csv.gz'.
+            **writer_options (Any): Handler specific options, such as `header` for CSV shards.
+        """
+        self.max_open_files = max_open_files
+        self.max_buffered_records = max_buffered_records
+        self.overwrite = overwrite
+        self._shard_path = shard_path
+        self._chunk_size = chunk_size
+        self._writer_options = writer_options
+        self._factory = FileHandlerFactory(compression_level)
+        self._writers: 'OrderedDict[str, RecordWriter]' = OrderedDict()
+        self._buffered: Dict[str, List[Any]] = {}
+        self._buffered_count = 0
+        self._shards: Set[str] = set()
+        self._opens = 0
+        self._evictions = 0
+        self._records = 0
+
+    def write(self, record: Any) -> None:
+        """
+        Queues a record for its shard, writing the queued records once there are enough of them.
+
+        Args:
+            record (Any): The record to be written.
+
+        Raises:
+            IOError: If a shard cannot be opened or written.
+        """
+        path = str(self._shard_path(record))
+        batch = self._buffered.get(path)
+        if batch is None:
+            batch = self._buffered[path] = []
+        batch.append(record)
+        self._buffered_count += 1
+        if self._buffered_count >= self.max_buffered_records:
+            self._write_buffered()
+
+    def write_all(self, records: Iterable[Any]) -> None:
+        """
+        Writes every record of an iterable to its shard.
+
+        Args:
+            records (Iterable[Any]): The records to be written.
+
+        Raises:
+            IOError: If a shard cannot be opened or written.
+        """
+        for record in records:
+            self.write(record)
+
+    def flush(self) -> None:
+        """Writes the queued records and flushes the write buffers of all open shards."""
+        self._write_buffered()
+        for writer in self._writers.values():
+            writer.flush()
+
+    def close(self) -> None:
+        """Writes the queued records, then flushes and closes all open shards."""
+        self._write_buffered()
+        while self._writers:
+            _, writer = self._writers.popitem(last=False)
+            writer.close()
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """
+        Reports how the pool of open shards has been used.
+
+        Returns:
+            Dict[str, int]: The number of shards written to, shards currently open, opens
+                            (including reopens), evictions and records written.
+        """
+        return {
+            'shards': len(self._shards),
+            'open': len(self._writers),
+            'opens': self._opens,
+            'evictions': self._evictions,
+            'records': self._records,
+        }
+
+    def _write_buffered(self) -> None:
+        """Writes the queued records of each shard through the pool of open shards."""
+        for path, batch in self._buffered.items():
+            writer = self._writers.get(path)
+            if writer is None:
+                writer = self._open(path)
+            else:
+                self._writers.move_to_end(path)
+            writer.write_all(batch)
+            self._records += len(batch)
+        self._buffered.clear()
+        self._buffered_count = 0
+
+    def _open(self, path: str) -> RecordWriter:
+        """Opens a shard, evicting the least recently used ones to stay within the limit."""
+        while len(self._writers) >= self.max_open_files:
+            _, evicted = self._writers.popitem(last=False)
+            evicted.close()
+            self._evictions += 1
+
+        first_open = path not in self._shards
+        if first_open:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        handler = self._factory.get_handler(self._factory.get_file_type(path), path)
+        writer = handler.open_writer(append=not (first_open and self.overwrite), chunk_size=self._chunk_size,
+                                     **self._writer_options)
+        self._shards.add(path)
+        self._writers[path] = writer
+        self._opens += 1
+        return writer
+
+    def __enter__(self) -> 'ShardedWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -1,6 +1,6 @@
 import unittest
-from data.source.api.data_api_response_processors.api_response_processor import APIResponseProcessor
-from data.source.api.data_api_response_processors.json_response_processor import JSONResponseProcessor
+from libraries.data.api.data_api_response_processors.data_api_response_processor import APIResponseProcessor
+from libraries.data.api.data_api_response_processors.json_response_processor import JSONResponseProcessor
 
 class TestJSONResponseProcessor(unittest.TestCase):
 
@@ -0,0 +1,64 @@
+import unittest
+from threading import Event
+from libraries.data.file.async_writer import AsyncWriter
+
+class TestAsyncWriter(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a writer that records saves and can be paused."""
+        self.saved = []
+        self.release = Event()
+        self.release.set()
+        self.writer = AsyncWriter(self._save, max_workers=2)
+
+    def tearDown(self):
+        self.release.set()
+        self.writer.shutdown()
+
+    def _save(self, data, path):
+        self.release.wait()
+        if data == 'fail':
+            raise IOError('disk full')
+        self.saved.append((path, data))
+
+    def test_submit_and_flush(self):
+        """Test that queued writes are saved once flushed."""
+        futures = [self.writer.submit(i, f'file{i}.csv') for i in range(10)]
+        self.writer.flush()
+
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(sorted(self.saved), sorted((f'file{i}.csv', i) for i in range(10)))
+        self.assertEqual(self.writer.metrics['writes'], 10)
+        self.assertEqual(self.writer.metrics['queue_depth'], 0)
+
+    def test_coalesces_writes_to_same_path(self):
+        """Test that only the latest queued payload for a path is written."""
+        self.release.clear()
+        self.writer.submit('first', 'busy.csv')  # Picked up by a writer thread and blocked
+        while self.writer.metrics['in_flight'] == 0:
+            pass
+        second = self.writer.submit('second', 'busy.csv')
+        third = self.writer.submit('third', 'busy.csv')
+        self.release.set()
+        self.writer.flush()
+
+        self.assertIs(second, third)
+        self.assertEqual(self.saved, [('busy.csv', 'first'), ('busy.csv', 'third')])
+        self.assertEqual(self.writer.metrics['coalesced'], 1)
+
+    def test_errors_are_reported_on_future(self):
+        """Test that write errors surface through the future and the metrics."""
+        future = AsyncWriter.gather([self.writer.submit('fail', 'bad.csv'), self.writer.submit('ok', 'good.csv')])
+        with self.assertRaises(IOError):
+            future.result(timeout=5)
+        self.writer.flush()
+        self.assertEqual(self.writer.metrics['failures'], 1)
+
+    def test_submit_after_shutdown(self):
+        """Test that submitting to a shut down writer raises RuntimeError."""
+        self.writer.shutdown()
+        with self.assertRaises(RuntimeError):
+            self.writer.submit('late', 'file.csv')
+
+if __name__ == '__main__':
+    unittest.main()
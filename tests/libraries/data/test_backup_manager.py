@@ -1,8 +1,16 @@
 import unittest
 import os
+import random
+import stat
+import tarfile
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from data.backup.backup_manager import BackupManager
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from unittest.mock import patch
+from libraries.data.file.backup_manager import BackupManager
+from libraries.data.file.backup_catalog import CatalogEntry
+from libraries.data.file.chunking import ContentDefinedChunker, FixedSizeChunker
 
 class TestBackupManager(unittest.TestCase):
 
@@ -13,7 +21,7 @@ class TestBackupManager(unittest.TestCase):
     def test_backup_creation(self):
         """Test creating a backup of an existing file."""
         # Create a temporary file
-        with NamedTemporaryFile(delete=False) as temp_file:
+        with NamedTemporaryFile(delete=False, suffix='.tmp') as temp_file:
             temp_file.write(b'Test data')
             temp_filename = temp_file.name
 
@@ -37,5 +45,264 @@ class TestBackupManager(unittest.TestCase):
         # Test without raising an error
         self.assertIsNone(self.backup_manager.create_backup('non_existent_file.tmp'))
 
+    def test_backups_within_one_second_do_not_collide(self):
+        """Test that repeated backups of a file get distinct names."""
+        with TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'data.csv')
+            with open(file_path, mode='w') as file:
+                file.write('a,b\n')
+
+            results = [self.backup_manager.create_backup(file_path) for _ in range(3)]
+
+            self.assertEqual(len({result.backup_path for result in results}), 3)
+            self.assertEqual(len(list(Path(temp_dir, 'archive').glob('data_*.csv'))), 3)
+
+    def test_deduplicated_backups(self):
+        """Test that unchanged content is stored once and shared by hardlinked backups."""
+        backup_manager = BackupManager(deduplicate=True)
+        with TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'data.csv')
+            with open(file_path, mode='w') as file:
+                file.write('a,b\n')
+
+            first = backup_manager.create_backup(file_path)
+            second = backup_manager.create_backup(file_path)
+            with open(file_path, mode='a') as file:
+                file.write('c,d\n')
+            third = backup_manager.create_backup(file_path)
+
+            self.assertEqual([first.strategy, second.strategy, third.strategy], ['stored', 'deduplicated', 'stored'])
+            self.assertEqual(os.stat(first.backup_path).st_ino, os.stat(second.backup_path).st_ino)
+            self.assertEqual(Path(second.backup_path).read_text(), 'a,b\n')
+            self.assertEqual(Path(third.backup_path).read_text(), 'a,b\nc,d\n')
+            self.assertEqual(len([path for path in Path(temp_dir, 'archive', 'objects').rglob('*') if path.is_file()]), 2)
+
+    def test_hardlink_backups(self):
+        """Test that hardlink mode links the backup to the original and reports it."""
+        with TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'data.csv')
+            with open(file_path, mode='w') as file:
+                file.write('a,b\n')
+
+            result = BackupManager(hardlink=True).create_backup(file_path)
+
+            self.assertEqual(result.strategy, 'hardlink')
+            self.assertEqual(os.stat(result.backup_path).st_ino, os.stat(file_path).st_ino)
+
+    def test_restore_at_point_in_time(self):
+        """Test that restore picks the latest backup made before the requested time."""
+        for backup_manager in [self.backup_manager, BackupManager(deduplicate=True)]:
+            with self.subTest(deduplicate=backup_manager.deduplicate), TemporaryDirectory() as temp_dir:
+                file_path = os.path.join(temp_dir, 'data.csv')
+                Path(file_path).write_text('v1')
+                backup_manager.create_backup(file_path)
+                time.sleep(0.01)
+                between = datetime.now()
+                time.sleep(0.01)
+                Path(file_path).write_text('v2')
+                backup_manager.create_backup(file_path)
+                Path(file_path).write_text('v3')
+
+                backup_manager.restore(file_path, at=between)
+                self.assertEqual(Path(file_path).read_text(), 'v1')
+                backup_manager.restore(file_path)
+                self.assertEqual(Path(file_path).read_text(), 'v2')
+                Path(file_path).write_text('v4')  # The restored file is writable
+                with self.assertRaises(FileNotFoundError):
+                    backup_manager.restore(file_path, at=between - timedelta(days=1))
+
+    def test_prune_with_retention_rules(self):
+        """Test that pruning keeps the backups selected by any rule and deletes the rest."""
+        with TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'data.csv')
+            Path(file_path).write_text('data')
+            catalog = self.backup_manager._catalog(Path(file_path))
+            now = datetime.now().replace(hour=12)
+            entries = []
+            for hours_ago in [0, 1, 2, 24, 25, 48, 24 * 30]:
+                backup_path = os.path.join(temp_dir, 'archive', f'data_{hours_ago}.csv')
+                Path(backup_path).write_text('data')
+                created_ns = int((now - timedelta(hours=hours_ago)).timestamp()) * 1_000_000_000
+                entries.append(CatalogEntry(str(Path(file_path).resolve()), created_ns, backup_path, 'copy'))
+            catalog.add(entries)
+
+            removed = self.backup_manager.prune(file_path, keep_last=2, keep_daily=3)
+
+            kept = [os.path.basename(entry.backup_path) for entry in self.backup_manager.history(file_path)]
+            self.assertEqual(kept, ['data_0.csv', 'data_1.csv', 'data_24.csv', 'data_48.csv'])
+            self.assertEqual(sorted(map(os.path.basename, removed)), ['data_2.csv', 'data_25.csv', 'data_720.csv'])
+            self.assertFalse(any(os.path.exists(path) for path in removed))
+            with self.assertRaises(ValueError):
+                self.backup_manager.prune(file_path)
+
+    def test_index_existing_backups(self):
+        """Test that backups made before the catalog existed are indexed from their names."""
+        with TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'data.csv')
+            Path(file_path).write_text('v2')
+            os.mkdir(os.path.join(temp_dir, 'archive'))
+            Path(temp_dir, 'archive', 'data_20240101120000.csv').write_text('v1')
+            Path(temp_dir, 'archive', 'other_20240101120000.csv').write_text('other')
+
+            self.assertEqual(self.backup_manager.index_existing_backups(file_path), 1)
+            self.assertEqual(self.backup_manager.index_existing_backups(file_path), 0)
+            self.backup_manager.restore(file_path, at=datetime(2024, 6, 1))
+            self.assertEqual(Path(file_path).read_text(), 'v1')
+
+    def test_block_level_backups_store_only_changed_blocks(self):
+        """Test that a block-level backup stores only new blocks and that every version is restored."""
+        data = random.Random(1).randbytes(1024 * 1024)
+        edited = data[:300000] + b'edit' + data[300004:]
+        inserted = data[:300000] + b'insert' + data[300000:]
+        cases = [(FixedSizeChunker(64 * 1024), edited), (ContentDefinedChunker(64 * 1024), inserted)]
+        for chunker, changed in cases:
+            with self.subTest(chunker=type(chunker).__name__), TemporaryDirectory() as temp_dir:
+                backup_manager = BackupManager(chunker=chunker)
+                file_path = os.path.join(temp_dir, 'data.bin')
+                objects = Path(temp_dir, 'archive', 'objects')
+                Path(file_path).write_bytes(data)
+                first = backup_manager.create_backup(file_path)
+                stored = len([path for path in objects.rglob('*') if path.is_file()])
+                time.sleep(0.01)
+                between = datetime.now()
+                time.sleep(0.01)
+                Path(file_path).write_bytes(changed)
+                second = backup_manager.create_backup(file_path)
+                added = len([path for path in objects.rglob('*') if path.is_file()]) - stored
+
+                self.assertEqual([first.strategy, second.strategy], ['delta', 'delta'])
+                self.assertTrue(first.backup_path.endswith('.bin.blocks'))
+                self.assertLessEqual(added, 2)
+                self.assertLess(added * 4, stored)
+                backup_manager.restore(file_path, at=between)
+                self.assertEqual(Path(file_path).read_bytes(), data)
+                backup_manager.restore(file_path)
+                self.assertEqual(Path(file_path).read_bytes(), changed)
+
+    def test_prune_deletes_unused_blocks(self):
+        """Test that pruning block-level backups deletes only the blocks no remaining backup uses."""
+        with TemporaryDirectory() as temp_dir:
+            backup_manager = BackupManager(chunker=FixedSizeChunker(4))
+            file_path = os.path.join(temp_dir, 'data.bin')
+            objects = Path(temp_dir, 'archive', 'objects')
+            Path(file_path).write_bytes(b'aaaabbbb')
+            backup_manager.create_backup(file_path)
+            Path(file_path).write_bytes(b'aaaacccc')
+            backup_manager.create_backup(file_path)
+
+            backup_manager.prune(file_path, keep_last=1)
+
+            self.assertEqual(len([path for path in objects.rglob('*') if path.is_file()]), 2)
+            backup_manager.restore(file_path)
+            self.assertEqual(Path(file_path).read_bytes(), b'aaaacccc')
+
+    def test_batch_backup_reports_each_file(self):
+        """Test that a batch backup backs up every file and reports failures without stopping."""
+        with TemporaryDirectory() as temp_dir:
+            file_paths = [os.path.join(temp_dir, f'data_{index}.csv') for index in range(20)]
+            for index, file_path in enumerate(file_paths):
+                Path(file_path).write_text(f'row {index}')
+            missing = os.path.join(temp_dir, 'missing.csv')
+
+            reports = self.backup_manager.create_backups(file_paths[:10] + [missing] + file_paths[10:], max_workers=4)
+
+            self.assertEqual([report.path for report in reports], file_paths[:10] + [missing] + file_paths[10:])
+            self.assertIsInstance(reports[10].error, FileNotFoundError)
+            self.assertIsNone(reports[10].result)
+            for index, report in enumerate(reports[:10] + reports[11:]):
+                self.assertIsNone(report.error)
+                self.assertEqual(Path(report.result.backup_path).read_text(), f'row {index}')
+            self.assertEqual(len(self.backup_manager.history(file_paths[0])), 1)
+
+    def test_batch_backup_to_tar_archive(self):
+        """Test that a batch backup streams small and large files into one compressed tar archive."""
+        with TemporaryDirectory() as temp_dir:
+            small = os.path.join(temp_dir, 'small.csv')
+            large = os.path.join(temp_dir, 'large.bin')
+            missing = os.path.join(temp_dir, 'missing.csv')
+            Path(small).write_text('a,b\n')
+            Path(large).write_bytes(os.urandom(3 * 1024 * 1024))
+            tar_path = os.path.join(temp_dir, 'backup.tar.xz')
+
+            reports = self.backup_manager.create_backups([small, missing, large], tar_path=tar_path, compression='xz',
+                                                         compression_level=0)
+
+            self.assertEqual([report.result.strategy if report.result else None for report in reports],
+                             ['tar', None, 'tar'])
+            self.assertIsInstance(reports[1].error, FileNotFoundError)
+            with tarfile.open(tar_path, mode='r:xz') as archive:
+                names = archive.getnames()
+                self.assertEqual(names, [os.path.abspath(path).lstrip('/') for path in [small, large]])
+                self.assertEqual(archive.extractfile(names[0]).read(), b'a,b\n')
+                self.assertEqual(archive.extractfile(names[1]).read(), Path(large).read_bytes())
+            with self.assertRaises(ValueError):
+                self.backup_manager.create_backups([small], tar_path=tar_path, compression='zip')
+            self.assertFalse(os.path.exists(os.path.join(temp_dir, 'archive')))
+
+    def test_failed_backup_leaves_no_file(self):
+        """Test that a backup failing after its name was reserved removes the reserved file."""
+        with TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'data.csv')
+            Path(file_path).write_text('a,b\n')
+            cases = [(BackupManager(), 'libraries.data.file.file_copier.FileCopier.copy'),
+                     (BackupManager(deduplicate=True), 'libraries.data.file.file_copier.FileCopier.copy'),
+                     (BackupManager(chunker=FixedSizeChunker(1024)), 'libraries.data.file.backup_manager.json.dump')]
+            for backup_manager, target in cases:
+                with self.subTest(target=target, deduplicate=backup_manager.deduplicate):
+                    with patch(target, side_effect=OSError('disk full')), self.assertRaises(IOError):
+                        backup_manager.create_backup(file_path)
+                    archive = Path(temp_dir) / 'archive'
+                    self.assertEqual([path.name for path in archive.iterdir() if path.name.startswith('data_')], [])
+                    self.assertEqual(backup_manager.index_existing_backups(file_path), 0)
+
+    def test_catalog_from_another_working_directory(self):
+        """Test that backups made through a relative path are found from another working directory."""
+        cwd = os.getcwd()
+        with TemporaryDirectory() as temp_dir:
+            try:
+                os.chdir(temp_dir)
+                os.mkdir('sub')
+                Path('sub/data.csv').write_text('v1')
+                result = self.backup_manager.create_backup('sub/data.csv')
+                Path('sub/data.csv').write_text('v2')
+
+                os.chdir('sub')
+                self.assertEqual(self.backup_manager.index_existing_backups('data.csv'), 0)
+                restored = self.backup_manager.restore('data.csv')
+
+                self.assertTrue(os.path.isabs(restored))
+                self.assertEqual(restored, os.path.realpath(os.path.join('..', result.backup_path)))
+                self.assertEqual(Path('data.csv').read_text(), 'v1')
+                self.assertEqual(len(self.backup_manager.history('data.csv')), 1)
+            finally:
+                os.chdir(cwd)
+
+    def test_tar_backup_of_a_shrinking_file(self):
+        """Test that a large file ending before its stat size is padded in the archive, reported, and does not stop the batch."""
+        with TemporaryDirectory() as temp_dir:
+            large = os.path.join(temp_dir, 'large.bin')
+            small = os.path.join(temp_dir, 'small.csv')
+            content = os.urandom(2 * 1024 * 1024)
+            Path(large).write_bytes(content)
+            Path(small).write_text('a,b\n')
+            tar_path = os.path.join(temp_dir, 'backup.tar')
+            fstat = os.fstat
+
+            def grown_fstat(fd):  # The size at open, before the file was truncated by 1000 bytes
+                values = list(fstat(fd))
+                values[stat.ST_SIZE] += 1000
+                return os.stat_result(values)
+
+            with patch('os.fstat', side_effect=grown_fstat):
+                reports = self.backup_manager.create_backups([large, small], tar_path=tar_path, compression=None)
+
+            self.assertIsNone(reports[0].result)
+            self.assertIn('shrank', str(reports[0].error))
+            self.assertEqual(reports[1].result.strategy, 'tar')
+            with tarfile.open(tar_path) as archive:
+                names = archive.getnames()
+                self.assertEqual(archive.extractfile(names[0]).read(), content + bytes(1000))
+                self.assertEqual(archive.extractfile(names[1]).read(), b'a,b\n')
+
 if __name__ == '__main__':
     unittest.main()
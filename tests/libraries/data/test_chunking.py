@@ -0,0 +1,42 @@
+import io
+import random
+import unittest
+from unittest.mock import patch
+from libraries.data.file.chunking import ContentDefinedChunker, FixedSizeChunker
+
+class TestChunking(unittest.TestCase):
+
+    def setUp(self):
+        """Set up random test data."""
+        self.data = random.Random(2).randbytes(512 * 1024)
+
+    def test_fixed_size_chunks(self):
+        """Test that fixed-size chunks have the block size and concatenate to the data."""
+        chunks = list(FixedSizeChunker(100000).chunks(io.BytesIO(self.data)))
+        self.assertEqual([len(chunk) for chunk in chunks], [100000] * 5 + [24288])
+        self.assertEqual(b''.join(chunks), self.data)
+
+    def test_content_defined_chunks_respect_size_limits(self):
+        """Test that content-defined chunks concatenate to the data within the size limits."""
+        chunker = ContentDefinedChunker(16 * 1024)
+        chunks = list(chunker.chunks(io.BytesIO(self.data)))
+        self.assertEqual(b''.join(chunks), self.data)
+        self.assertTrue(all(chunker.min_size <= len(chunk) <= chunker.max_size for chunk in chunks[:-1]))
+        self.assertEqual(list(chunker.chunks(io.BytesIO(b''))), [])
+
+    def test_content_defined_boundaries_survive_insertions(self):
+        """Test that inserting bytes only changes the chunks around the insertion."""
+        chunker = ContentDefinedChunker(16 * 1024)
+        original = set(chunker.chunks(io.BytesIO(self.data)))
+        edited = list(chunker.chunks(io.BytesIO(self.data[:200000] + b'inserted' + self.data[200000:])))
+        self.assertLessEqual(len([chunk for chunk in edited if chunk not in original]), 2)
+
+    def test_content_defined_chunker_warns_without_numpy(self):
+        """Test that the slow pure Python hashing is announced with a warning naming the alternatives."""
+        with patch('libraries.data.file.chunking.np', None):
+            with self.assertWarnsRegex(RuntimeWarning, 'FixedSizeChunker'):
+                chunker = ContentDefinedChunker(16 * 1024)
+            self.assertEqual(b''.join(chunker.chunks(io.BytesIO(self.data))), self.data)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import csv
+import os
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+from libraries.data.file.column_table import ColumnTable
+from libraries.data.file.file import File
+from libraries.data.file.handlers.colbin_handler import ColbinFileHandler
+from libraries.data.file.handlers.csv_handler import CSVFileHandler
+
+class TestColbinFileHandler(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary directory for the files."""
+        self.temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_save_and_load(self):
+        """Test that every column type survives a save and a mapped load."""
+        table = ColumnTable.from_rows(['id', 'price', 'name'],
+                                      [['1', '2.5', 'Zoë'], ['2', '-1', ''], ['3', '1e3', 'Bob']])
+        handler = ColbinFileHandler(self._path('table.colbin'))
+        handler.save(table)
+
+        loaded = handler.read()
+
+        self.assertEqual(loaded.names, ['id', 'price', 'name'])
+        self.assertEqual(loaded.types, table.types)
+        self.assertEqual(list(loaded), [(1, 2.5, 'Zoë'), (2, -1.0, ''), (3, 1000.0, 'Bob')])
+        self.assertEqual(loaded['name'][-1], 'Bob')
+        self.assertEqual(handler.read_source(), None)
+
+    def test_save_rows_with_header(self):
+        """Test saving plain rows whose first row is the header."""
+        handler = ColbinFileHandler(self._path('rows.colbin'))
+        handler.save_iter(iter([['a', 'b'], [1, 'x'], [2, 'y']]))
+        self.assertEqual(list(handler.iter_rows()), [(1, 'x'), (2, 'y')])
+
+    def test_save_rows_keeps_python_values(self):
+        """Test that saving plain rows types float and bool values like save_iter, without truncating them."""
+        rows = [['a', 'b'], [1.5, True], [2.7, False]]
+        handler = ColbinFileHandler(self._path('values.colbin'))
+        handler.save(rows)
+        saved = handler.read()
+        handler.save_iter(rows)
+
+        self.assertEqual(saved.types, {'a': float, 'b': str})
+        self.assertEqual(list(saved), [(1.5, 'True'), (2.7, 'False')])
+        self.assertEqual(list(handler.read()), list(saved))
+
+        File.save(rows, [self._path('values.csv'), self._path('both.colbin')])
+        self.assertEqual(list(File.read(self._path('both.colbin'))), [(1.5, 'True'), (2.7, 'False')])
+
+    def test_file_read_uses_cache(self):
+        """Test that columnar reads of an unchanged CSV file load the cache instead of parsing."""
+        path = self._path('data.csv')
+        with open(path, mode='w', newline='') as file:
+            csv.writer(file).writerows([['id', 'value'], ['1', '0.5'], ['2', '1.5']])
+
+        first = File.read(path, columnar=True, cache=True)
+        self.assertTrue(os.path.exists(path + '.colbin'))
+        with patch.object(CSVFileHandler, 'read_columnar') as mock_read_columnar:
+            second = File.read(path, columnar=True, cache=True)
+        mock_read_columnar.assert_not_called()
+        self.assertEqual(list(first), list(second))
+
+        with open(path, mode='a', newline='') as file:
+            csv.writer(file).writerow(['3', '2.5'])
+        self.assertEqual(len(File.read(path, columnar=True, cache=True)), 3)
+
+    def test_file_read_cache_follows_the_schema(self):
+        """Test that a columnar read with another schema reconverts the file instead of loading the cache."""
+        path = self._path('data.csv')
+        with open(path, mode='w', newline='') as file:
+            csv.writer(file).writerows([['id', 'value'], ['1', '0.5'], ['2', '1.5']])
+
+        self.assertEqual(File.read(path, columnar=True, cache=True).types, {'id': int, 'value': float})
+        as_text = File.read(path, columnar=True, cache=True, schema={'id': str})
+        self.assertEqual(as_text.types, {'id': str, 'value': float})
+        self.assertEqual(as_text['id'][0], '1')
+        with patch.object(CSVFileHandler, 'read_columnar') as mock_read_columnar:
+            self.assertEqual(File.read(path, columnar=True, cache=True, schema={'id': str}).types['id'], str)
+        mock_read_columnar.assert_not_called()
+        self.assertEqual(File.read(path, columnar=True, cache=True).types['id'], int)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import csv
+import os
+from tempfile import NamedTemporaryFile
+from libraries.data.file.column_table import ColumnTable
+from libraries.data.file.handlers.csv_handler import CSVFileHandler
+
+class TestColumnTable(unittest.TestCase):
+
+    def test_infers_column_types(self):
+        """Test that each column is stored with the narrowest fitting type."""
+        table = ColumnTable.from_rows(['id', 'score', 'name'], [['1', '2.5', 'a'], ['2', '3', 'b']])
+
+        self.assertEqual(table.types, {'id': int, 'score': float, 'name': str})
+        self.assertEqual(list(table['id']), [1, 2])
+        self.assertEqual(list(table['score']), [2.5, 3.0])
+        self.assertEqual(len(table), 2)
+        self.assertEqual(list(table), [(1, 2.5, 'a'), (2, 3.0, 'b')])
+
+    def test_widens_column_after_sample(self):
+        """Test that a column is widened when a value past the first chunk does not convert."""
+        rows = [['1'], ['2'], ['2.5'], ['x']]
+        table = ColumnTable.from_rows(['value'], rows, chunk_rows=2)
+
+        self.assertEqual(table.types['value'], str)
+        self.assertEqual(list(table['value']), ['1', '2', '2.5', 'x'])
+
+    def test_widening_to_str_keeps_the_original_text(self):
+        """Test that values converted before a column is widened to str keep their original text."""
+        table = ColumnTable.from_rows(['zip', 'price'], [['01234', '1.50'], ['00042', ''], ['ABC', 'n/a']],
+                                      chunk_rows=2)
+        self.assertEqual(list(table.columns['zip']), ['01234', '00042', 'ABC'])
+        self.assertEqual(list(table.columns['price']), ['1.50', '', 'n/a'])
+
+    def test_ragged_rows_are_rejected(self):
+        """Test that a row with a different number of values than columns raises a ValueError."""
+        with self.assertRaisesRegex(ValueError, 'Row 3 has 1 values, expected 2'):
+            ColumnTable.from_rows(['a', 'b'], [['1', '2'], ['3', '4'], ['5']], chunk_rows=2)
+
+    def test_integers_beyond_64_bits(self):
+        """Test that integers too wide for an int column widen it to exact text, or fail a declared int column."""
+        big = '12345678901234567890'
+        table = ColumnTable.from_rows(['id', 'later'], [[big, '1'], ['2', '2'], ['3', big]], chunk_rows=2)
+        self.assertEqual(table.types, {'id': str, 'later': str})
+        self.assertEqual(list(table.columns['id']), [big, '2', '3'])
+        self.assertEqual(list(table.columns['later']), ['1', '2', big])
+        with self.assertRaisesRegex(ValueError, "Column 'id'"):
+            ColumnTable.from_rows(['id'], [['1'], [big]], schema={'id': int})
+
+    def test_schema_is_enforced(self):
+        """Test that values violating the given schema raise ValueError."""
+        with self.assertRaises(ValueError):
+            ColumnTable.from_rows(['value'], [['1'], ['x']], schema={'value': int})
+
+    def test_read_columnar_csv(self):
+        """Test reading a CSV file into columns named after its header."""
+        with NamedTemporaryFile(mode='w', delete=False, newline='', suffix='.csv') as temp_file:
+            csv.writer(temp_file).writerows([['name', 'age'], ['Alice', '30'], ['Bob', '35']])
+            temp_filename = temp_file.name
+
+        table = CSVFileHandler(temp_filename).read_columnar(schema={'age': float})
+
+        os.remove(temp_filename)
+
+        self.assertEqual(table.names, ['name', 'age'])
+        self.assertEqual(list(table['name']), ['Alice', 'Bob'])
+        self.assertEqual(list(table['age']), [30.0, 35.0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import gzip
+import os
+from tempfile import TemporaryDirectory
+from libraries.data.file.compression import CODECS
+from libraries.data.file.file import File
+from libraries.data.file.handlers.csv_handler import CSVFileHandler
+from libraries.data.file.handlers.ndjson_handler import NDJSONFileHandler
+
+class TestCompression(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary directory for the compressed files."""
+        self.temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_round_trip_every_codec(self):
+        """Test that streaming reads and writes work unchanged through each codec."""
+        rows = [['id', 'name']] + [[str(i), f'name {i}'] for i in range(1000)]
+        for suffix in CODECS:
+            with self.subTest(codec=suffix):
+                path = self._path(f'rows.csv.{suffix}')
+                File.save_stream(iter(rows), [path], compression_level=1)
+                self.assertEqual(File.read(path), rows[1:])
+                self.assertEqual(next(File.iter(path)), ['0', 'name 0'])
+
+    def test_file_is_compressed(self):
+        """Test that the bytes on disk are actually compressed."""
+        path = self._path('records.jsonl.gz')
+        File.save([{'id': i} for i in range(100)], [path])
+        with gzip.open(path, mode='rt') as file:
+            self.assertEqual(file.readline(), '{"id": 0}\n')
+
+    def test_append_compressed_ndjson(self):
+        """Test appending a new compressed stream to a compressed NDJSON file."""
+        handler = NDJSONFileHandler(self._path('records.ndjson.xz'), CODECS['xz'])
+        handler.save([{'id': 1}])
+        handler.append([{'id': 2}])
+        self.assertEqual(handler.read(), [{'id': 1}, {'id': 2}])
+
+    def test_random_access_is_rejected(self):
+        """Test that operations needing raw bytes raise ValueError on compressed files."""
+        handler = CSVFileHandler(self._path('rows.csv.bz2'), CODECS['bz2'])
+        handler.save([['id'], ['1']])
+        with self.assertRaises(ValueError):
+            handler.read_rows(0, 1)
+        with self.assertRaises(ValueError):
+            File.read(handler.filename, memory_map=True)
+
+if __name__ == '__main__':
+    unittest.main()
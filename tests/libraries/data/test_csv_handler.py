@@ -2,7 +2,7 @@ import unittest
 import csv
 import os
 from tempfile import NamedTemporaryFile
-from data.source.file.handlers.csv_file_handler import CSVFileHandler
+from libraries.data.file.handlers.csv_handler import CSVFileHandler
 
 class TestCSVFileHandler(unittest.TestCase):
 
@@ -51,5 +51,86 @@ class TestCSVFileHandler(unittest.TestCase):
         # Assertions
         self.assertEqual(data_read, data_to_save)
 
+    def test_iter_rows(self):
+        """Test that rows are yielded lazily, without the header row."""
+        with NamedTemporaryFile(mode='w', delete=False, newline='', suffix='.csv') as temp_file:
+            csv.writer(temp_file).writerows([['name', 'age'], ['Alice', '30'], ['Bob', '35']])
+            temp_filename = temp_file.name
+
+        handler = CSVFileHandler(temp_filename)
+        rows = handler.iter_rows(chunk_size=16)
+        first_row = next(rows)
+        remaining_rows = list(rows)
+
+        os.remove(temp_filename)
+
+        self.assertEqual(first_row, ['Alice', '30'])
+        self.assertEqual(remaining_rows, [['Bob', '35']])
+
+    def test_save_iter(self):
+        """Test saving rows from a generator."""
+        with NamedTemporaryFile(mode='w', delete=False, newline='', suffix='.csv') as temp_file:
+            temp_filename = temp_file.name
+
+        handler = CSVFileHandler(temp_filename)
+        handler.save_iter((['row', str(i)] for i in range(1000)), chunk_size=64)
+
+        with open(temp_filename, mode='r', newline='') as file:
+            data_read = list(csv.reader(file))
+
+        os.remove(temp_filename)
+
+        self.assertEqual(len(data_read), 1000)
+        self.assertEqual(data_read[-1], ['row', '999'])
+
+    def test_read_parallel(self):
+        """Test that parallel reads match sequential reads, including quoted newlines."""
+        with NamedTemporaryFile(mode='w', delete=False, newline='', suffix='.csv') as temp_file:
+            writer = csv.writer(temp_file)
+            writer.writerow(['id', 'text'])
+            writer.writerows([str(i), 'a\n"b"\nc' if i % 7 == 0 else 'plain'] for i in range(500))
+            temp_filename = temp_file.name
+
+        handler = CSVFileHandler(temp_filename)
+        ranges = handler._split_ranges(8)
+        ordered_rows = handler.read_parallel(workers=2)
+        unordered_rows = handler.read_parallel(workers=2, ordered=False)
+        expected_rows = handler.read()
+
+        os.remove(temp_filename)
+
+        self.assertGreater(len(ranges), 1)
+        self.assertEqual(ordered_rows, expected_rows)
+        self.assertEqual(sorted(unordered_rows), sorted(expected_rows))
+
+    def test_append_with_header(self):
+        """Test that appending creates the header once and checks it afterwards."""
+        with NamedTemporaryFile(delete=False, suffix='.csv') as temp_file:
+            temp_filename = temp_file.name
+
+        handler = CSVFileHandler(temp_filename)
+        handler.append([['Alice', '30']], header=['name', 'age'])
+        handler.append([['Bob', '35']], header=['name', 'age'])
+        with self.assertRaises(ValueError):
+            handler.append([['Carol', '40']], header=['name', 'city'])
+        data = handler.read()
+
+        os.remove(temp_filename)
+
+        self.assertEqual(data, [['Alice', '30'], ['Bob', '35']])
+
+    def test_append_after_unterminated_row(self):
+        """Test that a row is appended on a new line when the last row lacks a newline."""
+        with NamedTemporaryFile(mode='w', delete=False, newline='', suffix='.csv') as temp_file:
+            temp_file.write('name,age\r\nAlice,30')
+            temp_filename = temp_file.name
+
+        CSVFileHandler(temp_filename).append([['Bob', '35']])
+        data = CSVFileHandler(temp_filename).read()
+
+        os.remove(temp_filename)
+
+        self.assertEqual(data, [['Alice', '30'], ['Bob', '35']])
+
 if __name__ == '__main__':
     unittest.main()
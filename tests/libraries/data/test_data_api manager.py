@@ -1,13 +1,17 @@
+import threading
+import time
 import unittest
+from collections import Counter
 from unittest.mock import Mock, patch
-from data.source.api.data_api_manager import DataAPIManager
-from data.source.api.auth_strategies import AuthStrategy
-from data.source.api.data_api_response_processors.api_response_processor import APIResponseProcessor
+from libraries.data.api.data_api_manager import DataAPIManager, FetchRequest
+from libraries.data.api.paginators import CursorPaginator, LinkHeaderPaginator, OffsetPaginator
+from libraries.data.api.auth_strategies import AuthStrategy
+from libraries.data.api.data_api_response_processors.data_api_response_processor import APIResponseProcessor
 
 
 class TestDataAPIManager(unittest.TestCase):
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_data(self, mock_get):
         # Mocking the components
         mock_auth_strategy = Mock(spec=AuthStrategy)
@@ -30,10 +34,25 @@ class TestDataAPIManager(unittest.TestCase):
         # Assertions
         mock_get.assert_called_with('https://api.example.com/endpoint', 
                                     headers={'Authorization': 'Bearer token'}, 
-                                    params=None)
+                                    params=None, timeout=(5.0, 30.0))
         self.assertEqual(result, {'processed': 'data'})
 
-    @patch('data.source.file.file.File.save')
+    def test_sessions_share_one_connection_pool(self):
+        """Test that each thread gets its own session, all mounted on the same pooled adapter."""
+        manager = DataAPIManager(Mock(spec=AuthStrategy), Mock(spec=APIResponseProcessor), pool_maxsize=4, timeout=2)
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(manager.session))
+        thread.start()
+        thread.join()
+
+        self.assertIs(manager.session, manager.session)
+        self.assertIsNot(sessions[0], manager.session)
+        self.assertIs(sessions[0].get_adapter('https://api.example.com'),
+                      manager.session.get_adapter('http://api.example.com'))
+        self.assertEqual(manager.session.get_adapter('https://api.example.com')._pool_maxsize, 4)
+        self.assertEqual(manager.timeout, (2, 2))
+
+    @patch('libraries.data.file.file.File.save')
     def test_store_data(self, mock_save):
         # Mocking the components
         mock_auth_strategy = Mock(spec=AuthStrategy)
@@ -54,5 +73,129 @@ class TestDataAPIManager(unittest.TestCase):
         mock_save.assert_any_call(data, 'path/to/file2.json')
         self.assertEqual(mock_save.call_count, 2)
 
+    def _tracking_manager(self):
+        """Returns a manager whose fetch_data records the peak number of concurrent calls, overall and per host."""
+        manager = DataAPIManager(Mock(spec=AuthStrategy), Mock(spec=APIResponseProcessor), pool_maxsize=3)
+        lock = threading.Lock()
+        active, peaks = Counter(), Counter()
+
+        def fetch_data(base_url, endpoint, params=None):
+            with lock:
+                active[base_url] += 1
+                active['all'] += 1
+                peaks[base_url] = max(peaks[base_url], active[base_url])
+                peaks['all'] = max(peaks['all'], active['all'])
+            time.sleep(0.005)
+            with lock:
+                active[base_url] -= 1
+                active['all'] -= 1
+            if endpoint == 'fail':
+                raise ValueError('failed')
+            return f'{base_url}/{endpoint}'
+
+        manager.fetch_data = fetch_data
+        return manager, peaks
+
+    def test_fetch_many_limits_concurrency(self):
+        """Test that fetch_many respects the global and per-host limits and collects errors."""
+        manager, peaks = self._tracking_manager()
+        requests = [(f'http://host{index % 3}', str(index)) for index in range(60)] + [('http://host0', 'fail')]
+
+        results = list(manager.fetch_many(requests, concurrency=5, per_host_limit=2))
+
+        self.assertEqual(len(results), 61)
+        self.assertEqual(peaks['all'], 5)
+        self.assertTrue(all(peaks[f'http://host{index}'] <= 2 for index in range(3)))
+        failed = [result for result in results if result.error]
+        self.assertEqual([result.request for result in failed], [FetchRequest('http://host0', 'fail')])
+        self.assertIsInstance(failed[0].error, ValueError)
+        self.assertEqual(sorted(result.data for result in results if not result.error),
+                         sorted(f'{base_url}/{endpoint}' for base_url, endpoint in requests[:-1]))
+
+    def test_fetch_many_in_order(self):
+        """Test that ordered results follow the order of the requests, and that the pool size is the default host limit."""
+        manager, peaks = self._tracking_manager()
+        requests = [FetchRequest('http://host', str(index), {'page': index}) for index in range(30)]
+
+        results = list(manager.fetch_many(requests, concurrency=8, ordered=True))
+
+        self.assertEqual([result.request for result in results], requests)
+        self.assertEqual([result.data for result in results], [f'http://host/{index}' for index in range(30)])
+        self.assertEqual(peaks['http://host'], 3)
+
+    def _paged_manager(self, pages):
+        """Returns a manager whose requests are answered by `pages(url, params)`, a (body, links) pair, and the calls made."""
+        processor = Mock(spec=APIResponseProcessor)
+        processor.process_response.side_effect = lambda page: page
+        manager = DataAPIManager(Mock(spec=AuthStrategy), processor)
+        calls = []
+
+        def get(url, params):
+            calls.append((url, params))
+            body, links = pages(url, params)
+            return Mock(json=Mock(return_value=body), links=links)
+
+        manager._get = get
+        return manager, calls
+
+    def test_iter_records_with_each_pagination(self):
+        """Test that cursor, offset and Link header pagination all return every record in order."""
+        records = list(range(25))
+
+        def cursor_pages(url, params):
+            start = int(params.get('cursor', 0))
+            return {'data': records[start:start + 10], 'next_cursor': str(start + 10) if start + 10 < 25 else None}, {}
+
+        def offset_pages(url, params):
+            return {'data': records[params['offset']:params['offset'] + params['limit']]}, {}
+
+        def link_pages(url, params):
+            start = int(url.partition('?start=')[2] or 0)
+            links = {'next': {'url': f'http://api/items?start={start + 10}'}} if start + 10 < 25 else {}
+            return records[start:start + 10], links
+
+        cases = [(CursorPaginator(), cursor_pages), (OffsetPaginator(page_size=10), offset_pages),
+                 (LinkHeaderPaginator(), link_pages)]
+        for paginator, pages in cases:
+            with self.subTest(paginator=type(paginator).__name__):
+                manager, calls = self._paged_manager(pages)
+                self.assertEqual(list(manager.iter_records('http://api', 'items', paginator, {'q': 'x'})), records)
+                self.assertEqual(len(calls), 3)
+
+    def test_iter_records_processes_the_records_of_raw_pages(self):
+        """Test that records are found in the raw page and then processed, so the processor may reshape them."""
+        manager, _ = self._paged_manager(lambda url, params: ({'data': list(range(5))[params['offset']:][:2]}, {}))
+        manager.response_processor.process_response.side_effect = lambda data: [{'id': record} for record in data]
+
+        records = manager.iter_records('http://api', 'items', OffsetPaginator(page_size=2))
+
+        self.assertEqual(list(records), [{'id': record} for record in range(5)])
+
+    def test_iter_pages_prefetch_is_bounded(self):
+        """Test that pages are fetched ahead of the caller, at most `prefetch` pages, and that closing stops the fetching."""
+        manager, calls = self._paged_manager(lambda url, params: ({'data': [params['offset']]}, {}))
+        pages = manager.iter_pages('http://api', 'items', OffsetPaginator(page_size=1), prefetch=2)
+        self.assertEqual(next(pages), {'data': [0]})
+        time.sleep(0.2)
+        self.assertEqual(len(calls), 4)  # The page handed out, two queued, and one waiting for room
+        pages.close()
+        time.sleep(0.3)
+        self.assertEqual(len(calls), 4)
+
+    def test_iter_pages_raises_request_errors(self):
+        """Test that the error of a page request is raised to the caller after the pages before it."""
+        def pages(url, params):
+            if params.get('cursor') == 'b':
+                raise ValueError('failed')
+            return {'data': [1], 'next_cursor': 'b'}, {}
+
+        manager, _ = self._paged_manager(pages)
+        iterator = manager.iter_records('http://api', 'items', CursorPaginator(), {})
+        self.assertEqual(next(iterator), 1)
+        with self.assertRaises(ValueError):
+            next(iterator)
+        with self.assertRaises(ValueError):
+            list(manager.iter_pages('http://api', 'items', CursorPaginator(), prefetch=0))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,58 @@
+import unittest
+import os
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+from libraries.data.file.dataset import Dataset
+from libraries.data.file.file import File
+
+class TestDataset(unittest.TestCase):
+
+    def setUp(self):
+        """Create a dataset partitioned by month and day, with one CSV file per day."""
+        self.temp_dir = TemporaryDirectory()
+        self.dataset = Dataset(self.temp_dir.name)
+        for month, day in [(9, 30), (10, 1), (10, 2), (10, 10)]:
+            path = self.dataset.partition_path(month=month, day=day)
+            path.create()
+            File.save([['id'], [f'{month}-{day}']], [os.path.join(str(path), 'part-0.csv')])
+        open(os.path.join(self.temp_dir.name, 'month=10', '_SUCCESS'), 'w').close()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_partitions_are_discovered_in_order(self):
+        """Test that partition keys are parsed and ordered by value."""
+        self.assertEqual(self.dataset.partitions(), [
+            {'month': 9, 'day': 30}, {'month': 10, 'day': 1}, {'month': 10, 'day': 2}, {'month': 10, 'day': 10},
+        ])
+
+    def test_filters_prune_directories(self):
+        """Test that non-matching subtrees are never listed."""
+        with patch('libraries.data.file.dataset.os.scandir', wraps=os.scandir) as scandir:
+            rows = list(self.dataset.iter_rows(filters={'month': 10, 'day': range(1, 3)}))
+
+        self.assertEqual(rows, [['10-1'], ['10-2']])
+        scanned = [os.path.relpath(call.args[0], self.temp_dir.name) for call in scandir.call_args_list]
+        self.assertNotIn('month=9', scanned)
+        self.assertNotIn(os.path.join('month=10', 'day=10'), scanned)
+
+    def test_predicate_with_partition(self):
+        """Test filtering on all keys and tagging records with their partition."""
+        rows = list(self.dataset.iter_rows(predicate=lambda keys: keys['day'] >= 10, with_partition=True))
+        self.assertEqual(rows, [({'month': 9, 'day': 30}, ['9-30']), ({'month': 10, 'day': 10}, ['10-10'])])
+
+    def test_sidecar_files_are_skipped(self):
+        """Test that caches, indexes and partial writes next to a data file are not read as data."""
+        partition = str(self.dataset.partition_path(month=9, day=30))
+        File.read(os.path.join(partition, 'part-0.csv'), columnar=True, cache=True)  # Writes part-0.csv.colbin
+        for name in ('part-0.csv.idx', 'part-0.csv.offset', 'part-1.csv.tmp'):
+            open(os.path.join(partition, name), 'w').close()
+        File.save([['id'], ['standalone']], [os.path.join(partition, 'part-2.colbin')])
+
+        self.assertTrue(os.path.exists(os.path.join(partition, 'part-0.csv.colbin')))
+        self.assertEqual([os.path.basename(path) for path, _ in self.dataset.files(filters={'day': 30})],
+                         ['part-0.csv', 'part-2.colbin'])
+        self.assertEqual(list(self.dataset.iter_rows(filters={'day': 30})), [['9-30'], ('standalone',)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import os
+import random
+from operator import itemgetter
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+from libraries.data.file import external_sort
+from libraries.data.file.external_sort import ExternalSorter
+from libraries.data.file.file import File
+
+class TestExternalSorter(unittest.TestCase):
+
+    def setUp(self):
+        """Create shuffled records with duplicate keys; the second field is the input position."""
+        random.seed(7)
+        keys = [random.randrange(500) for _ in range(3000)]
+        self.records = [[key, position] for position, key in enumerate(keys)]
+
+    def test_sort_with_spilled_runs(self):
+        """Test that records spilled over many runs and merge passes come out sorted and stable."""
+        with patch.object(external_sort, '_MAX_MERGE_WIDTH', 4):
+            result = list(ExternalSorter(key=itemgetter(0), memory_limit=4096).sort(self.records))
+        self.assertEqual(result, sorted(self.records, key=itemgetter(0)))
+
+    def test_keep_first_and_last(self):
+        """Test that deduplication keeps the first or last record of each key in input order."""
+        first, last = {}, {}
+        for record in self.records:
+            first.setdefault(record[0], record)
+            last[record[0]] = record
+
+        for keep, expected in [('first', first), ('last', last)]:
+            with self.subTest(keep=keep):
+                sorter = ExternalSorter(key=itemgetter(0), keep=keep, memory_limit=4096)
+                self.assertEqual(list(sorter.sort(self.records)), [expected[key] for key in sorted(expected)])
+
+    def test_parallel_runs(self):
+        """Test that runs sorted in worker processes merge to the same result."""
+        sorter = ExternalSorter(key=itemgetter(0), keep='last', memory_limit=16384, workers=2)
+        expected = ExternalSorter(key=itemgetter(0), keep='last').sort(self.records)
+        self.assertEqual(list(sorter.sort(self.records)), list(expected))
+
+    def test_sort_file_keeps_csv_header(self):
+        """Test sorting a CSV file with its header row kept first."""
+        with TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, 'input.csv')
+            output_path = os.path.join(temp_dir, 'output.csv')
+            File.save([['name', 'age'], ['carol', '40'], ['alice', '30'], ['bob', '35'], ['alice', '31']], [input_path])
+
+            ExternalSorter(key=itemgetter(0), keep='first', memory_limit=64).sort_file(input_path, output_path)
+            with self.assertRaises(ValueError):
+                ExternalSorter().sort_file(input_path, input_path)
+
+            self.assertEqual(File.read(output_path), [['alice', '30'], ['bob', '35'], ['carol', '40']])
+            self.assertEqual(sorted(os.listdir(temp_dir)), ['input.csv', 'output.csv'])  # No run files left
+
+    def test_invalid_keep(self):
+        """Test that an unknown deduplication policy is rejected."""
+        with self.assertRaises(ValueError):
+            ExternalSorter(keep='middle')
+
+if __name__ == '__main__':
+    unittest.main()
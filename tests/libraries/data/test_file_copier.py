@@ -0,0 +1,57 @@
+import unittest
+import os
+from tempfile import TemporaryDirectory
+from libraries.data.file.file_copier import FileCopier
+
+class TestFileCopier(unittest.TestCase):
+
+    def setUp(self):
+        """Create a source file to copy."""
+        self.temp_dir = TemporaryDirectory()
+        self.source = os.path.join(self.temp_dir.name, 'source.bin')
+        with open(self.source, mode='wb') as file:
+            file.write(os.urandom(3 * 1024 * 1024 + 7))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_copy(self):
+        """Test that the copy matches the source and reports its mechanism."""
+        destination = os.path.join(self.temp_dir.name, 'destination.bin')
+        with open(destination, mode='wb') as file:
+            file.write(b'stale contents that are longer than nothing')
+
+        mechanism = FileCopier().copy(self.source, destination)
+
+        with open(self.source, mode='rb') as source_file, open(destination, mode='rb') as destination_file:
+            self.assertEqual(source_file.read(), destination_file.read())
+        self.assertIn(mechanism, {'reflink', 'copy_file_range', 'sendfile', 'buffered'})
+
+    def test_each_strategy(self):
+        """Test that every strategy, or the fallback it resorts to, copies the whole file."""
+        for strategy in ['reflink', 'copy_file_range', 'sendfile']:
+            with self.subTest(strategy=strategy):
+                destination = os.path.join(self.temp_dir.name, f'{strategy}.bin')
+                mechanism = FileCopier([strategy]).copy(self.source, destination)
+                self.assertIn(mechanism, {strategy, 'buffered'})
+                self.assertEqual(os.path.getsize(destination), os.path.getsize(self.source))
+
+    def test_hardlink(self):
+        """Test that hardlink mode replaces the destination with a link to the source."""
+        destination = os.path.join(self.temp_dir.name, 'link.bin')
+        open(destination, mode='w').close()
+        self.assertEqual(FileCopier().copy(self.source, destination, hardlink=True), 'hardlink')
+        self.assertEqual(os.stat(destination).st_ino, os.stat(self.source).st_ino)
+
+    def test_unknown_strategy(self):
+        """Test that an unknown strategy is rejected."""
+        with self.assertRaises(ValueError):
+            FileCopier(['teleport'])
+
+    def test_copy_missing_source(self):
+        """Test that copying a missing file raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            FileCopier().copy(os.path.join(self.temp_dir.name, 'missing'), os.path.join(self.temp_dir.name, 'out'))
+
+if __name__ == '__main__':
+    unittest.main()
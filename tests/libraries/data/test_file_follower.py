@@ -0,0 +1,52 @@
+import unittest
+import os
+from tempfile import TemporaryDirectory
+from libraries.data.file.file import File
+from libraries.data.file.file_follower import FileFollower
+
+class TestFileFollower(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_follow_csv(self):
+        """Test that each poll returns only the complete rows added since the last one."""
+        path = os.path.join(self.temp_dir.name, 'events.csv')
+        with open(path, mode='w', newline='') as file:
+            file.write('id,note\r\n1,a\r\n2,"multi\r\nline')
+
+        follower = File.follow(path)
+        self.assertEqual(follower.poll(), [['1', 'a']])
+        self.assertEqual(follower.poll(), [])
+
+        with open(path, mode='a', newline='') as file:
+            file.write('"\r\n3,c\r\n')
+        self.assertEqual(follower.poll(), [['2', 'multi\r\nline'], ['3', 'c']])
+
+    def test_resume_from_checkpoint(self):
+        """Test that a new follower resumes from the checkpoint of the previous one."""
+        path = os.path.join(self.temp_dir.name, 'events.jsonl')
+        File.append([{'id': 1}], path)
+        self.assertEqual(FileFollower(path).poll(), [{'id': 1}])
+
+        File.append([{'id': 2}], path)
+        with open(path, mode='a') as file:
+            file.write('{"id": ')
+        self.assertEqual(FileFollower(path).poll(), [{'id': 2}])
+        self.assertTrue(os.path.exists(f"{path}.offset"))
+
+    def test_truncated_file_is_read_again(self):
+        """Test that a file which shrank is followed from the start."""
+        path = os.path.join(self.temp_dir.name, 'events.jsonl')
+        File.append([{'id': 1}, {'id': 2}], path)
+        follower = FileFollower(path)
+        follower.poll()
+
+        File.save([{'id': 3}], [path])
+        self.assertEqual(follower.poll(), [{'id': 3}])
+
+if __name__ == '__main__':
+    unittest.main()
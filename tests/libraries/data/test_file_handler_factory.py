@@ -1,6 +1,6 @@
 import unittest
-from data.source.file.file_handler_factory import FileHandlerFactory
-from data.source.file.handlers import JSONFileHandler, CSVFileHandler
+from libraries.data.file.file_handler_factory import FileHandlerFactory
+from libraries.data.file.handlers import JSONFileHandler, CSVFileHandler, NDJSONFileHandler
 
 class TestFileHandlerFactory(unittest.TestCase):
 
@@ -18,6 +18,23 @@ class TestFileHandlerFactory(unittest.TestCase):
         handler = self.factory.get_handler('csv', 'test.csv')
         self.assertIsInstance(handler, CSVFileHandler)
 
+    def test_get_handler_ndjson(self):
+        """Test that the factory returns an NDJSONFileHandler for 'jsonl' and 'ndjson' files."""
+        self.assertIsInstance(self.factory.get_handler('jsonl', 'test.jsonl'), NDJSONFileHandler)
+        self.assertIsInstance(self.factory.get_handler('ndjson', 'test.ndjson'), NDJSONFileHandler)
+
+    def test_get_handler_compressed(self):
+        """Test that compound suffixes give the inner handler with the matching codec."""
+        self.assertEqual(FileHandlerFactory.get_file_type('dir/export.2026.csv.gz'), 'csv.gz')
+        self.assertEqual(FileHandlerFactory.get_file_type('dir/export.2026.csv'), 'csv')
+
+        handler = self.factory.get_handler('json.xz', 'test.json.xz')
+        self.assertIsInstance(handler, JSONFileHandler)
+        self.assertEqual(handler.codec.name, 'lzma')
+
+        with self.assertRaises(ValueError):
+            self.factory.get_handler('txt.gz', 'test.txt.gz')
+
     def test_get_handler_unsupported(self):
         """Test that the factory raises ValueError for unsupported file types."""
         with self.assertRaises(ValueError):
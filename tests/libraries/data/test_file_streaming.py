@@ -0,0 +1,79 @@
+import unittest
+import csv
+import os
+import threading
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+from libraries.data.file.file import File
+from libraries.data.file.handlers.csv_handler import CSVFileHandler
+
+class TestFileStreaming(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary directory for the output files."""
+        self.temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_save_stream_and_iter(self):
+        """Test that a generator is streamed to every path and read back lazily."""
+        rows = (['row', str(i)] for i in range(5000))
+        paths = [self._path('first.csv'), self._path('second.csv')]
+
+        File.save_stream(rows, paths)
+
+        for path in paths:
+            with open(path, mode='r', newline='') as file:
+                self.assertEqual(len(list(csv.reader(file))), 5000)
+        iterator = File.iter(paths[0])
+        self.assertEqual(next(iterator), ['row', '1'])  # The first row is the header
+        self.assertEqual(sum(1 for _ in iterator), 4998)
+
+    def test_save_stream_mixed_formats(self):
+        """Test that one stream is written to files of different types."""
+        rows = ([str(i), 'value'] for i in range(3000))
+
+        File.save_stream(rows, [self._path('rows.jsonl'), self._path('rows.json')])
+
+        self.assertEqual(File.read(self._path('rows.jsonl')), File.read(self._path('rows.json')))
+        self.assertEqual(sum(1 for _ in File.iter(self._path('rows.json'))), 3000)
+
+    def test_save_stream_handler_failure(self):
+        """Test that a handler failing after consuming the whole stream raises instead of hanging the others."""
+        rows = iter([['a', 'b'], ['1', '2'], ['3']])  # The ragged row fails the columnar writer only
+        errors = []
+
+        def save():
+            try:
+                File.save_stream(rows, [self._path('rows.csv'), self._path('rows.colbin')])
+            except ValueError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=save, daemon=True)
+        thread.start()
+        thread.join(10)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(errors), 1)
+        with open(self._path('rows.csv'), mode='r', newline='') as file:
+            self.assertEqual(list(csv.reader(file)), [['a', 'b'], ['1', '2'], ['3']])
+
+    def test_save_serializes_once_per_type(self):
+        """Test that repeated file types are serialized once and copied."""
+        data = [['name', 'age'], ['Alice', '30']]
+        paths = [self._path('a.csv'), self._path('b.csv'), self._path('a.csv')]
+
+        with patch('libraries.data.file.handlers.csv_handler.CSVFileHandler.save',
+                   side_effect=CSVFileHandler.save, autospec=True) as mock_save:
+            File.save(data, paths)
+
+        self.assertEqual(mock_save.call_count, 1)
+        with open(paths[1], mode='r', newline='') as file:
+            self.assertEqual(list(csv.reader(file)), data)
+
+if __name__ == '__main__':
+    unittest.main()
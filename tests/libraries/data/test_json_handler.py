@@ -0,0 +1,68 @@
+import unittest
+import json
+import os
+from tempfile import NamedTemporaryFile
+from libraries.data.file.handlers.json_handler import JSONFileHandler
+from libraries.data.file.mapped_file import MappedFile
+
+class TestJSONFileHandler(unittest.TestCase):
+
+    def setUp(self):
+        """Create an empty temporary JSON file."""
+        with NamedTemporaryFile(delete=False, suffix='.json') as temp_file:
+            self.temp_filename = temp_file.name
+        self.handler = JSONFileHandler(self.temp_filename)
+
+    def tearDown(self):
+        os.remove(self.temp_filename)
+
+    def test_save_and_read(self):
+        """Test saving and reading back a JSON document."""
+        data = {'name': 'Alice', 'scores': [1, 2.5]}
+        self.handler.save(data)
+        self.assertEqual(self.handler.read(), data)
+
+    def test_iter_rows_across_chunks(self):
+        """Test that array elements are decoded incrementally, even when split across chunks."""
+        records = [{'id': i, 'text': 'x' * (i % 5)} for i in range(200)] + [123456789, 'end']
+        with open(self.temp_filename, mode='w') as file:
+            json.dump(records, file, indent=2)
+
+        self.assertEqual(list(self.handler.iter_rows(chunk_size=7)), records)
+
+    def test_iter_rows_numbers_cut_by_chunks(self):
+        """Test that floats and exponents are decoded whole wherever a chunk boundary falls."""
+        text = '[1.5e3, 2,-0.25 ,1E-2,\n3.0e+10, 7, 12345.678, {"a": 1.5}, [2e2], 0]'
+        with open(self.temp_filename, mode='w') as file:
+            file.write(text)
+        for chunk_size in range(1, 17):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(list(self.handler.iter_rows(chunk_size=chunk_size)), json.loads(text))
+
+    def test_iter_rows_single_document(self):
+        """Test that a document that is not an array is yielded once."""
+        self.handler.save({'key': 'value'})
+        self.assertEqual(list(self.handler.iter_rows()), [{'key': 'value'}])
+
+    def test_save_iter_and_append(self):
+        """Test streaming an array to the file and appending to it."""
+        self.handler.save_iter(iter([]))
+        self.handler.append([1, 2])
+        self.handler.append(iter([{'three': 3}]))
+
+        self.assertEqual(self.handler.read(), [1, 2, {'three': 3}])
+
+    def test_append_to_non_array(self):
+        """Test that appending to a document that is not an array raises ValueError."""
+        self.handler.save({'key': 'value'})
+        with self.assertRaises(ValueError):
+            self.handler.append([1])
+
+    def test_parse_mapped(self):
+        """Test decoding a document from a memory mapping."""
+        self.handler.save([1, 2, 3])
+        with MappedFile(self.temp_filename) as mapped:
+            self.assertEqual(self.handler.parse_mapped(mapped), [1, 2, 3])
+
+if __name__ == '__main__':
+    unittest.main()
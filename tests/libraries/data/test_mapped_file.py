@@ -0,0 +1,45 @@
+import unittest
+import os
+from tempfile import NamedTemporaryFile
+from libraries.data.file.mapped_file import MappedFile
+from libraries.data.file.handlers.csv_handler import CSVFileHandler
+
+class TestMappedFile(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary CSV file to map."""
+        with NamedTemporaryFile(mode='wb', delete=False, suffix='.csv') as temp_file:
+            temp_file.write(b'name,age\r\nAlice,30\r\n"Bob\r\nJr",35\r\n')
+            self.temp_filename = temp_file.name
+
+    def tearDown(self):
+        os.remove(self.temp_filename)
+
+    def test_slice_and_lines(self):
+        """Test zero-copy slicing and line iteration."""
+        with MappedFile(self.temp_filename) as mapped:
+            self.assertEqual(bytes(mapped.slice(0, 4)), b'name')
+            lines = [bytes(line) for line in mapped.iter_lines()]
+            self.assertEqual(lines[0], b'name,age\r\n')
+            self.assertEqual(len(lines), 4)
+            del lines
+
+    def test_parse_mapped_csv(self):
+        """Test that rows parsed from the mapping match the regular read path."""
+        handler = CSVFileHandler(self.temp_filename)
+        with MappedFile(self.temp_filename) as mapped:
+            rows = handler.parse_mapped(mapped)
+        self.assertEqual(rows, handler.read())
+        self.assertEqual(rows[1], ['Bob\r\nJr', '35'])
+
+    def test_empty_file(self):
+        """Test that empty files can be mapped."""
+        with NamedTemporaryFile(delete=False) as temp_file:
+            empty_filename = temp_file.name
+        with MappedFile(empty_filename) as mapped:
+            self.assertEqual(len(mapped), 0)
+            self.assertEqual(list(mapped.iter_lines()), [])
+        os.remove(empty_filename)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import os
+from tempfile import NamedTemporaryFile
+from libraries.data.file.handlers.ndjson_handler import NDJSONFileHandler
+from libraries.data.file.mapped_file import MappedFile
+
+class TestNDJSONFileHandler(unittest.TestCase):
+
+    def setUp(self):
+        """Create an empty temporary NDJSON file."""
+        with NamedTemporaryFile(delete=False, suffix='.jsonl') as temp_file:
+            self.temp_filename = temp_file.name
+        self.handler = NDJSONFileHandler(self.temp_filename)
+
+    def tearDown(self):
+        os.remove(self.temp_filename)
+
+    def test_save_iter_and_iter_rows(self):
+        """Test streaming records to the file and reading them back one at a time."""
+        self.handler.save_iter({'id': i} for i in range(100))
+
+        with open(self.temp_filename) as file:
+            self.assertEqual(file.readline(), '{"id": 0}\n')
+        rows = self.handler.iter_rows()
+        self.assertEqual(next(rows), {'id': 0})
+        self.assertEqual(len(list(rows)), 99)
+
+    def test_append(self):
+        """Test that appended records follow the existing ones."""
+        self.handler.save([{'id': 1}])
+        self.handler.append([{'id': 2}, {'id': 3}])
+        self.assertEqual(self.handler.read(), [{'id': 1}, {'id': 2}, {'id': 3}])
+
+    def test_append_after_unterminated_line(self):
+        """Test that appending to a file without a final newline starts a new line."""
+        with open(self.temp_filename, mode='w') as file:
+            file.write('{"a":1}')
+        self.handler.append([{'b': 2}])
+        with self.handler.open_writer() as writer:
+            writer.write({'c': 3})
+        self.assertEqual(self.handler.read(), [{'a': 1}, {'b': 2}, {'c': 3}])
+
+    def test_parse_mapped_skips_blank_lines(self):
+        """Test decoding records from a memory mapping."""
+        with open(self.temp_filename, mode='w') as file:
+            file.write('{"id": 1}\n\n[2]\n')
+        with MappedFile(self.temp_filename) as mapped:
+            self.assertEqual(self.handler.parse_mapped(mapped), [{'id': 1}, [2]])
+
+if __name__ == '__main__':
+    unittest.main()
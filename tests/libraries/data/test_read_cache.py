@@ -0,0 +1,70 @@
+import unittest
+import os
+from tempfile import TemporaryDirectory
+from unittest.mock import Mock
+from libraries.data.file.file import File
+from libraries.data.file.read_cache import ReadCache
+
+class TestReadCache(unittest.TestCase):
+
+    def setUp(self):
+        """Create files of known sizes."""
+        self.temp_dir = TemporaryDirectory()
+        self.paths = []
+        for name in ('a', 'b', 'c'):
+            path = os.path.join(self.temp_dir.name, f'{name}.jsonl')
+            with open(path, mode='w') as file:
+                file.write(f'{{"name": "{name}"}}\n')  # 14 bytes
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        File.disable_read_cache()
+
+    def test_hit_and_revalidation(self):
+        """Test that unchanged files are served from the cache and changed ones reloaded."""
+        cache = ReadCache(max_bytes=1024)
+        load = Mock(side_effect=['first', 'second'])
+
+        self.assertEqual(cache.get(self.paths[0], None, load), 'first')
+        self.assertEqual(cache.get(self.paths[0], None, load), 'first')
+        with open(self.paths[0], mode='a') as file:
+            file.write('\n')
+        self.assertEqual(cache.get(self.paths[0], None, load), 'second')
+
+        self.assertEqual(load.call_count, 2)
+        self.assertEqual(cache.metrics['hits'], 1)
+        self.assertEqual(cache.metrics['misses'], 2)
+        self.assertEqual(cache.metrics['entries'], 1)
+
+    def test_options_are_part_of_the_key(self):
+        """Test that different read options are cached separately."""
+        cache = ReadCache(max_bytes=1024)
+        cache.get(self.paths[0], 'rows', lambda: 'rows')
+        self.assertEqual(cache.get(self.paths[0], 'columns', lambda: 'columns'), 'columns')
+
+    def test_lru_eviction_by_bytes(self):
+        """Test that the least recently used entries are evicted beyond the byte budget."""
+        cache = ReadCache(max_bytes=40)
+        cache.get(self.paths[0], None, lambda: 'a')
+        cache.get(self.paths[1], None, lambda: 'b')
+        cache.get(self.paths[0], None, lambda: 'a')  # 'b' is now least recently used
+        cache.get(self.paths[2], None, lambda: 'c')
+
+        self.assertEqual(cache.metrics['evictions'], 1)
+        self.assertEqual(cache.metrics['bytes'], 28)
+        load = Mock(return_value='b')
+        cache.get(self.paths[1], None, load)
+        load.assert_called_once()
+
+    def test_file_read_through_cache(self):
+        """Test that File.read goes through the cache once enabled."""
+        cache = File.enable_read_cache(max_bytes=1024)
+        first = File.read(self.paths[0])
+        second = File.read(self.paths[0])
+
+        self.assertIs(first, second)
+        self.assertEqual(cache.metrics['hits'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
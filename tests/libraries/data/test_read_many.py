@@ -0,0 +1,43 @@
+import unittest
+import os
+from tempfile import TemporaryDirectory
+from libraries.data.file.file import File
+
+class TestReadMany(unittest.TestCase):
+
+    def setUp(self):
+        """Create a handful of small NDJSON files."""
+        self.temp_dir = TemporaryDirectory()
+        self.paths = []
+        for i in range(20):
+            path = os.path.join(self.temp_dir.name, f'part-{i}.jsonl')
+            with open(path, mode='w') as file:
+                file.write(f'{{"part": {i}}}\n')
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_ordered_results(self):
+        """Test that results follow the input order."""
+        results = list(File.read_many(self.paths, max_workers=4))
+        self.assertEqual([result.path for result in results], self.paths)
+        self.assertEqual([result.data for result in results], [[{'part': i}] for i in range(20)])
+
+    def test_errors_are_collected(self):
+        """Test that a failed read is reported without stopping the batch."""
+        missing = os.path.join(self.temp_dir.name, 'missing.jsonl')
+        results = list(File.read_many([self.paths[0], missing, self.paths[1]], ordered=False))
+
+        errors = {result.path: result.error for result in results}
+        self.assertEqual(len(results), 3)
+        self.assertIsInstance(errors[missing], FileNotFoundError)
+        self.assertIsNone(errors[self.paths[1]])
+
+    def test_in_flight_byte_limit(self):
+        """Test that a byte limit smaller than any file still reads every file."""
+        results = list(File.read_many(self.paths, max_workers=4, max_in_flight_bytes=1))
+        self.assertEqual([result.path for result in results], self.paths)
+
+if __name__ == '__main__':
+    unittest.main()
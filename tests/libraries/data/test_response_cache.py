@@ -0,0 +1,161 @@
+import json
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest.mock import Mock, patch
+from requests.structures import CaseInsensitiveDict
+from libraries.data.api.auth_strategies import ManualTokenAuth
+from libraries.data.api.data_api_manager import DataAPIManager
+from libraries.data.api.data_api_response_processors.json_response_processor import JSONResponseProcessor
+from libraries.data.api.response_cache import ResponseCache
+
+def _response(status_code=200, body=None, **headers):
+    """Builds a fake response with the given status, JSON body and headers (underscores for dashes)."""
+    content = b'' if body is None else json.dumps(body).encode()
+    return Mock(status_code=status_code, content=content, json=Mock(return_value=body),
+                headers=CaseInsensitiveDict({name.replace('_', '-'): value for name, value in headers.items()}))
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a processor that records its calls."""
+        self.process = Mock(side_effect=lambda response: response.json())
+
+    def test_fresh_responses_are_served_without_requests(self):
+        """Test that a response is reused while its max-age lasts, and counted as a hit."""
+        cache = ResponseCache()
+        fetch = Mock(return_value=_response(body={'a': 1}, Cache_Control='public, max-age=60'))
+
+        self.assertEqual(cache.get('http://api/a', fetch, self.process), {'a': 1})
+        self.assertEqual(cache.get('http://api/a', fetch, self.process), {'a': 1})
+
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(self.process.call_count, 1)
+        self.assertEqual(cache.metrics['hits'], 1)
+        self.assertEqual(cache.metrics['bytes_saved'], len(b'{"a": 1}'))
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_stale_responses_are_revalidated(self):
+        """Test that stale responses are revalidated with their validators and reused on a 304."""
+        cache = ResponseCache()
+        fetch = Mock(side_effect=[
+            _response(body={'a': 1}, ETag='"v1"', Last_Modified='Mon, 01 Jan 2024 00:00:00 GMT'),
+            _response(304, Cache_Control='max-age=60'),
+        ])
+
+        self.assertEqual(cache.get('http://api/a', fetch, self.process), {'a': 1})
+        self.assertEqual(cache.get('http://api/a', fetch, self.process), {'a': 1})
+        self.assertEqual(cache.get('http://api/a', fetch, self.process), {'a': 1})  # Fresh after the 304
+
+        self.assertEqual(fetch.call_args_list[1].args[0], {'If-None-Match': '"v1"',
+                                                           'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(self.process.call_count, 1)
+        self.assertEqual({name: cache.metrics[name] for name in ('hits', 'revalidated', 'misses')},
+                         {'hits': 1, 'revalidated': 1, 'misses': 1})
+
+    def test_no_store_and_no_cache(self):
+        """Test that no-store responses are never cached and no-cache ones always revalidated."""
+        cache = ResponseCache()
+        no_store = Mock(return_value=_response(body=1, Cache_Control='no-store', ETag='"x"'))
+        no_cache = Mock(side_effect=[_response(body=2, Cache_Control='no-cache, max-age=60', ETag='"y"'),
+                                     _response(304), _response(304)])
+
+        for _ in range(2):
+            cache.get('http://api/no-store', no_store, self.process)
+            cache.get('http://api/no-cache', no_cache, self.process)
+
+        self.assertEqual(no_store.call_args_list[1].args[0], {})
+        self.assertEqual(no_cache.call_count, 2)
+        self.assertEqual(no_cache.call_args_list[1].args[0], {'If-None-Match': '"y"'})
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """Test that the memory tier evicts the least recently used responses beyond its budget."""
+        cache = ResponseCache(max_bytes=20)
+        for key in ('a', 'b', 'a', 'c'):  # 8 bytes each
+            cache.get(key, Mock(return_value=_response(body={key: 1}, Cache_Control='max-age=60')), self.process)
+
+        self.assertEqual(cache.metrics['evictions'], 1)
+        self.assertEqual(cache.metrics['entries'], 2)
+        fetch = Mock(return_value=_response(body={'b': 2}))
+        self.assertEqual(cache.get('b', fetch, self.process), {'b': 2})
+        self.assertEqual(fetch.call_count, 1)
+
+    def test_disk_tier_outlives_the_process_cache(self):
+        """Test that responses stored on disk are served by a new cache on the same directory."""
+        with TemporaryDirectory() as temp_dir:
+            ResponseCache(directory=temp_dir).get(
+                'http://api/a', Mock(return_value=_response(body=[1, 2], Cache_Control='max-age=60')), self.process)
+            cache = ResponseCache(directory=temp_dir)
+            fetch = Mock()
+
+            self.assertEqual(cache.get('http://api/a', fetch, self.process), [1, 2])
+            fetch.assert_not_called()
+            cache.clear()
+            self.assertEqual(cache.metrics['entries'], 0)
+            self.assertEqual(cache.get('http://api/a', Mock(return_value=_response(body=[3])), self.process), [3])
+
+    def test_private_responses_stay_in_memory(self):
+        """Test that responses marked private are cached in memory but never written to the disk tier."""
+        with TemporaryDirectory() as temp_dir:
+            cache = ResponseCache(directory=temp_dir)
+            fetch = Mock(return_value=_response(body={'a': 1}, Cache_Control='private, max-age=60'))
+            cache.get('http://api/me', fetch, self.process)
+            cache.get('http://api/me', fetch, self.process)
+
+            self.assertEqual(fetch.call_count, 1)
+            self.assertEqual(os.listdir(temp_dir), [])
+
+    def test_disk_tier_failures_are_misses(self):
+        """Test that unreadable disk entries are misses, and that unwritable values or disks stay in memory."""
+        fresh = {'Cache_Control': 'max-age=60'}
+        with TemporaryDirectory() as temp_dir:
+            cache = ResponseCache(directory=temp_dir)
+            stale_layout = '{"value": 1, "etag": null, "last_modified": null, "expires": "later", "size": 1}'
+            for content in ('not json', '{"value": 1}', '[1, 2]', stale_layout):
+                with open(cache._disk_path('http://api/a'), mode='w') as file:
+                    file.write(content)
+                self.assertEqual(cache.get('http://api/a', Mock(return_value=_response(body=[3])), self.process), [3])
+
+            fetch_set = Mock(return_value=_response(body=[1], **fresh))
+            self.assertEqual(cache.get('http://api/set', fetch_set, lambda response: {1}), {1})
+            with patch('builtins.open', side_effect=OSError('read-only')):
+                fetch_b = Mock(return_value=_response(body=[4], **fresh))
+                self.assertEqual(cache.get('http://api/b', fetch_b, self.process), [4])
+            fetch = Mock()
+            self.assertEqual(cache.get('http://api/set', fetch, self.process), {1})
+            self.assertEqual(cache.get('http://api/b', fetch, self.process), [4])
+            fetch.assert_not_called()
+            self.assertFalse(os.path.exists(cache._disk_path('http://api/set')))
+
+    @patch('requests.Session.get')
+    def test_fetch_data_caches_per_token(self, mock_get):
+        """Test that managers with different tokens sharing a cache do not see each other's responses."""
+        mock_get.side_effect = lambda url, headers, **kwargs: _response(body=headers['Authorization'],
+                                                                        Cache_Control='max-age=60')
+        cache = ResponseCache()
+        alice = DataAPIManager(ManualTokenAuth('alice'), JSONResponseProcessor(), cache=cache)
+        bob = DataAPIManager(ManualTokenAuth('bob'), JSONResponseProcessor(), cache=cache)
+
+        self.assertEqual(alice.fetch_data('http://api', 'me'), 'Bearer alice')
+        self.assertEqual(bob.fetch_data('http://api', 'me'), 'Bearer bob')
+        self.assertEqual(alice.fetch_data('http://api', 'me'), 'Bearer alice')
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_fetch_data_uses_the_cache(self, mock_get):
+        """Test that fetch_data caches responses per URL and query parameters."""
+        mock_get.side_effect = [_response(body={'page': 1}, Cache_Control='max-age=60'),
+                                _response(body={'page': 2}, Cache_Control='max-age=60')]
+        manager = DataAPIManager(ManualTokenAuth('token'), JSONResponseProcessor(), cache=ResponseCache())
+
+        self.assertEqual(manager.fetch_data('http://api', 'items', {'page': 1}), {'page': 1})
+        self.assertEqual(manager.fetch_data('http://api', 'items', {'page': 2}), {'page': 2})
+        self.assertEqual(manager.fetch_data('http://api', 'items', {'page': 1}), {'page': 1})
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_get.call_args_list[0].kwargs['headers'], {'Authorization': 'Bearer token'})
+        self.assertEqual(manager.cache.metrics['hits'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import csv
+import os
+from tempfile import TemporaryDirectory
+from libraries.data.file.row_index import RowIndex
+from libraries.data.file.handlers.csv_handler import CSVFileHandler
+
+class TestRowIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Create a CSV file with a multi-line quoted field."""
+        self.temp_dir = TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, 'rows.csv')
+        self.rows = [[str(i), 'multi\nline' if i == 3 else 'value'] for i in range(25)]
+        with open(self.filename, mode='w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['id', 'text'])
+            writer.writerows(self.rows)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_build(self):
+        """Test that the index counts rows and records every stride-th offset."""
+        index = RowIndex.build(self.filename, stride=10)
+        self.assertEqual(index.row_count, 25)
+        self.assertEqual(len(index.offsets), 3)
+
+    def test_sidecar_is_reused_and_invalidated(self):
+        """Test that the sidecar file is reused until the CSV file changes."""
+        RowIndex.for_file(self.filename, stride=10)
+        self.assertTrue(os.path.exists(RowIndex.sidecar_path(self.filename)))
+        self.assertEqual(RowIndex.for_file(self.filename).stride, 10)
+
+        with open(self.filename, mode='a', newline='') as file:
+            csv.writer(file).writerow(['25', 'value'])
+        self.assertEqual(RowIndex.for_file(self.filename, stride=10).row_count, 26)
+
+    def test_read_rows(self):
+        """Test reading slices of rows through the index."""
+        RowIndex.for_file(self.filename, stride=4)
+        handler = CSVFileHandler(self.filename)
+
+        self.assertEqual(handler.row_count(), 25)
+        self.assertEqual(handler.read_rows(2, 9), self.rows[2:9])
+        self.assertEqual(handler.read_rows(20, 40), self.rows[20:])
+        self.assertEqual(handler.read_rows(30, 40), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import os
+from tempfile import TemporaryDirectory
+from libraries.data.file.file import File
+from libraries.data.file.sharded_writer import ShardedWriter
+from libraries.path_builder.path_builder import PathBuilder
+
+class TestShardedWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def shard_path(self, row):
+        return PathBuilder(self.temp_dir.name, f'customer={row[0]}').add('orders.csv')
+
+    def test_records_survive_eviction(self):
+        """Test that shards closed by the LRU pool are reopened in append mode."""
+        rows = [[str(i % 10), str(i)] for i in range(100)]
+        with ShardedWriter(self.shard_path, max_open_files=3, max_buffered_records=7, header=['customer', 'order']) as writer:
+            writer.write_all(rows)
+            metrics = writer.metrics
+
+        self.assertEqual(metrics['shards'], 10)
+        self.assertLessEqual(metrics['open'], 3)
+        self.assertGreater(metrics['evictions'], 0)
+        for customer in range(10):
+            path = str(self.shard_path([customer]))
+            with open(path) as file:
+                self.assertEqual(file.readline().strip(), 'customer,order')
+            self.assertEqual(File.read(path), [row for row in rows if row[0] == str(customer)])
+
+    def test_overwrite_replaces_existing_shards_once(self):
+        """Test that existing shards are replaced on first use, then appended to."""
+        path = os.path.join(self.temp_dir.name, 'events.jsonl')
+        File.save([{'id': 0}], [path])
+
+        with ShardedWriter(lambda record: path, max_open_files=1, overwrite=True) as writer:
+            writer.write({'id': 1})
+            writer.close()  # Forces a reopen
+            writer.write({'id': 2})
+
+        self.assertEqual(File.read(path), [{'id': 1}, {'id': 2}])
+
+if __name__ == '__main__':
+    unittest.main()
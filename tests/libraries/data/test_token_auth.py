@@ -1,6 +1,6 @@
 import unittest
 from unittest.mock import patch
-from data.source.api.auth_strategies import ManualTokenAuth, EndpointTokenAuth
+from libraries.data.api.auth_strategies import ManualTokenAuth, EndpointTokenAuth
 
 class TestManualTokenAuth(unittest.TestCase):
 